@@ -0,0 +1,108 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Artifact mount-time benchmark.
+
+Compares the :meth:`project.Package.install <forml.project.Package.install>` timings of a synthetic
+package (containing a data file so that it is not zip-safe) in the following modes:
+
+* *extract (cold)* - fresh installation extracting the archive
+* *lazy (cold)* - fresh installation of the archive for the lazy zip-import
+* *stamp (warm)* - repeated installation served from the existing (digest-stamped) installation
+  (including the package digest calculation)
+
+Usage::
+
+    python benchmarks/mount.py --modules 4000 --data 8388608 --repeat 5
+"""
+import argparse
+import os
+import pathlib
+import shutil
+import tempfile
+import time
+import typing
+
+from forml import project
+
+
+def build(root: pathlib.Path, modules: int, data: int) -> project.Package:
+    """Create the synthetic package.
+
+    Args:
+        root: Working directory.
+        modules: Number of python modules to include.
+        data: Size of the (incompressible) data file to include in bytes.
+
+    Returns:
+        Package instance.
+    """
+    source = root / 'source'
+    package = source / 'bench'
+    package.mkdir(parents=True)
+    (package / '__init__.py').touch()
+    for index in range(modules):
+        (package / f'mod{index}.py').write_text(f'VALUE = {index}\n')
+    (package / 'data.bin').write_bytes(os.urandom(data))
+    manifest = project.Manifest('bench', '1.0', 'bench')
+    return project.Package.create(source, manifest, root / f'bench.{project.Package.FORMAT}')
+
+
+def measure(action: typing.Callable[[int], None], repeat: int) -> float:
+    """Measure the minimal duration of the given action.
+
+    Args:
+        action: Callable receiving the run index.
+        repeat: Number of runs.
+
+    Returns:
+        Minimal duration in milliseconds.
+    """
+    durations = []
+    for run in range(repeat):
+        start = time.perf_counter()
+        action(run)
+        durations.append(time.perf_counter() - start)
+    return min(durations) * 1000
+
+
+def main() -> None:
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', 1)[0].strip())
+    parser.add_argument('--modules', type=int, default=4000, help='number of package modules')
+    parser.add_argument('--data', type=int, default=8 << 20, help='data file size in bytes')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs per mode')
+    args = parser.parse_args()
+    root = pathlib.Path(tempfile.mkdtemp(prefix='forml-bench-'))
+    try:
+        package = build(root, args.modules, args.data)
+        print(f'Package: {package.path.stat().st_size / (1 << 20):.1f} MB, {args.modules + 2} members')
+        results = {
+            'extract (cold)': measure(lambda r: package.install(root / f'extract-{r}'), args.repeat),
+            'lazy (cold)': measure(lambda r: package.install(root / f'lazy-{r}', lazy=True), args.repeat),
+            # fresh instance for each run to include the digest calculation
+            'stamp (warm)': measure(lambda _: project.Package(package.path).install(root / 'extract-0'), args.repeat),
+        }
+        for mode, duration in results.items():
+            print(f'{mode:<16}{duration:>8.1f} ms')
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
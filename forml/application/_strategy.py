@@ -19,13 +19,14 @@
 ForML application model rollout strategy.
 """
 import abc
+import asyncio
 import collections
 import dataclasses
 import functools
 import logging
 import threading
-import time
 import typing
+from concurrent import futures
 
 from forml.io import asset as assetmod
 
@@ -104,6 +105,29 @@ class Latest(Selector):
     DEFAULT_REFRESH = 30
     """Default refresh interval in seconds"""
 
+    class Refresher:
+        """Shared background event loop running the periodic refreshes of all the selectors
+        concurrently."""
+
+        _loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        _lock: threading.Lock = threading.Lock()
+
+        @classmethod
+        def submit(cls, refresh: typing.Coroutine) -> futures.Future:
+            """Schedule the given refresh coroutine (starting the loop upon first use).
+
+            Args:
+                refresh: Refresh coroutine to be scheduled.
+
+            Returns:
+                Future of the scheduled coroutine.
+            """
+            with cls._lock:
+                if not cls._loop:
+                    cls._loop = asyncio.new_event_loop()
+                    threading.Thread(target=cls._loop.run_forever, name='latest-refresher', daemon=True).start()
+            return asyncio.run_coroutine_threadsafe(refresh, cls._loop)
+
     def __init__(
         self,
         project: typing.Union[str, 'asset.Project.Key'],
@@ -115,32 +139,76 @@ class Latest(Selector):
         self._interval: float = refresh
         self._cache: dict['asset.Directory', 'asset.Instance'] = {}
         self._lock: threading.RLock = threading.RLock()
-        self._refresher: threading.Thread = threading.Thread(target=self._refresh, daemon=True)
+        self._refresher: typing.Optional[futures.Future] = None
 
     def __reduce__(self):
         return self.__class__, (self._project, self._release, self._interval)
 
-    def _refresh(self) -> None:
+    async def _refresh(self) -> None:
         while True:
+            await asyncio.sleep(self._interval)
             with self._lock:
                 instances = tuple(self._cache.items())
             LOGGER.debug('Refreshing %d cached instances', len(instances))
-            for registry, old in instances:
-                new = self._pick(registry)
-                if new != old:
+            picks = await asyncio.gather(*(self._apick(r) for r, _ in instances), return_exceptions=True)
+            for (registry, old), new in zip(instances, picks):
+                if isinstance(new, Exception):
+                    LOGGER.warning('Failed refreshing latest instance of %s: %s', registry, new)
+                elif new != old:
                     LOGGER.info('Updating latest instance to %s', new)
                     with self._lock:
                         self._cache[registry] = new
-            time.sleep(self._interval)
+
+    async def _apick(self, registry: 'asset.Directory') -> 'asset.Instance':
+        """Asynchronous version of the latest instance lookup using concurrent registry access.
+
+        Args:
+            registry: Model registry to select from.
+
+        Returns:
+            Latest model instance.
+        """
+        listings = ()
+        if not self._release:
+            aio = registry.registry.aio
+            project = assetmod.Project.Key(self._project)
+            releases = sorted({assetmod.Release.Key(r) for r in await aio.releases(project)}, reverse=True)
+            generations = await asyncio.gather(*(aio.generations(project, r) for r in releases))
+            listings = zip(
+                releases, (assetmod.Generation.Listing(assetmod.Generation.Key(g) for g in k) for k in generations)
+            )
+        return self._latest(registry, listings)
 
     def _pick(self, registry: 'asset.Directory') -> 'asset.Instance':
+        def listings() -> typing.Iterator[tuple['asset.Release.Key', 'asset.Level.Listing']]:
+            """Lazy listing of the project releases generations from the most recent one."""
+            project = registry.get(self._project)
+            for release in reversed(project.list()):
+                yield release, project.get(release).list()
+
+        return self._latest(registry, () if self._release else listings())
+
+    def _latest(
+        self,
+        registry: 'asset.Directory',
+        listings: typing.Iterable[tuple['asset.Release.Key', 'asset.Level.Listing']],
+    ) -> 'asset.Instance':
+        """Selection logic shared by both the synchronous and the asynchronous lookups.
+
+        Args:
+            registry: Model registry to select from.
+            listings: Generation listings of the project releases ordered from the most recent one
+                      (ignored if the release is explicit).
+
+        Returns:
+            Latest model instance.
+        """
         release = self._release
         generation = None
         if not release:
-            project = registry.get(self._project)
-            for release in reversed(project.list()):
+            for release, generations in listings:
                 try:
-                    generation = project.get(release).list().last
+                    generation = generations.last
                 except assetmod.Level.Listing.Empty:
                     continue
                 break
@@ -157,8 +225,8 @@ class Latest(Selector):
         with self._lock:
             if registry not in self._cache:
                 self._cache[registry] = self._pick(registry)
-                if not self._refresher.is_alive():
-                    self._refresher.start()
+                if not self._refresher:
+                    self._refresher = self.Refresher.submit(self._refresh())
             return self._cache[registry]
 
 
@@ -19,8 +19,25 @@ ForML evaluation.
 """
 
 from ._api import Method, Metric, Outcome
-from ._method import CrossVal, HoldOut
-from ._metric import Function
+from ._method import CrossVal, HoldOut, WalkForward
+from ._metric import Bootstrap, ConfusionScore, Estimate, Function, Incremental, LogLoss, RocAuc, SquaredError
 from ._stage import PerfTrackScore, TrainTestScore
 
-__all__ = ['CrossVal', 'Function', 'HoldOut', 'Method', 'Metric', 'Outcome', 'PerfTrackScore', 'TrainTestScore']
+__all__ = [
+    'Bootstrap',
+    'ConfusionScore',
+    'CrossVal',
+    'Estimate',
+    'Function',
+    'HoldOut',
+    'Incremental',
+    'LogLoss',
+    'Method',
+    'Metric',
+    'Outcome',
+    'PerfTrackScore',
+    'RocAuc',
+    'SquaredError',
+    'TrainTestScore',
+    'WalkForward',
+]
@@ -18,8 +18,12 @@
 """
 Evaluation method implementations.
 """
+import collections
+import logging
+import operator
 import typing
 
+import numpy
 from sklearn import model_selection
 
 from forml import flow
@@ -29,8 +33,51 @@ from . import _api
 
 if typing.TYPE_CHECKING:
     from forml import evaluation
+    from forml.io import dsl
     from forml.pipeline import payload  # pylint: disable=reimported
 
+LOGGER = logging.getLogger(__name__)
+
+
+class Profile(flow.Visitor):
+    """Visitor collecting the worker groups of the visited segment.
+
+    Attributes:
+        groups: Set of the visited worker group IDs.
+        stateful: Flag indicating any of the visited workers is stateful.
+    """
+
+    def __init__(self):
+        self.groups: set = set()
+        self.stateful: bool = False
+        self.trained: list[flow.Worker] = []
+
+    def visit_node(self, node: 'flow.Node') -> None:
+        if isinstance(node, flow.Worker):
+            self.groups.add(node.gid)
+            self.stateful |= node.stateful
+            if node.trained:
+                self.trained.append(node)
+
+    @classmethod
+    def hoistable(cls, trunk: flow.Trunk) -> bool:
+        """Check the given trunk can be hoisted above the fold splitting.
+
+        That requires the trunk to contain no stateful workers, no workers on its label segment and
+        to be *mode-invariant* - engaging the same worker groups in both the train and apply modes.
+
+        Args:
+            trunk: Expanded trunk to be checked.
+
+        Returns:
+            True if hoistable.
+        """
+        apply, train, label = cls(), cls(), cls()
+        trunk.apply.accept(apply)
+        trunk.train.accept(train)
+        trunk.label.accept(label)
+        return not (apply.stateful or train.stateful or label.groups) and apply.groups == train.groups
+
 
 class CrossVal(_api.Method):
     """Evaluation method based on a number of independent train-test trials using different parts of
@@ -50,6 +97,13 @@ class CrossVal(_api.Method):
                   2. Actor builder instance defining the folding splitter.
         nsplits: The number of splits the splitter is going to generate (needs to be explicit as
                  there is no generic way to infer it from the Builder).
+        hoist: Compose the leading *stateless* part of the pipeline just once on the entire dataset
+               (above the fold splitting) and replicate only the remaining part for each fold.
+               Only operators with no stateful actors, not touching the labels and applying the
+               same actors in both the train and apply modes are hoisted.
+        coschedule: Hint the runner to co-schedule the fold branches within a single process using
+                    a shared-memory thread pool (avoiding serialization of the fold payloads
+                    between the workers - see :func:`flow.fuse <forml.flow.fuse>`).
 
     Examples:
         >>> CROSSVAL = evaluation.CrossVal(
@@ -65,6 +119,8 @@ class CrossVal(_api.Method):
         *,
         crossvalidator: 'payload.CrossValidable',
         splitter: 'type[payload.CVFoldable]' = paymod.PandasCVFolds,
+        hoist: bool = False,
+        coschedule: bool = False,
     ):
         """Constructor based on a splitter supplied in form of a cross-validator and a folding
         actor type.
@@ -74,19 +130,32 @@ class CrossVal(_api.Method):
             splitter: Folding actor type that is expected to take the *cross-validator* is its
                       parameter. Defaults to :class:`payload.PandasCVFolds
                       <forml.pipeline.payload.PandasCVFolds>`.
+            hoist: Compose the leading stateless part of the pipeline above the fold splitting.
+            coschedule: Hint the runner to co-schedule the fold branches within a single process.
         """
 
     @typing.overload
-    def __init__(self, *, splitter: 'flow.Builder[payload.CVFoldable]', nsplits: int):
+    def __init__(
+        self,
+        *,
+        splitter: 'flow.Builder[payload.CVFoldable]',
+        nsplits: int,
+        hoist: bool = False,
+        coschedule: bool = False,
+    ):
         """Constructor based on a ``splitter`` supplied in form of an actor *builder* instance.
 
         Args:
             splitter: Actor builder instance defining the folding splitter.
             nsplits: Number of splits the splitter is going to generate (needs to be explicit as
                      there is no generic way to infer it from the Builder).
+            hoist: Compose the leading stateless part of the pipeline above the fold splitting.
+            coschedule: Hint the runner to co-schedule the fold branches within a single process.
         """
 
-    def __init__(self, *, crossvalidator=None, splitter=paymod.PandasCVFolds, nsplits=None):
+    def __init__(
+        self, *, crossvalidator=None, splitter=paymod.PandasCVFolds, nsplits=None, hoist=False, coschedule=False
+    ):
         if ((crossvalidator is None) ^ (nsplits is not None)) or (
             (crossvalidator is None) ^ isinstance(splitter, flow.Builder)
         ):
@@ -96,13 +165,47 @@ class CrossVal(_api.Method):
             nsplits = crossvalidator.get_n_splits()
         if nsplits < 2:
             raise ValueError('At least 2 splits required')
+        if coschedule:  # each fold is represented by a pair of consecutive splitter ports
+            splitter = splitter.hint(coschedule=2)
         self._nsplits: int = nsplits
         self._splitter: flow.Builder['payload.CVFoldable'] = splitter
+        self._hoist: bool = hoist
+
+    @staticmethod
+    def _hoist_prefix(
+        pipeline: flow.Composable, features: flow.Publishable
+    ) -> typing.Optional[tuple[flow.Publishable, typing.Optional[flow.Composable]]]:
+        """Compose the leading hoistable terms of the pipeline on top of the given features.
+
+        The pipeline gets split at the boundary of the hoistable terms retaining its original
+        composition structure on both sides (the remainder composes with an origin in place of the
+        hoisted part).
+
+        Args:
+            pipeline: Pipeline to be split.
+            features: Source port producing the historical features.
+
+        Returns:
+            Tuple of the publisher of the (preprocessed) features and the remaining pipeline (None
+            if the entire pipeline got hoisted) or None if there is nothing to be hoisted.
+        """
+        terms = pipeline.terms
+        count = next((i for i, t in enumerate(terms) if not Profile.hoistable(t.expand())), len(terms))
+        if not count:
+            return None
+        LOGGER.debug('Hoisting %d stateless pipeline terms above the folds', count)
+        prefix, remainder = pipeline.split(count)
+        trunk = prefix.expand()
+        trunk.apply.subscribe(features)
+        return trunk.apply.publisher, remainder if count < len(terms) else None
 
     def produce(
         self, pipeline: flow.Composable, features: flow.Publishable, labels: flow.Publishable
     ) -> typing.Iterable['evaluation.Outcome']:
-        splitter = flow.Worker(self._splitter, 1, 2 * self._nsplits)
+        remainder: typing.Optional[flow.Composable] = pipeline
+        if self._hoist and (hoisted := self._hoist_prefix(pipeline, features)):
+            features, remainder = hoisted
+        splitter = flow.Worker(self._select(remainder), 1, 2 * self._nsplits)
         splitter.train(features, labels)
 
         features_splitter: flow.Worker = splitter.fork()
@@ -111,14 +214,40 @@ class CrossVal(_api.Method):
         labels_splitter[0].subscribe(labels)
 
         outcomes = []
+        folds = []
         for fid in range(self._nsplits):
-            fold: flow.Trunk = pipeline.expand()
+            if remainder is None:  # entire pipeline hoisted
+                outcomes.append(
+                    _api.Outcome(labels_splitter[2 * fid + 1].publisher, features_splitter[2 * fid + 1].publisher)
+                )
+                continue
+            fold: flow.Trunk = remainder.expand()
             fold.train.subscribe(features_splitter[2 * fid])
             fold.label.subscribe(labels_splitter[2 * fid])
             fold.apply.subscribe(features_splitter[2 * fid + 1])
             outcomes.append(_api.Outcome(labels_splitter[2 * fid + 1].publisher, fold.apply.publisher))
+            folds.append(fold)
+        self._link(folds)
         return tuple(outcomes)
 
+    def _select(self, pipeline: typing.Optional[flow.Composable]) -> flow.Builder['payload.CVFoldable']:
+        """Hook for selecting the splitter to be used for the given pipeline.
+
+        Args:
+            pipeline: Pipeline to be split (None if entirely hoisted).
+
+        Returns:
+            Splitter actor builder.
+        """
+        return self._splitter
+
+    def _link(self, folds: typing.Sequence[flow.Trunk]) -> None:
+        """Hook for linking the expanded (and subscribed) fold pipelines.
+
+        Args:
+            folds: Fold pipelines in the order of the splits.
+        """
+
 
 class HoldOut(CrossVal):
     """Evaluation method based on part of a training dataset being withheld for testing the
@@ -148,6 +277,8 @@ class HoldOut(CrossVal):
                      parameter. Defaults to :class:`payload.PandasCVFolds
                      <forml.pipeline.payload.PandasCVFolds>`.
                   2. Actor builder instance defining the train-test splitter.
+        hoist: Compose the leading stateless part of the pipeline just once above the train-test
+               splitting (see :class:`evaluation.CrossVal <forml.evaluation.CrossVal>`).
 
     Examples:
         >>> HOLDOUT = evaluation.HoldOut(test_size=0.2, stratify=True, random_state=42)
@@ -162,6 +293,7 @@ class HoldOut(CrossVal):
         random_state: typing.Optional[int] = None,
         stratify: bool = False,
         splitter: 'type[payload.CVFoldable]' = paymod.PandasCVFolds,
+        hoist: bool = False,
     ):
         """Constructor based explicit ``test_size``/``train_size`` specifications that will be used
         to setup a :class:`StratifiedShuffleSplit
@@ -181,6 +313,7 @@ class HoldOut(CrossVal):
             splitter: Folding actor type that is expected to take a *cross-validator* is its
                       parameter. Defaults to :class:`payload.PandasCVFolds
                       <forml.pipeline.payload.PandasCVFolds>`.
+            hoist: Compose the leading stateless part of the pipeline above the splitting.
         """
 
     @typing.overload
@@ -189,6 +322,7 @@ class HoldOut(CrossVal):
         *,
         crossvalidator: 'payload.CrossValidable',
         splitter: 'type[payload.CVFoldable]' = paymod.PandasCVFolds,
+        hoist: bool = False,
     ):
         """Constructor based on a splitter supplied in form of a cross-validator and a folding
         actor type.
@@ -198,14 +332,16 @@ class HoldOut(CrossVal):
             splitter: Folding actor type that is expected to take the *cross-validator* is its
                       parameter. Defaults to :class:`payload.PandasCVFolds
                       <forml.pipeline.payload.PandasCVFolds>`.
+            hoist: Compose the leading stateless part of the pipeline above the fold splitting.
         """
 
     @typing.overload
-    def __init__(self, *, splitter: 'flow.Builder[payload.CVFoldable]'):
+    def __init__(self, *, splitter: 'flow.Builder[payload.CVFoldable]', hoist: bool = False):
         """Constructor based on a ``splitter`` supplied in form of an actor *builder* instance.
 
         Args:
             splitter: Actor builder instance defining the train-test splitter.
+            hoist: Compose the leading stateless part of the pipeline above the splitting.
         """
 
     def __init__(
@@ -217,6 +353,7 @@ class HoldOut(CrossVal):
         stratify=None,
         crossvalidator=None,
         splitter=paymod.PandasCVFolds,
+        hoist=False,
     ):
         if (test_size is None and train_size is None and random_state is None and stratify is None) ^ (
             crossvalidator is not None or isinstance(splitter, flow.Builder)
@@ -232,5 +369,162 @@ class HoldOut(CrossVal):
                 )
         else:
             cvsplits = 2
-        super().__init__(crossvalidator=crossvalidator, splitter=splitter, nsplits=cvsplits)
+        super().__init__(crossvalidator=crossvalidator, splitter=splitter, nsplits=cvsplits, hoist=hoist)
         self._nsplits = 1  # force to single fold to avoid actual crossvalidation
+
+
+class WalkForward(CrossVal):
+    """Evaluation method for temporal data based on a series of train-test trials over *expanding*
+    windows.
+
+    The training dataset is ordered by its *ordinal* values and cut into ``windows + 1``
+    (similarly sized) consecutive chunks. Each trial is then trained on all the chunks preceding the
+    given window and tested on the window chunk (so that no trial is ever tested on data older than
+    its training data). All rows sharing the same ordinal value always fall into the same chunk.
+
+    Instead of training each window from scratch, the stateful actors can be *warm-started* using
+    the state trained in the previous window. This only applies to actors explicitly opting in
+    using the ``warm`` :meth:`builder hint <forml.flow.Builder.hint>` (i.e. actors able to
+    continue their training from an initial state) - all the others are always trained from
+    scratch. With the ``incremental`` option, each window is then trained only using the chunk
+    added since the previous window.
+
+    Note:
+        The warm start can only be applied to actors appearing exactly once in the pipeline (per
+        window) - the others are always trained from scratch.
+
+    Warning:
+        The ``incremental`` mode is only meaningful if all the stateful actors of the pipeline
+        support incremental (``partial_fit``-style) training on top of their previous states. If
+        any of the stateful actors is not opted in for the warm start (or can't be warm-started),
+        the method falls back to training all the windows over the full *expanding* windows.
+
+    Args:
+        windows: Number of the evaluation windows.
+        ordinal: Optional ordinal specification in form of either the feature *column* (its name or
+                 the actual DSL column - typically the one used as the :meth:`project.Source.query
+                 <forml.project.Source.query>` ``ordinal``) or a callable extracting the ordinal
+                 values from the features. The row order is assumed chronological if not provided.
+        warm: Initialize each window by the state trained in the previous window (only for the
+              opted-in actors).
+        incremental: Train each window (except the first one) only using the new chunk of data
+                     (implies ``warm``).
+        splitter: Folding actor type that is expected to take the *cross-validator* as its
+                  parameter. Defaults to :class:`payload.PandasCVFolds
+                  <forml.pipeline.payload.PandasCVFolds>`.
+        hoist: Compose the leading stateless part of the pipeline just once above the splitting
+               (see :class:`evaluation.CrossVal <forml.evaluation.CrossVal>`).
+
+    Examples:
+        >>> WALKFORWARD = evaluation.WalkForward(windows=4, ordinal=schema.Demo.Updated)
+    """
+
+    class Splitter:
+        """Cross-validator implementing the ordinal-based expanding window splits.
+
+        The ``groups`` parameter of the splitting methods is interpreted as the vector of the
+        ordinal values (defaulting to the row positions).
+
+        Args:
+            windows: Number of the evaluation windows.
+            incremental: Provide just the chunk added since the previous window as the train split.
+        """
+
+        def __init__(self, windows: int, incremental: bool = False):
+            self._windows: int = windows
+            self._incremental: bool = incremental
+
+        def __repr__(self):
+            return f'{self.__class__.__name__}(windows={self._windows}, incremental={self._incremental})'
+
+        def split(
+            self, features: flow.Features, labels: typing.Optional[flow.Labels] = None, groups: typing.Any = None, /
+        ) -> typing.Iterable[tuple[numpy.ndarray, numpy.ndarray]]:
+            ordinal = numpy.asarray(groups if groups is not None else numpy.arange(len(features)))
+            ranked = numpy.sort(ordinal, kind='stable')
+            cuts = ranked[numpy.linspace(0, len(ranked), self._windows + 2, dtype=int)[1:-1]]
+            if len(cuts) != len(numpy.unique(cuts)) or not len(ranked) or cuts[0] == ranked[0]:
+                raise ValueError('Insufficient number of distinct ordinal values')
+            # chunk numbers of the individual rows (0 being the initial chunk preceding all windows)
+            chunks = numpy.searchsorted(cuts, ordinal, side='right')
+            for window in range(1, self._windows + 1):
+                train = (chunks == window - 1) if self._incremental and window > 1 else (chunks < window)
+                yield numpy.flatnonzero(train), numpy.flatnonzero(chunks == window)
+
+        def get_n_splits(
+            self, features: typing.Any = None, labels: typing.Any = None, groups: typing.Any = None, /
+        ) -> int:
+            return self._windows
+
+    def __init__(
+        self,
+        windows: int = 3,
+        ordinal: typing.Optional[typing.Union[str, 'dsl.Column', typing.Callable[[flow.Features], typing.Any]]] = None,
+        warm: bool = False,
+        incremental: bool = False,
+        splitter: 'type[payload.CVFoldable]' = paymod.PandasCVFolds,
+        hoist: bool = False,
+    ):
+        if ordinal is not None and not callable(ordinal):
+            ordinal = operator.itemgetter(getattr(ordinal, 'name', ordinal))
+        super().__init__(
+            splitter=splitter.builder(crossvalidator=self.Splitter(windows), groups_extractor=ordinal),
+            nsplits=windows,
+            hoist=hoist,
+        )
+        self._chunked: typing.Optional[flow.Builder['payload.CVFoldable']] = (
+            splitter.builder(crossvalidator=self.Splitter(windows, True), groups_extractor=ordinal)
+            if incremental
+            else None
+        )
+        self._warm: bool = warm
+
+    @staticmethod
+    def _profile(fold: flow.Trunk) -> tuple[dict[type[flow.Actor], flow.Worker], set[str]]:
+        """Split the trained workers of the given fold into the warm-startable and the cold ones.
+
+        Warm-startable are the unambiguous (single per actor type) workers of the actors opted in
+        using the ``warm`` builder hint.
+
+        Args:
+            fold: Fold pipeline to be profiled.
+
+        Returns:
+            Tuple of the warm-startable workers keyed by their actor types and the names of the
+            cold actors.
+        """
+        profile = Profile()
+        fold.train.accept(profile)
+        workers = collections.defaultdict(list)
+        for worker in profile.trained:
+            workers[worker.builder.actor].append(worker)
+        warm = {a: w for a, (w, *other) in workers.items() if not other and w.builder.hints.get('warm')}
+        return warm, {a.__name__ for a in workers if a not in warm}
+
+    def _select(self, pipeline: typing.Optional[flow.Composable]) -> flow.Builder['payload.CVFoldable']:
+        if self._chunked:
+            cold = self._profile(pipeline.expand())[1] if pipeline else set()
+            if not cold:
+                return self._chunked
+            LOGGER.warning(
+                'Incremental walk-forward falling back to expanding windows due to stateful actors %s '
+                'not opted in for the warm start',
+                sorted(cold),
+            )
+        return self._splitter
+
+    def _link(self, folds: typing.Sequence[flow.Trunk]) -> None:
+        """Warm-start the trained workers of the opted-in actors of each window from their
+        counterparts in the previous window.
+
+        Args:
+            folds: Window pipelines in the chronological order.
+        """
+        windows = [self._profile(f) for f in folds]
+        incremental = bool(self._chunked) and not any(c for _, c in windows)
+        if not (self._warm or incremental):
+            return
+        for (previous, _), (current, _) in zip(windows, windows[1:]):
+            for actor, worker in current.items():
+                if actor in previous:
+                    worker.warm(previous[actor])
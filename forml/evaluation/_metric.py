@@ -18,8 +18,13 @@
 """
 Metric implementations.
 """
+import abc
+import functools
 import statistics
 import typing
+from concurrent import futures
+
+import numpy
 
 from forml import flow
 from forml.pipeline import payload
@@ -108,3 +113,402 @@ class Function(_api.Metric):
             for idx, out in enumerate(outcomes[1:], start=1):
                 merge(result, apply(out), idx)
         return result
+
+
+class Estimate(float):
+    """Metric value accompanied by its confidence interval bounds.
+
+    Being a plain ``float`` subclass, it can be used anywhere the metric value is expected.
+
+    Args:
+        value: Metric value.
+        lower: Lower bound of the confidence interval.
+        upper: Upper bound of the confidence interval.
+    """
+
+    __slots__ = ('lower', 'upper')
+
+    lower: float
+    upper: float
+
+    def __new__(cls, value: float, lower: float, upper: float):
+        instance = super().__new__(cls, value)
+        instance.lower = float(lower)
+        instance.upper = float(upper)
+        return instance
+
+    def __getnewargs__(self):
+        return float(self), self.lower, self.upper
+
+    def __repr__(self):
+        return f'{float(self)!r} [{self.lower!r}, {self.upper!r}]'
+
+
+#: Data shared with the bootstrap worker processes.
+_SHARED: dict[str, typing.Any] = {}
+
+
+def _share(data: typing.Mapping[str, typing.Any]) -> None:
+    """Bootstrap worker process initializer.
+
+    Args:
+        data: Data to be shared with all the tasks executed by the worker process.
+    """
+    _SHARED.update(data)
+
+
+def _replicate(seeds: typing.Sequence[numpy.random.SeedSequence], **kwargs: typing.Any) -> numpy.ndarray:
+    """Calculate a batch of the bootstrap metric replicates.
+
+    Args:
+        seeds: Random seeds of the individual resamples in the batch.
+        kwargs: The ``metric``, ``vectorized`` flag and the ``true``/``pred`` outcomes (or taken
+                from the process-shared data).
+
+    Returns:
+        Array of the metric replicates.
+    """
+    kwargs = kwargs or _SHARED
+    metric, true, pred = kwargs['metric'], kwargs['true'], kwargs['pred']
+    index = numpy.stack([numpy.random.default_rng(s).integers(0, len(true), len(true)) for s in seeds])
+    if kwargs['vectorized']:
+        return numpy.asarray(metric(true[index], pred[index]), dtype=numpy.float64)
+    return numpy.fromiter((metric(true[i], pred[i]) for i in index), dtype=numpy.float64, count=len(seeds))
+
+
+class Bootstrap(Function):
+    """Bootstrap(metric: Callable[[typing.Any, typing.Any], float], reducer: Callable[..., float] = mean, resamples: int = 1000, confidence: float = 0.95, vectorized: bool = False, processes: typing.Optional[int] = None, seed: typing.Optional[int] = None)
+
+    Metric wrapper estimating the confidence interval of the metric function using the bootstrap
+    resampling of the outcomes.
+
+    Each outcome partition is resampled (with replacement) ``resamples``-times and the metric
+    function is evaluated on every single resample. The partition replicates are then combined
+    using the ``reducer`` (replicate by replicate) and the result is an :class:`Estimate
+    <forml.evaluation.Estimate>` (a ``float``) of the replicates mean with the percentile
+    confidence interval bounds.
+
+    The resample indices are drawn in batches as a single 2-dimensional array. A *vectorized*
+    metric function gets the entire batch at once as ``(resamples, rows)`` arrays (and is expected
+    to return the vector of the metric values) - otherwise it is called for each resample
+    separately (optionally distributing the resamples across a pool of worker processes).
+
+    Each resample is drawn using its own seed derived from the ``seed`` and the partition index so
+    that the replicates don't depend on the batching and the equally sized partitions are
+    resampled independently.
+
+    Args:
+        metric: Actual metric function implementation.
+        reducer: Callable to reduce individual metric *partitions* into a single final value.
+        resamples: Number of the bootstrap resamples.
+        confidence: Confidence level of the interval.
+        vectorized: The metric function accepts the 2-dimensional batches of resampled outcomes.
+        processes: Number of the worker processes for the non-vectorized metric function
+                   evaluation (the metric function must be picklable).
+        seed: Optional random seed.
+
+    Examples:
+        >>> ACCURACY = evaluation.Bootstrap(
+        ...     lambda t, p: (t == numpy.round(p)).mean(axis=1), vectorized=True, seed=42
+        ... )
+        >>> LOG_LOSS = evaluation.Bootstrap(sklearn.metrics.log_loss, resamples=200, processes=4)
+    """  # pylint: disable=line-too-long  # noqa: E501
+
+    BATCH = 1 << 22
+    """Maximum number of the resample indices drawn at once."""
+
+    def __init__(
+        self,
+        metric: typing.Callable[[typing.Any, typing.Any], float],
+        reducer: typing.Callable[..., float] = mean,
+        resamples: int = 1000,
+        confidence: float = 0.95,
+        vectorized: bool = False,
+        processes: typing.Optional[int] = None,
+        seed: typing.Optional[int] = None,
+    ):
+        if resamples < 2:
+            raise ValueError('At least 2 resamples required')
+        if not 0 < confidence < 1:
+            raise ValueError(f'Invalid confidence: {confidence}')
+        super().__init__(self.resample, self.estimate)
+        self._function: typing.Callable[[typing.Any, typing.Any], float] = metric
+        self._reduce: typing.Callable[..., float] = reducer
+        self._resamples: int = resamples
+        self._confidence: float = confidence
+        self._vectorized: bool = vectorized
+        self._processes: typing.Optional[int] = processes
+        self._seed: typing.Optional[int] = seed
+
+    def resample(self, true: typing.Any, pred: typing.Any, partition: int = 0) -> numpy.ndarray:
+        """Calculate the metric replicates of the bootstrap resamples of the given outcomes.
+
+        Args:
+            true: True outcomes of the partition.
+            pred: Predicted outcomes of the partition.
+            partition: Index of the partition (to derive its random seeds).
+
+        Returns:
+            Array of the metric replicates.
+        """
+        true = numpy.asarray(true)
+        pred = numpy.asarray(pred)
+        if len(true) != len(pred):
+            raise ValueError('Outcomes length mismatch')
+        seeds = numpy.random.SeedSequence(self._seed, spawn_key=(partition,)).spawn(self._resamples)
+        batch = max(1, min(self._resamples, self.BATCH // max(len(true), 1)))
+        pooled = self._processes and not self._vectorized
+        if pooled:  # at least as many batches as processes
+            batch = min(batch, -(-self._resamples // self._processes))
+        batches = [seeds[o : o + batch] for o in range(0, self._resamples, batch)]  # noqa: E203
+        data = {'metric': self._function, 'vectorized': self._vectorized, 'true': true, 'pred': pred}
+        if pooled and len(batches) > 1:
+            with futures.ProcessPoolExecutor(self._processes, initializer=_share, initargs=(data,)) as pool:
+                return numpy.concatenate(list(pool.map(_replicate, batches)))
+        return numpy.concatenate([_replicate(b, **data) for b in batches])
+
+    def estimate(self, *replicates: numpy.ndarray) -> Estimate:
+        """Reduce the replicates of the individual partitions and calculate the final estimate.
+
+        Args:
+            replicates: Metric replicates of the individual partitions.
+
+        Returns:
+            Metric estimate with its confidence interval.
+        """
+        if len(replicates) > 1:
+            replicates = numpy.fromiter(
+                (self._reduce(*r) for r in zip(*replicates)), dtype=numpy.float64, count=self._resamples
+            )
+        else:
+            (replicates,) = replicates
+        alpha = (1 - self._confidence) / 2 * 100
+        lower, upper = numpy.nanpercentile(replicates, [alpha, 100 - alpha])
+        return Estimate(numpy.nanmean(replicates), lower, upper)
+
+    def score(self, *outcomes: 'evaluation.Outcome') -> flow.Worker:
+        assert outcomes, 'Expecting outcomes.'
+        result = flow.Worker(self._reducer, len(outcomes), 1)
+        for index, partition in enumerate(outcomes):
+            worker = flow.Worker(
+                payload.Apply.builder(function=functools.partial(self.resample, partition=index)), 2, 1
+            )
+            worker[0].subscribe(partition.true)
+            worker[1].subscribe(partition.pred)
+            result[index].subscribe(worker[0])
+        return result
+
+
+class Incremental(_api.Metric, metaclass=abc.ABCMeta):
+    """Base class for metrics computed incrementally from *sufficient statistics*.
+
+    Instead of keeping the entire *true*/*predicted* payloads, each outcome partition is
+    immediately summarized (chunk by chunk) into a small additive array of statistics (e.g.
+    confusion counts or sums of squares). The partition statistics are then simply summed up and
+    the final metric is calculated from the total. Unlike the :class:`evaluation.Function
+    <forml.evaluation.Function>` with its reducer, the result is exact regardless of how the
+    outcomes are partitioned.
+
+    Implementations need to provide the :meth:`accumulate` and :meth:`result` methods.
+
+    Args:
+        chunk: Number of rows to be summarized at once (bounding the size of the temporary
+               arrays).
+    """
+
+    def __init__(self, chunk: int = 1 << 16):
+        if chunk < 1:
+            raise ValueError('Invalid chunk size')
+        self._chunk: int = chunk
+
+    @abc.abstractmethod
+    def accumulate(self, true: numpy.ndarray, pred: numpy.ndarray) -> numpy.ndarray:
+        """Calculate the statistics of the given outcomes chunk.
+
+        Args:
+            true: Chunk of the true outcomes.
+            pred: Chunk of the predicted outcomes.
+
+        Returns:
+            Additive array of the sufficient statistics.
+        """
+
+    @abc.abstractmethod
+    def result(self, stats: numpy.ndarray) -> float:
+        """Calculate the final metric value from the total statistics.
+
+        Args:
+            stats: Sum of the statistics of all the outcome chunks.
+
+        Returns:
+            Metric value.
+        """
+
+    def summarize(self, true: typing.Any, pred: typing.Any) -> numpy.ndarray:
+        """Summarize the given outcome partition chunk by chunk.
+
+        Args:
+            true: True outcomes of the partition.
+            pred: Predicted outcomes of the partition.
+
+        Returns:
+            Statistics of the entire partition.
+        """
+        true = numpy.asarray(true)
+        pred = numpy.asarray(pred)
+        if len(true) != len(pred):
+            raise ValueError('Outcomes length mismatch')
+        if pred.ndim > 1:  # binary class probabilities
+            pred = pred[:, -1]
+        chunks = (slice(o, o + self._chunk) for o in range(0, len(true), self._chunk))
+        return sum((self.accumulate(true[c], pred[c]) for c in chunks), start=self.accumulate(true[:0], pred[:0]))
+
+    def finalize(self, *stats: numpy.ndarray) -> float:
+        """Merge the partition statistics and calculate the final metric value.
+
+        Args:
+            stats: Statistics of the individual partitions.
+
+        Returns:
+            Metric value.
+        """
+        return self.result(sum(stats[1:], start=stats[0]))
+
+    def score(self, *outcomes: 'evaluation.Outcome') -> flow.Worker:
+        assert outcomes, 'Expecting outcomes.'
+        summarizer = payload.Apply.builder(function=self.summarize)
+        result = flow.Worker(payload.Apply.builder(function=self.finalize), len(outcomes), 1)
+        for index, (partition, worker) in enumerate(zip(outcomes, flow.Worker.fgen(summarizer, 2, 1))):
+            worker[0].subscribe(partition.true)
+            worker[1].subscribe(partition.pred)
+            result[index].subscribe(worker[0])
+        return result
+
+
+class ConfusionScore(Incremental):
+    """ConfusionScore(score: str = 'accuracy', threshold: float = 0.5, chunk: int = 65536)
+
+    Incremental binary classification metric based on the confusion matrix counts.
+
+    Args:
+        score: One of ``accuracy``, ``precision``, ``recall`` or ``f1``.
+        threshold: Decision threshold for the predicted probabilities (ignored for non-float
+                   predictions).
+        chunk: Number of rows to be summarized at once.
+
+    Examples:
+        >>> F1 = evaluation.ConfusionScore('f1', threshold=0.3)
+    """
+
+    SCORES: typing.Mapping[str, typing.Callable[[float, float, float, float], float]] = {
+        'accuracy': lambda tp, fp, fn, tn: (tp + tn) / (tp + fp + fn + tn),
+        'precision': lambda tp, fp, fn, tn: tp / (tp + fp),
+        'recall': lambda tp, fp, fn, tn: tp / (tp + fn),
+        'f1': lambda tp, fp, fn, tn: 2 * tp / (2 * tp + fp + fn),
+    }
+
+    def __init__(self, score: str = 'accuracy', threshold: float = 0.5, chunk: int = 1 << 16):
+        if score not in self.SCORES:
+            raise ValueError(f'Unknown score: {score}')
+        super().__init__(chunk)
+        self._score: str = score
+        self._threshold: float = threshold
+
+    def accumulate(self, true: numpy.ndarray, pred: numpy.ndarray) -> numpy.ndarray:
+        true = true.astype(bool)
+        pred = pred >= self._threshold if numpy.issubdtype(pred.dtype, numpy.floating) else pred.astype(bool)
+        positive = numpy.count_nonzero(pred & true), numpy.count_nonzero(pred & ~true)
+        negative = numpy.count_nonzero(~pred & true), numpy.count_nonzero(~pred & ~true)
+        return numpy.array([*positive, *negative], dtype=numpy.int64)
+
+    def result(self, stats: numpy.ndarray) -> float:
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            return float(self.SCORES[self._score](*stats.astype(numpy.float64)))
+
+
+class SquaredError(Incremental):
+    """SquaredError(root: bool = False, chunk: int = 65536)
+
+    Incremental regression metric based on the sum of squared errors.
+
+    Args:
+        root: Return the root of the mean squared error.
+        chunk: Number of rows to be summarized at once.
+
+    Examples:
+        >>> RMSE = evaluation.SquaredError(root=True)
+    """
+
+    def __init__(self, root: bool = False, chunk: int = 1 << 16):
+        super().__init__(chunk)
+        self._root: bool = root
+
+    def accumulate(self, true: numpy.ndarray, pred: numpy.ndarray) -> numpy.ndarray:
+        error = true.astype(numpy.float64) - pred
+        return numpy.array([numpy.dot(error, error), len(error)])
+
+    def result(self, stats: numpy.ndarray) -> float:
+        mse = stats[0] / stats[1] if stats[1] else numpy.nan
+        return float(numpy.sqrt(mse) if self._root else mse)
+
+
+class LogLoss(Incremental):
+    """LogLoss(eps: float = 1e-15, chunk: int = 65536)
+
+    Incremental binary classification logarithmic loss.
+
+    Args:
+        eps: Clipping of the predicted probabilities to avoid infinite loss.
+        chunk: Number of rows to be summarized at once.
+
+    Examples:
+        >>> LOG_LOSS = evaluation.LogLoss()
+    """
+
+    def __init__(self, eps: float = 1e-15, chunk: int = 1 << 16):
+        super().__init__(chunk)
+        self._eps: float = eps
+
+    def accumulate(self, true: numpy.ndarray, pred: numpy.ndarray) -> numpy.ndarray:
+        pred = numpy.clip(pred.astype(numpy.float64), self._eps, 1 - self._eps)
+        loss = numpy.where(true.astype(bool), numpy.log(pred), numpy.log1p(-pred))
+        return numpy.array([-loss.sum(), len(loss)])
+
+    def result(self, stats: numpy.ndarray) -> float:
+        return float(stats[0] / stats[1]) if stats[1] else numpy.nan
+
+
+class RocAuc(Incremental):
+    """RocAuc(bins: int = 1000, chunk: int = 65536)
+
+    Incremental (approximate) binary classification ROC AUC based on histograms of the predicted
+    probabilities of the positive and negative outcomes.
+
+    The precision of the approximation is given by the number of the (equal-width) histogram bins
+    (predictions falling into the same bin are treated as ties).
+
+    Args:
+        bins: Number of the histogram bins.
+        chunk: Number of rows to be summarized at once.
+
+    Examples:
+        >>> AUC = evaluation.RocAuc(bins=10_000)
+    """
+
+    def __init__(self, bins: int = 1000, chunk: int = 1 << 16):
+        super().__init__(chunk)
+        self._bins: int = bins
+
+    def accumulate(self, true: numpy.ndarray, pred: numpy.ndarray) -> numpy.ndarray:
+        index = numpy.clip((pred.astype(numpy.float64) * self._bins).astype(numpy.int64), 0, self._bins - 1)
+        true = true.astype(bool)
+        return numpy.stack(
+            [numpy.bincount(index[true], minlength=self._bins), numpy.bincount(index[~true], minlength=self._bins)]
+        )
+
+    def result(self, stats: numpy.ndarray) -> float:
+        positive, negative = stats
+        if not (total := positive.sum() * negative.sum()):
+            return numpy.nan
+        below = numpy.cumsum(negative) - negative
+        return float(numpy.dot(positive, below + negative / 2) / total)
@@ -20,7 +20,10 @@ Evaluation mode functionality.
 """
 import typing
 
+import numpy
+
 from forml import flow
+from forml.pipeline import payload as paymod
 
 from . import _api
 
@@ -28,6 +31,45 @@ if typing.TYPE_CHECKING:
     from forml import evaluation
 
 
+class Chunks:
+    """Crossvalidator-like splitter of the data into the given number of contiguous chunks.
+
+    Unlike the ``model_selection.KFold``, it doesn't fail if there are fewer rows than chunks -
+    the surplus chunks are simply empty. The train parts of the folds are always empty.
+
+    Args:
+        chunks: Number of the contiguous chunks.
+    """
+
+    def __init__(self, chunks: int):
+        self._chunks: int = chunks
+
+    def split(
+        self, features: typing.Any, labels: typing.Any = None, groups: typing.Any = None
+    ) -> typing.Iterable[tuple[numpy.ndarray, numpy.ndarray]]:
+        """Generate the chunk indices.
+
+        Args:
+            features: Data to be split.
+            labels: Ignored.
+            groups: Ignored.
+
+        Returns:
+            Sequence of (empty) train and (contiguous) test index pairs.
+        """
+        empty = numpy.empty(0, dtype=int)
+        for chunk in numpy.array_split(numpy.arange(len(features)), self._chunks):
+            yield empty, chunk
+
+    def get_n_splits(self, features: typing.Any = None, labels: typing.Any = None, groups: typing.Any = None) -> int:
+        """Get the number of the chunks.
+
+        Returns:
+            Number of the chunks.
+        """
+        return self._chunks
+
+
 class PerfTrackScore(flow.Operator):
     """Production performance tracking evaluation result value operator.
 
@@ -35,17 +77,52 @@ class PerfTrackScore(flow.Operator):
 
     Only the train segment of the composed trunk is expected to be used (apply segment still needs
     to present all persistent nodes so that the states can be loaded).
+
+    Long production windows can be scored chunk by chunk - the window gets split into the given
+    number of contiguous chunks each of which is passed through the pipeline and scored as a
+    separate outcome partition (best combined with an :class:`evaluation.Incremental
+    <forml.evaluation.Incremental>` metric which makes the result independent of the chunking).
+
+    Note:
+        The chunking only bounds the size of the intermediate payloads produced by the pipeline
+        (the predictions and whatever the actors allocate per chunk). The whole window is still
+        extracted and held in memory for the duration of the evaluation, so the peak memory use
+        can't drop below the size of the raw window. Windows shorter than the number of chunks
+        leave the surplus chunks empty (the pipeline needs to tolerate an empty input then).
+
+    Args:
+        metric: Evaluation metric.
+        chunks: Number of the contiguous chunks to split the evaluation window into.
     """
 
-    def __init__(self, metric: 'evaluation.Metric'):
+    def __init__(self, metric: 'evaluation.Metric', chunks: int = 1):
+        if chunks < 1:
+            raise ValueError('Invalid number of chunks')
         self._metric: 'evaluation.Metric' = metric
+        self._chunks: int = chunks
 
     def compose(self, scope: flow.Composable) -> flow.Trunk:
         head: flow.Trunk = flow.Trunk()
         pipeline: flow.Trunk = scope.expand()
         pipeline.apply.copy().subscribe(head.apply)  # all persistent nodes must be reachable via the apply segment
-        pipeline.apply.subscribe(head.train)
-        value = self._metric.score(_api.Outcome(head.label.publisher, pipeline.apply.publisher))
+        if self._chunks == 1:
+            pipeline.apply.subscribe(head.train)
+            outcomes = [_api.Outcome(head.label.publisher, pipeline.apply.publisher)]
+        else:
+            splitter = flow.Worker(
+                paymod.PandasCVFolds.builder(crossvalidator=Chunks(self._chunks)), 1, 2 * self._chunks
+            )
+            splitter.train(head.train.publisher, head.label.publisher)
+            features: flow.Worker = splitter.fork()
+            features[0].subscribe(head.train.publisher)
+            labels: flow.Worker = splitter.fork()
+            labels[0].subscribe(head.label.publisher)
+            outcomes = []
+            for index in range(self._chunks):  # only the test parts (contiguous chunks) of the folds are used
+                chunk = pipeline.apply.copy() if index else pipeline.apply
+                chunk.subscribe(features[2 * index + 1])
+                outcomes.append(_api.Outcome(labels[2 * index + 1].publisher, chunk.publisher))
+        value = self._metric.score(*outcomes)
         return head.use(train=head.train.extend(tail=value))
 
 
@@ -20,6 +20,7 @@ ForML flow logic.
 """
 
 from ._code.compiler import compile  # pylint: disable=redefined-builtin
+from ._code.fusion import fuse
 from ._code.target import Instruction, Symbol
 from ._code.target.system import Committer, Dumper, Getter, Loader
 from ._code.target.user import Apply, Functor, Preset, Train
@@ -42,6 +43,7 @@ __all__ = [
     'Dumper',
     'Features',
     'Functor',
+    'fuse',
     'Future',
     'Getter',
     'Instruction',
@@ -177,6 +177,7 @@ class Table(span.Visitor, typing.Iterable):
         self._assets: typing.Optional['asset.State'] = assets
         self._linkage: Table.Linkage = self.Linkage()
         self._index: Table.Index = self.Index()
+        self._dumper: typing.Optional[uuid.UUID] = None
         self._committer: typing.Optional[uuid.UUID] = None
 
     def __iter__(self) -> 'flow.Symbol':
@@ -241,15 +242,18 @@ class Table(span.Visitor, typing.Iterable):
                 functor = user.Train().functor(node.builder)
                 aliases.append(state)
                 if persistent:
-                    if not self._committer:
+                    if not self._committer:  # single dumper of all the states followed by the committer
+                        self._dumper = self._index.set(system.Dumper(self._assets))
                         self._committer = self._index.set(system.Committer(self._assets))
-                    dumper = self._index.set(system.Dumper(self._assets))
-                    self._linkage.insert(dumper, node.uid)
-                    self._linkage.insert(self._committer, dumper, self._assets.offset(state))
+                        self._linkage.insert(self._committer, self._dumper)
+                    self._linkage.insert(self._dumper, node.uid, self._assets.offset(state))
                     state = self._index.reset(state)  # re-register loader under it's own id
             if persistent or node.derived:
                 functor = functor.preset_state()
                 self._linkage.prepend(node.uid, state)
+            elif node.trained and node.origin:  # warm start from the trained state of the origin group
+                functor = functor.preset_state()
+                self._linkage.prepend(node.uid, node.origin)
         for key in aliases:
             self._index.set(functor, key)
         if not node.trained:
@@ -0,0 +1,240 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Runtime symbols fusion.
+"""
+import collections
+import logging
+import os
+import typing
+from concurrent import futures
+
+from . import target
+from .target import system, user
+
+if typing.TYPE_CHECKING:
+    from forml import flow
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Fused(target.Instruction):
+    """Composite instruction executing a fused region of symbols using a thread pool within the
+    single (current) process.
+
+    The intermediate results are shared in memory (no serialization) and are released as soon as
+    all of their consumers within the region are done.
+
+    Args:
+        symbols: Region symbols (in topological order).
+        inputs: External instructions whose outputs constitute the input arguments of this
+                instruction.
+        outputs: Region instructions whose results constitute the output of this instruction.
+        workers: Maximum number of the parallel threads.
+    """
+
+    def __init__(
+        self,
+        symbols: typing.Sequence['flow.Symbol'],
+        inputs: typing.Sequence['flow.Instruction'],
+        outputs: typing.Sequence['flow.Instruction'],
+        workers: typing.Optional[int] = None,
+    ):
+        self._args: dict['flow.Instruction', tuple['flow.Instruction']] = dict(symbols)
+        self._inputs: tuple['flow.Instruction'] = tuple(inputs)
+        self._outputs: tuple['flow.Instruction'] = tuple(outputs)
+        self._workers: int = workers or min(len(self._args), os.cpu_count() or 1)
+
+    def __repr__(self):
+        return f'Fused[{len(self._args)}]'
+
+    def execute(self, *args: typing.Any) -> tuple[typing.Any]:
+        values: dict['flow.Instruction', typing.Any] = dict(zip(self._inputs, args))
+        pending: dict['flow.Instruction', set['flow.Instruction']] = {
+            i: {a for a in a if a in self._args} for i, a in self._args.items()
+        }
+        consumers: dict['flow.Instruction', set['flow.Instruction']] = collections.defaultdict(set)
+        for instruction, arguments in self._args.items():
+            for arg in arguments:
+                consumers[arg].add(instruction)
+        refs: dict['flow.Instruction', int] = {i: len(c) for i, c in consumers.items()}
+
+        def release(instruction: 'flow.Instruction') -> None:
+            """Drop the result of the given instruction once it is no longer needed."""
+            refs[instruction] -= 1
+            if not refs[instruction] and instruction not in self._outputs:
+                del values[instruction]
+
+        with futures.ThreadPoolExecutor(self._workers, thread_name_prefix='forml-fused') as pool:
+            running: dict[futures.Future, 'flow.Instruction'] = {}
+
+            def submit(instruction: 'flow.Instruction') -> None:
+                """Launch the given instruction with all its arguments being ready."""
+                running[pool.submit(instruction, *(values[a] for a in self._args[instruction]))] = instruction
+
+            for instruction in [i for i, p in pending.items() if not p]:
+                submit(instruction)
+            while running:
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    instruction = running.pop(future)
+                    values[instruction] = future.result()
+                    for arg in set(self._args[instruction]):
+                        release(arg)
+                    for consumer in consumers[instruction]:
+                        pending[consumer].discard(instruction)
+                        if not pending[consumer]:
+                            submit(consumer)
+        return tuple(values[o] for o in self._outputs)
+
+
+def fuse(symbols: typing.Collection['flow.Symbol']) -> typing.Collection['flow.Symbol']:
+    """Fuse the branches fanning out of actors *hinted* for co-scheduling into composite
+    instructions executed within a single process.
+
+    The co-scheduling hint (see :meth:`flow.Builder.hint <forml.flow.Builder.hint>`) specifies the
+    number of consecutive output ports of the hinted actor constituting a single branch. All
+    instructions depending on exactly one branch of the given hinted actor (including its forks)
+    form the actor branches which all get fused together with the hinted actor into a single
+    region replaced by one :class:`Fused` instruction (followed by getters of its outputs) so that
+    the branches execute concurrently sharing the actor outputs in memory. Regions nested within
+    another region are left to be executed as part of the outer one.
+
+    Args:
+        symbols: Source symbols to be fused.
+
+    Returns:
+        Symbols with the hinted regions fused.
+    """
+    args: dict['flow.Instruction', tuple['flow.Instruction']] = dict(symbols)
+    consumers: dict['flow.Instruction', list['flow.Instruction']] = collections.defaultdict(list)
+    for instruction, arguments in args.items():
+        for arg in dict.fromkeys(arguments):
+            consumers[arg].append(instruction)
+
+    order: list['flow.Instruction'] = []
+    visited: set['flow.Instruction'] = set()
+
+    def visit(instruction: 'flow.Instruction') -> None:
+        """Topological sorting."""
+        if instruction not in visited:
+            visited.add(instruction)
+            for arg in args[instruction]:
+                visit(arg)
+            order.append(instruction)
+
+    for instruction in args:
+        visit(instruction)
+
+    # branches (of the individual hinted functors) each instruction depends on
+    branches: dict['flow.Instruction', dict['flow.Functor', set[int]]] = {}
+    rank: dict[int, int] = {}  # position of the first branch of each hinted builder (shared by forks)
+    for position, instruction in enumerate(order):
+        deps: dict['flow.Functor', set[int]] = collections.defaultdict(set)
+        for arg in args[instruction]:
+            for source, ids in branches[arg].items():
+                deps[source].update(ids)
+        if isinstance(instruction, system.Getter) and len(args[instruction]) == 1:
+            (source,) = args[instruction]
+            if isinstance(source, user.Functor) and source.builder.hints.get('coschedule'):
+                deps[source].add(instruction.index // source.builder.hints['coschedule'])
+                rank.setdefault(id(source.builder), position)
+        branches[instruction] = deps
+
+    parent: dict[tuple['flow.Functor', int], tuple['flow.Functor', int]] = {}
+
+    def find(key: tuple['flow.Functor', int]) -> tuple['flow.Functor', int]:
+        """Union-find lookup of the representative branch."""
+        while parent.setdefault(key, key) != key:
+            key = parent[key]
+        return key
+
+    forks: dict['flow.Functor', 'flow.Functor'] = {}
+
+    def origin(functor: 'flow.Functor') -> 'flow.Functor':
+        """Union-find lookup of the representative fork of the hinted functor."""
+        while forks.setdefault(functor, functor) is not functor:
+            functor = forks[functor]
+        return functor
+
+    claims: dict['flow.Instruction', tuple['flow.Functor', int]] = {}
+    for instruction in order:
+        candidates = [(s, *i) for s, i in branches[instruction].items() if len(i) == 1]
+        if candidates:  # the outermost builder (the first one to branch) claims the instruction
+            outer = id(min(candidates, key=lambda c: rank[id(c[0].builder)])[0].builder)
+            claimed, *siblings = [find(c) for c in candidates if id(c[0].builder) == outer]
+            for sibling in siblings:  # joining the same branch of the other forks
+                parent[sibling] = claimed
+                forks[origin(sibling[0])] = origin(claimed[0])
+            claims[instruction] = claimed
+    if not claims:
+        return symbols
+
+    branched: dict['flow.Functor', dict[tuple['flow.Functor', int], list['flow.Instruction']]] = {}
+    merged: dict['flow.Functor', list['flow.Instruction']] = collections.defaultdict(list)
+    for instruction in order:
+        if instruction in claims:
+            claimed = find(claims[instruction])
+            branched.setdefault(origin(claimed[0]), collections.defaultdict(list))[claimed].append(instruction)
+            merged[origin(claimed[0])].append(instruction)
+        elif instruction in forks:  # the (unclaimed) hinted functor itself
+            merged[origin(instruction)].append(instruction)
+
+    def acyclic(members: typing.Collection['flow.Instruction']) -> bool:
+        """Check none of the region inputs depends on the region itself."""
+        region = set(members)
+        seen = set()
+        stack = [a for m in members for a in args[m] if a not in region]
+        while stack:
+            instruction = stack.pop()
+            if instruction in region:
+                return False
+            if instruction not in seen:
+                seen.add(instruction)
+                stack.extend(args[instruction])
+        return True
+
+    regions: list[list['flow.Instruction']] = []
+    for functor, members in merged.items():
+        if functor not in branched:  # hinted functor with all of its branches nested in an outer region
+            continue
+        if acyclic(members):
+            regions.append(members)
+        else:  # falling back to fusing the individual branches
+            LOGGER.debug('Unable to fuse all %s branches into a single region', functor)
+            regions.extend(branched[functor].values())
+
+    result: dict['flow.Instruction', tuple['flow.Instruction']] = dict(args)
+    for members in regions:
+        region = set(members)
+        inputs = list(dict.fromkeys(a for m in members for a in args[m] if a not in region))
+        outputs = [m for m in members if not consumers[m] or any(c not in region for c in consumers[m])]
+        LOGGER.debug('Fusing %d instructions into a single region', len(members))
+        fused = Fused([target.Symbol(m, args[m]) for m in members], inputs, outputs)
+        for member in members:
+            del result[member]
+        result[fused] = tuple(inputs)
+        getters = {}
+        for index, output in enumerate(outputs):
+            getters[output] = getter = system.Getter(index)
+            result[getter] = (fused,)
+        for instruction, arguments in result.items():
+            if any(a in getters for a in arguments):
+                result[instruction] = tuple(getters.get(a, a) for a in arguments)
+    return [target.Symbol(i, a) for i, a in result.items()]
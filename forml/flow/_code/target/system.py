@@ -21,6 +21,7 @@ System instructions.
 import logging
 import typing
 import uuid
+from concurrent import futures
 
 import forml
 
@@ -54,21 +55,32 @@ class Loader(target.Instruction):
 
 
 class Dumper(target.Instruction):
-    """Registry based state dumper."""
+    """Registry based state dumper.
+
+    All the (independent) states are dumped concurrently using a pool of threads (the state
+    compression and the storage IO are mostly releasing the GIL).
+    """
+
+    WORKERS = 8
+    """Maximum number of the dumping threads."""
 
     def __init__(self, assets: 'asset.State'):
         self._assets: 'asset.State' = assets
 
-    def execute(self, state: bytes) -> uuid.UUID:  # pylint: disable=arguments-differ
+    def execute(self, *states: bytes) -> typing.Sequence[uuid.UUID]:  # pylint: disable=arguments-differ
         """Instruction functionality.
 
         Args:
-            state: State to be persisted.
+            *states: States to be persisted.
 
         Returns:
-            Absolute state id.
+            Absolute state ids in the order of the states.
         """
-        return self._assets.dump(state)
+        if len(states) < 2:
+            return tuple(self._assets.dump(s) for s in states)
+        LOGGER.debug('Dumping %d states concurrently', len(states))
+        with futures.ThreadPoolExecutor(min(len(states), self.WORKERS), thread_name_prefix='forml-dumper') as pool:
+            return tuple(pool.map(self._assets.dump, states))
 
 
 class Getter(target.Instruction):
@@ -107,10 +119,10 @@ class Committer(target.Instruction):
     def __init__(self, assets: 'asset.State'):
         self._assets: 'asset.State' = assets
 
-    def execute(self, *states: uuid.UUID) -> None:
+    def execute(self, states: typing.Sequence[uuid.UUID]) -> None:  # pylint: disable=arguments-differ
         """Instruction functionality.
 
         Args:
-            *states: Sequence of state IDs.
+            states: Sequence of state IDs.
         """
         self._assets.commit(states)
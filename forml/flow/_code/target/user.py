@@ -121,6 +121,9 @@ class SetState(Preset[bytes]):
 
     def set(self, actor: 'flow.Actor', value: bytes) -> None:
         LOGGER.debug('%s receiving state (%d bytes)', actor, len(value))
+        if Train in self._action and not isinstance(value, bytes):
+            # shared (i.e. memory-mapped) state buffers must not get modified by the training
+            value = bytearray(value)
         params = actor.get_params()
         actor.set_state(value)
         actor.set_params(**params)
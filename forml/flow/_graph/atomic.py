@@ -210,6 +210,7 @@ class Worker(Node):
             super().__init__()
             self.builder: 'flow.Builder' = builder
             self.uid: uuid.UUID = uuid.uuid4()
+            self.origin: typing.Optional[Worker.Group] = None
 
         def __repr__(self):
             return f'{self.builder}[uid={self.uid}]'
@@ -320,6 +321,37 @@ class Worker(Node):
         """
         return frozenset(self._group)
 
+    @property
+    def origin(self) -> typing.Optional[uuid.UUID]:
+        """Return the ID of the group whose trained state is used to initialize this group prior to
+        its training (if any).
+
+        Returns:
+            Origin group ID or None.
+        """
+        return self._group.origin.uid if self._group.origin else None
+
+    def warm(self, origin: 'flow.Worker') -> None:
+        """Initialize the state of this worker group prior to its training using the trained state
+        of the given origin worker group (*warm start*).
+
+        Whether the training then continues from the initial state or starts over again is up to
+        the particular actor implementation.
+
+        Args:
+            origin: Worker of the group providing the initial state.
+        """
+        if not (self.stateful and origin.stateful):
+            raise _exception.TopologyError('Stateless warm start')
+        if origin.builder.actor is not self.builder.actor:
+            raise _exception.TopologyError('Warm start actor mismatch')
+        group = origin._group
+        while group:
+            if group is self._group:
+                raise _exception.TopologyError('Warm start cycle')
+            group = group.origin
+        self._group.origin = origin._group
+
     def train(self, train: 'flow.Publishable', label: 'flow.Publishable') -> None:
         """Subscribe this node *Train* and *Label* ports to the given publishers.
 
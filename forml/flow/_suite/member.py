@@ -19,6 +19,7 @@
 Flow members represent partial pipeline blocks during pipeline assembly.
 """
 import abc
+import copy
 import typing
 import weakref
 
@@ -51,6 +52,33 @@ class Composable(metaclass=abc.ABCMeta):
             Trunk instance representing the composed task graph.
         """
 
+    @property
+    def terms(self) -> typing.Sequence['flow.Composable']:
+        """The flattened sequence of the elementary terms of this (possibly compound) expression in
+        the order of their composition.
+
+        Returns:
+            Sequence of the expression terms.
+        """
+        return (self,)
+
+    def split(self, count: int) -> tuple['flow.Composable', 'flow.Composable']:
+        """Split this expression into the part made of its leading terms and the remainder.
+
+        Unlike recomposing the flattened :attr:`terms`, both parts retain the original composition
+        structure with the remainder composing with an :class:`Origin` in place of the leading
+        part.
+
+        Args:
+            count: Number of the leading terms to be split off.
+
+        Returns:
+            Tuple of the leading part and the remainder of the expression.
+        """
+        if not 0 <= count <= len(self.terms):
+            raise ValueError(f'Invalid split of {self} at {count}')
+        return (self, Origin()) if count else (Origin(), self)
+
     @abc.abstractmethod
     def expand(self) -> 'flow.Trunk':
         """Compose this instance and the entire preceding part of the expression and return the
@@ -82,6 +110,10 @@ class Origin(Composable):
     def expand(self) -> 'flow.Trunk':
         return assembly.Trunk()
 
+    @property
+    def terms(self) -> typing.Sequence['flow.Composable']:
+        return ()
+
 
 class Operator(Composable, metaclass=abc.ABCMeta):  # pylint: disable=abstract-method
     """Base class for operator implementations."""
@@ -121,3 +153,33 @@ class Compound(Composable):
 
     def expand(self) -> 'flow.Trunk':
         return self._right.compose(self._left)
+
+    @property
+    def terms(self) -> typing.Sequence['flow.Composable']:
+        return self._left.terms + self._right.terms
+
+    def split(self, count: int) -> tuple['flow.Composable', 'flow.Composable']:
+        lcount = len(self._left.terms)
+        if count <= lcount:
+            head, tail = self._left.split(count)
+            return head, self._rebuild(self._right, tail)
+        head, tail = self._right.split(count - lcount)
+        return self._rebuild(head, self._left), tail
+
+    def _rebuild(self, right: 'flow.Composable', left: 'flow.Composable') -> 'flow.Composable':
+        """Create a copy of this compound with the given terms.
+
+        The linearity check is bypassed as the terms are shared with this original compound.
+
+        Args:
+            right: Right side composable.
+            left: Left side composable.
+
+        Returns:
+            New compound instance.
+        """
+        if isinstance(left, Origin):
+            return right
+        compound = copy.copy(self)
+        compound._right, compound._left = right, left
+        return compound
@@ -132,7 +132,7 @@ class Actor(typing.Generic[Features, Labels, Result], metaclass=abc.ABCMeta):
         if not self.is_stateful():
             return b''
         LOGGER.debug('Getting %s state', self)
-        return cloudpickle.dumps(self.__dict__)
+        return self._dumps(self.__dict__)
 
     def set_state(self, state: bytes) -> None:
         """Set the new internal state of the actor.
@@ -143,7 +143,8 @@ class Actor(typing.Generic[Features, Labels, Result], metaclass=abc.ABCMeta):
         by :doc:`Python Pickle <python:library/pickle>`.
 
         Args:
-            state: Bytes to be used as internal state.
+            state: Bytes (or any other bytes-like object such as a memory-mapped buffer) to be used
+                   as internal state.
         """
         if not state:
             return
@@ -151,9 +152,33 @@ class Actor(typing.Generic[Features, Labels, Result], metaclass=abc.ABCMeta):
             raise forml.UnexpectedError('State provided but actor stateless')
         LOGGER.debug('Setting %s state (%d bytes)', self, len(state))
         params = self.get_params()  # keep the original hyper-params
-        self.__dict__.update(cloudpickle.loads(state))
+        self.__dict__.update(self._loads(state))
         self.set_params(**params)  # restore the original hyper-params
 
+    @staticmethod
+    def _dumps(state: typing.Any) -> bytes:
+        """Serializer used by the default :meth:`get_state` implementation.
+
+        Args:
+            state: Actor state to be serialized.
+
+        Returns:
+            Serialized state.
+        """
+        return cloudpickle.dumps(state)
+
+    @staticmethod
+    def _loads(state: bytes) -> typing.Any:
+        """Deserializer used by the default :meth:`set_state` implementation.
+
+        Args:
+            state: Serialized state (as any bytes-like object).
+
+        Returns:
+            Deserialized actor state.
+        """
+        return cloudpickle.loads(state)
+
     def get_params(self) -> typing.Mapping[str, typing.Any]:
         """Get the current hyper-parameters of the actor.
 
@@ -255,6 +280,33 @@ class Builder(typing.Generic[_Actor], metaclass=abc.ABCMeta):
         """
         return self.actor.builder(*args, **kwargs)
 
+    @property
+    def hints(self) -> typing.Mapping[str, typing.Any]:
+        """Runtime execution hints of this builder (see :meth:`hint`)."""
+        return types.MappingProxyType({})
+
+    def hint(self, **hints: typing.Any) -> 'flow.Builder[_Actor]':
+        """Return new builder carrying the given runtime execution hints.
+
+        Hints are just optional advice to the runners or the evaluation methods (which are free to
+        ignore them) not affecting the actual actor. Currently recognized hints are:
+
+        * ``coschedule`` - number of consecutive output ports of this (multi-output) actor
+          constituting an independent *branch* (i.e. a cross-validation fold); signals the
+          downstream branches can be co-scheduled within a single process sharing the payload
+          memory (see :func:`flow.fuse <forml.flow.fuse>`).
+        * ``warm`` - the (stateful) actor is able to continue its training from an initial state
+          it has been *warm-started* with; opts the actor in for the warm-start chaining of the
+          :class:`evaluation.WalkForward <forml.evaluation.WalkForward>` windows.
+
+        Args:
+            hints: Hints to be added.
+
+        Returns:
+            New builder instance with the hints.
+        """
+        return Hinted(self, hints)
+
     def __repr__(self):
         return name(self.actor, *self.args, **self.kwargs)
 
@@ -286,3 +338,46 @@ class Spec(collections.namedtuple('Spec', 'actor, args, kwargs'), Builder[_Actor
 
     def __repr__(self) -> str:
         return Builder.__repr__(self)
+
+
+class Hinted(collections.namedtuple('Hinted', 'builder, extra'), Builder[_Actor]):
+    """Builder decorator carrying the runtime execution hints.
+
+    Args:
+        builder: Original builder.
+        extra: Hints to be added to the original ones.
+    """
+
+    builder: Builder[_Actor]
+    extra: typing.Mapping[str, typing.Any]
+
+    def __new__(cls, builder: Builder[_Actor], extra: typing.Mapping[str, typing.Any]):
+        return super().__new__(cls, builder, types.MappingProxyType(dict(extra)))
+
+    def __getnewargs__(self):
+        return self.builder, dict(self.extra)
+
+    def __repr__(self) -> str:
+        return Builder.__repr__(self)
+
+    @property
+    def actor(self) -> type[_Actor]:
+        return self.builder.actor
+
+    @property
+    def args(self) -> typing.Sequence[typing.Any]:
+        return self.builder.args
+
+    @property
+    def kwargs(self) -> typing.Mapping[str, typing.Any]:
+        return self.builder.kwargs
+
+    @property
+    def hints(self) -> typing.Mapping[str, typing.Any]:
+        return types.MappingProxyType(self.builder.hints | self.extra)
+
+    def update(self, *args, **kwargs) -> 'flow.Builder[_Actor]':
+        return Hinted(self.builder.update(*args, **kwargs), self.extra)
+
+    def reset(self, *args, **kwargs) -> 'flow.Builder[_Actor]':
+        return Hinted(self.builder.reset(*args, **kwargs), self.extra)
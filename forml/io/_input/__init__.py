@@ -23,9 +23,13 @@ import functools
 import logging
 import typing
 
+import numpy
+import pandas
+
 import forml
 from forml import flow, provider, setup
 from forml.io import dsl as dslmod
+from forml.io.dsl import function
 from forml.io.dsl import parser as parsmod
 
 from . import _producer
@@ -108,6 +112,51 @@ class Feed(
         train_actor: flow.Builder[extmod.Driver] = actor(train_driver, train_statement)
         return extmod.Operator(apply_actor, train_actor, label_actor)
 
+    def watermark(
+        self,
+        extract: 'project.Source.Extract',
+        lower: typing.Optional['dsl.Native'] = None,
+    ) -> typing.Optional['dsl.Native']:
+        """Determine the current *watermark* (the maximum ordinal value) of the train-mode data
+        available above the given lower bound.
+
+        This is used for fixing the upper bound of an *incremental* training extract before
+        launching the actual pipeline so that the persisted watermark exactly matches the slice of
+        data the models have been trained on.
+
+        Args:
+            extract: Datasource extract component.
+            lower: Optional ordinal lower bound.
+
+        Returns:
+            The maximum ordinal value or None if no data available.
+
+        Raises:
+            forml.InvalidError: If the extract has no ordinal.
+        """
+        if not extract.ordinal:
+            raise forml.InvalidError('Watermark requires an ordinal')
+        column = extract.ordinal.column
+        query = extract.train.query
+        statement = (
+            dslmod.Query(query.source, [column.alias('watermark')], query.prefilter)
+            .where(function.NotNull(column))
+            .orderby(dslmod.Ordering(column, dslmod.Ordering.Direction.DESCENDING))
+            .limit(1)
+        )
+        where = extract.ordinal.where(lower, None)
+        if where is not None:
+            statement = statement.where(where)
+        producer = self.producer(self.sources, self.features, **self._readerkw)
+        values = producer(statement).to_columns()[0]
+        if not len(values) or pandas.isna(values[0]):  # pylint: disable=use-implicit-booleaness-not-len
+            return None
+        value = column.kind.cast(values[0])
+        # turning into plain python types suitable for the tag serialization
+        if isinstance(value, pandas.Timestamp):
+            return value.to_pydatetime()
+        return value.item() if isinstance(value, numpy.generic) else value
+
     @classmethod
     def producer(
         cls,
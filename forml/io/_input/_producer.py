@@ -19,15 +19,20 @@
 Producer implementation.
 """
 import abc
+import collections
 import functools
 import itertools
 import logging
+import operator
+import threading
 import typing
 
+import numpy
 import pandas
 
 import forml
 from forml import flow
+from forml.io import dsl as dslmod
 from forml.io import layout as laymod
 from forml.io.dsl import parser as parsmod
 
@@ -54,10 +59,74 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Feature, laymod.Native], met
       be returned but potentially incomplete in terms of the expected schema; in which case
       the reader is supposed to just complete the partial data to match the ``query`` schema.
 
-    Todo:
-        Implement the augmentation mode.
+    In the augmentation mode, the entry fields matching the query schema are treated as the
+    *entity keys* used for looking up the remaining features using a single batched query
+    (restricting the original query to the requested keys). The retrieved records (as well as the
+    keys not found in the storage) are kept in an in-process LRU cache (of the :attr:`CACHE_SIZE`
+    capacity) keyed by the entity key values so that repeated requests for hot keys don't hit the
+    storage again.
     """
 
+    class Cache:
+        """Thread-safe LRU cache of the augmentation records keyed by the statement and the entity
+        key values.
+
+        The cache content is process-local and doesn't survive serialization.
+
+        Args:
+            size: Maximum number of records to keep.
+        """
+
+        def __init__(self, size: int):
+            self._size: int = size
+            self._records: collections.OrderedDict[typing.Hashable, tuple] = collections.OrderedDict()
+            self._lock: threading.Lock = threading.Lock()
+
+        def __getstate__(self):
+            return self._size
+
+        def __setstate__(self, size: int):
+            self.__init__(size)
+
+        def __len__(self):
+            return len(self._records)
+
+        def get(self, key: typing.Hashable) -> typing.Optional[tuple]:
+            """Retrieve the record for the given key (if cached) marking it as recently used.
+
+            Args:
+                key: Record key.
+
+            Returns:
+                Cached record or None if not found.
+            """
+            with self._lock:
+                record = self._records.get(key)
+                if record is not None:
+                    self._records.move_to_end(key)
+                return record
+
+        def put(self, key: typing.Hashable, record: tuple) -> None:
+            """Store the record evicting the least recently used ones beyond the capacity.
+
+            Args:
+                key: Record key.
+                record: Record to be cached.
+            """
+            if self._size <= 0:
+                return
+            with self._lock:
+                self._records[key] = record
+                self._records.move_to_end(key)
+                while len(self._records) > self._size:
+                    self._records.popitem(last=False)
+
+    CACHE_SIZE: int = 1024
+    """Capacity of the augmentation records LRU cache."""
+
+    LOOKUP_SIZE: int = 500
+    """Maximum number of the entity keys looked up using a single query."""
+
     def __init__(
         self,
         sources: typing.Mapping['dsl.Source', 'parser.Source'],
@@ -67,6 +136,7 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Feature, laymod.Native], met
         self._sources: typing.Mapping['dsl.Source', 'parser.Source'] = sources
         self._features: typing.Mapping['dsl.Feature', 'parser.Feature'] = features
         self._kwargs: typing.Mapping[str, typing.Any] = kwargs
+        self._cache: Reader.Cache = self.Cache(self.CACHE_SIZE)
 
     def __repr__(self):
         return flow.name(self.__class__, **self._kwargs)
@@ -85,8 +155,7 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Feature, laymod.Native], met
         if entry:
             complete, indices = self._match_entry(statement.schema, entry.schema)
             if not complete:
-                # here we would go into augmentation mode - when implemented
-                raise forml.MissingError('Augmentation not supported - please provide all features')
+                return self._augment(statement, entry)
             data = entry.data.take_columns(indices) if indices else entry.data
             return self._cast(statement.schema, entry.schema, data)
 
@@ -100,6 +169,10 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Feature, laymod.Native], met
     ) -> 'layout.Tabular':
         """Helper for attempting to cast the data to the expected schema.
 
+        Mismatching columns are cast as a whole using the vectorized
+        :meth:`dsl.Any.cast_column <forml.io.dsl.Any.cast_column>` while the matching ones are
+        reused without copying.
+
         Args:
             expected: Target schema.
             actual: Source schema.
@@ -114,15 +187,123 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Feature, laymod.Native], met
         if actual == expected:
             return data
         columns = {
-            e.name: c if e.kind.match(a.kind) else [e.kind.cast(v) for v in c]
+            e.name: c if e.kind.match(a.kind) else e.kind.cast_column(pandas.Series(c, copy=False))
             for e, a, c in zip(expected, actual, data.to_columns())
         }
-        return laymod.Frame(pandas.DataFrame(columns))
+        return laymod.Frame(pandas.DataFrame(columns, copy=False))
+
+    def _augment(self, statement: 'dsl.Statement', entry: 'layout.Entry') -> 'layout.Tabular':
+        """Augmentation mode implementation completing the partial entry by looking up the missing
+        features using the entry fields matching the query schema as the entity keys.
+
+        Records not found in the LRU cache are retrieved using a single query (per each
+        :attr:`LOOKUP_SIZE` batch) restricted to the requested keys. Keys not found in the storage
+        yield empty features (and get cached as such too). If multiple records match the same key,
+        the first one (according to the query ordering) is used.
+
+        Args:
+            statement: The query DSL specifying the expected data.
+            entry: Partial data containing the entity keys.
+
+        Returns:
+            Entry data completed according to the query.
+
+        Raises:
+            forml.MissingError: If the entry doesn't contain any of the query fields.
+        """
+        names = [f.name for f in statement.schema]
+        supplied = [(names.index(f.name), i) for i, f in enumerate(entry.schema) if f.name in names]
+        if not supplied:
+            raise forml.MissingError('Augmentation requires the entry to contain some of the query fields as keys')
+        positions, indices = zip(*supplied)
+        keys = [
+            tuple(v.item() if isinstance(v, numpy.generic) else v for v in k)
+            for k in zip(*entry.data.take_columns(indices).to_columns())
+        ]
+
+        def blank(key: tuple) -> tuple:
+            """Record with just the keys and empty features for keys not found in the storage."""
+            values = dict(zip(positions, key))
+            return tuple(values.get(i) for i in range(len(names)))
+
+        records = {k: r for k in keys if (r := self._cache.get((statement, positions, k))) is not None}
+        missing = [k for k in dict.fromkeys(keys) if k not in records]
+        for offset in range(0, len(missing), self.LOOKUP_SIZE):
+            batch = missing[offset : offset + self.LOOKUP_SIZE]  # noqa: E203
+            found = {}
+            for record in self._lookup(statement, positions, batch):
+                key = tuple(record[p] for p in positions)
+                if key in found:
+                    LOGGER.warning('Ambiguous augmentation key %s - using the first matching record', key)
+                    continue
+                found[key] = record
+            for key in batch:
+                records[key] = found.get(key) or blank(key)
+                self._cache.put((statement, positions, key), records[key])
+
+        kinds = {f.name: f.kind for f in entry.schema}
+        actual = dslmod.Schema.from_fields(
+            *(dslmod.Field(kinds.get(f.name, f.kind), name=f.name) for f in statement.schema)
+        )
+        data = laymod.Frame(pandas.DataFrame([records[k] for k in keys], columns=names).infer_objects())
+        return self._cast(statement.schema, actual, data)
+
+    def _lookup(
+        self, statement: 'dsl.Statement', positions: typing.Sequence[int], keys: typing.Collection[tuple]
+    ) -> typing.Iterable[tuple]:
+        """Retrieve the query records for the given entity keys using a single batched query.
+
+        The lookup is based on the original query stripped of its row limits restricted to the
+        matching key values (using the ``IN`` predicate for single-field keys or a balanced
+        disjunction of the key conjunctions otherwise). It bypasses the parsing cache as the
+        statement is specific to the particular key batch.
+
+        Args:
+            statement: The query DSL specifying the expected data.
+            positions: Indices of the key fields within the query schema.
+            keys: Entity key values to look up.
+
+        Returns:
+            Records matching the given keys.
+        """
+        query = statement.query
+        features = [f.operable for f in (query.features[p] for p in positions)]
+
+        def disjunction(predicates: typing.Sequence['dsl.Predicate']) -> 'dsl.Predicate':
+            """Balanced OR tree of the given predicates (to keep the expression depth logarithmic)."""
+            if len(predicates) == 1:
+                return predicates[0]
+            middle = len(predicates) // 2
+            return disjunction(predicates[:middle]) | disjunction(predicates[middle:])
+
+        if len(features) == 1:
+            condition = dslmod.function.IsIn(features[0], *(k for (k,) in keys))
+        else:
+            condition = disjunction(
+                [functools.reduce(operator.and_, (f == v for f, v in zip(features, k))) for k in keys]
+            )
+        lookup = dslmod.Query(
+            query.source, query.selection, query.prefilter, query.grouping, query.postfilter, query.ordering
+        )
+        lookup = lookup.where(condition)
+        LOGGER.debug('Looking up %d keys for augmentation', len(keys))
+        data = self.format(lookup.schema, self.read(self._parse(lookup), **self._kwargs))
+        return zip(*data.to_columns())
 
     @functools.lru_cache
     def _parse_statement(self, statement: 'dsl.Statement') -> 'parser.Source':
         """Helper for parsing the statement into the target representation.
 
+        Args:
+            statement: DSL query statement.
+
+        Returns: Statement in the target representation.
+        """
+        return self._parse(statement)
+
+    def _parse(self, statement: 'dsl.Statement') -> 'parser.Source':
+        """Uncached implementation of the statement parsing.
+
         Args:
             statement: DSL query statement.
 
@@ -22,9 +22,11 @@ Specific metadata types used by the execution layer.
 from ._access import Instance, State
 from ._directory import Level
 from ._directory.level import Directory, Generation, Project, Release, Tag
+from ._format import deserialize, serialize
 from ._persistent import TMPDIR, Inventory, Registry, mkdtemp
 
 __all__ = [
+    'deserialize',
     'Directory',
     'Generation',
     'Instance',
@@ -34,6 +36,7 @@ __all__ = [
     'Project',
     'Registry',
     'Release',
+    'serialize',
     'State',
     'Tag',
     'TMPDIR',
@@ -88,18 +88,19 @@ class State:
         LOGGER.debug('Loading state %s', gid)
         return self._generation.get(self.offset(gid))
 
-    def dump(self, state: bytes) -> uuid.UUID:
+    def dump(self, state: typing.Union[bytes, typing.BinaryIO, typing.Iterable[bytes]]) -> uuid.UUID:
         """Dump an anonymous state to the repository returning its associated state ID.
 
         The caller is expected to send that state ID under given offset to the ``.commit()`` method.
 
         Args:
-            state: State to be dumped.
+            state: State to be dumped (bytes-like object, readable file-like object or iterable
+                   of bytes-like chunks).
 
         Returns:
             Associated absolute state ID.
         """
-        LOGGER.debug('Dumping state (%d bytes)', len(state))
+        LOGGER.debug('Dumping state')
         return self._generation.release.dump(state)
 
     def commit(self, states: typing.Sequence[uuid.UUID]) -> None:
@@ -0,0 +1,315 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+State storage compression.
+
+Compressed states are persisted using the following frame layout::
+
+    MAGIC | codec: uint8 | compressed payload | crc32: uint32 (of the uncompressed data)
+
+States stored without any compression are persisted as is (without framing).
+"""
+import abc
+import functools
+import importlib
+import logging
+import lzma
+import struct
+import types
+import typing
+import zlib
+
+import forml
+
+LOGGER = logging.getLogger(__name__)
+
+MAGIC = b'\x00FORMLZ\x00'
+CHUNK = 1 << 20
+_CODEC = struct.Struct('<B')
+_CRC = struct.Struct('<I')
+
+
+class Compression(abc.ABC):
+    """Base class for the (streaming) state compression codecs.
+
+    Args:
+        level: Optional codec-specific compression level.
+    """
+
+    class Compressor(typing.Protocol):
+        """Streaming compressor interface."""
+
+        def compress(self, data: bytes) -> bytes:
+            """Compress the next chunk of data."""
+
+        def flush(self) -> bytes:
+            """Finish the compression stream."""
+
+    ALIASES: dict[str, type['Compression']] = {}
+    CODES: dict[int, type['Compression']] = {}
+
+    alias: str
+    """Codec alias as used in configuration."""
+    code: int
+    """Codec identifier as persisted in the frame header."""
+
+    def __init_subclass__(cls, alias: str, code: int, **kwargs):
+        super().__init_subclass__(**kwargs)
+        assert code not in Compression.CODES, f'Duplicate compression code {code}'
+        cls.alias = alias
+        cls.code = code
+        Compression.ALIASES[alias] = Compression.CODES[code] = cls
+
+    def __init__(self, level: typing.Optional[int] = None):
+        self._level: typing.Optional[int] = level
+
+    def __repr__(self):
+        return f'{self.alias}({self._level if self._level is not None else ""})'
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and other._level == self._level
+
+    def __hash__(self):
+        return hash(self.__class__) ^ hash(self._level)
+
+    @classmethod
+    def get(cls, alias: str, level: typing.Optional[int] = None) -> 'Compression':
+        """Get the codec instance by its alias.
+
+        Args:
+            alias: Codec alias.
+            level: Optional compression level.
+
+        Returns:
+            Codec instance.
+
+        Raises:
+            forml.MissingError: If unknown codec.
+        """
+        if alias not in cls.ALIASES:
+            raise forml.MissingError(f'Unknown compression: {alias} (available: {", ".join(cls.ALIASES)})')
+        return cls.ALIASES[alias](level)
+
+    @staticmethod
+    def _module(name: str) -> types.ModuleType:
+        """Helper for importing an optional codec module.
+
+        Args:
+            name: Module name.
+
+        Returns:
+            Imported module.
+
+        Raises:
+            forml.MissingError: If the module is not installed.
+        """
+        try:
+            return importlib.import_module(name)
+        except ModuleNotFoundError as err:
+            raise forml.MissingError(f'Compression codec requires the {name.split(".")[0]} package') from err
+
+    @abc.abstractmethod
+    def compressor(self) -> 'Compression.Compressor':
+        """Create a new streaming compressor.
+
+        Returns:
+            Compressor instance.
+        """
+
+    @abc.abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress the entire payload.
+
+        Args:
+            data: Compressed payload.
+
+        Returns:
+            Decompressed data.
+        """
+
+
+class Plain(Compression, alias='none', code=0):
+    """Dummy codec used for just the checksum framing without any actual compression."""
+
+    class Compressor:
+        """Identity compressor."""
+
+        @staticmethod
+        def compress(data: bytes) -> bytes:
+            return bytes(data)
+
+        @staticmethod
+        def flush() -> bytes:
+            return b''
+
+    def compressor(self) -> 'Compression.Compressor':
+        return self.Compressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        return bytes(data)
+
+
+class Zlib(Compression, alias='zlib', code=1):
+    """Standard library zlib codec."""
+
+    def compressor(self) -> 'Compression.Compressor':
+        return zlib.compressobj(self._level if self._level is not None else zlib.Z_DEFAULT_COMPRESSION)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class Lzma(Compression, alias='lzma', code=2):
+    """Standard library lzma codec."""
+
+    def compressor(self) -> 'Compression.Compressor':
+        return lzma.LZMACompressor(preset=self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lzma.decompress(data)
+
+
+class Zstd(Compression, alias='zstd', code=3):
+    """Zstandard codec (requires the ``zstandard`` package)."""
+
+    def compressor(self) -> 'Compression.Compressor':
+        zstd = self._module('zstandard')
+        return zstd.ZstdCompressor(level=self._level if self._level is not None else 3).compressobj()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._module('zstandard').ZstdDecompressor().decompressobj().decompress(data)
+
+
+class Lz4(Compression, alias='lz4', code=4):
+    """LZ4 frame codec (requires the ``lz4`` package)."""
+
+    class Compressor:
+        """Adapter of the LZ4 frame compressor emitting the frame header with the first chunk."""
+
+        def __init__(self, compressor):
+            self._compressor = compressor
+            self._header: bytes = compressor.begin()
+
+        def compress(self, data: bytes) -> bytes:
+            header, self._header = self._header, b''
+            return header + self._compressor.compress(data)
+
+        def flush(self) -> bytes:
+            header, self._header = self._header, b''
+            return header + self._compressor.flush()
+
+    def compressor(self) -> 'Compression.Compressor':
+        lz4 = self._module('lz4.frame')
+        return self.Compressor(lz4.LZ4FrameCompressor(compression_level=self._level or 0))
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._module('lz4.frame').decompress(data)
+
+
+def chunks(state: typing.Union[bytes, typing.BinaryIO, typing.Iterable[bytes]]) -> typing.Iterator[bytes]:
+    """Iterate over the content of the given state in chunks.
+
+    Args:
+        state: Serialized state provided either as a bytes-like object, a readable file-like object
+               or an iterable of bytes-like chunks.
+
+    Returns:
+        Iterator of the state chunks.
+    """
+    try:
+        view = memoryview(state)
+    except TypeError:
+        if hasattr(state, 'read'):
+            state = iter(functools.partial(state.read, CHUNK), b'')
+        yield from state
+        return
+    for offset in range(0, view.nbytes, CHUNK):
+        end = offset + CHUNK
+        yield view[offset:end]
+
+
+def buffered(state: typing.Union[bytes, typing.BinaryIO, typing.Iterable[bytes]]) -> bytes:
+    """Get the given state as a bytes-like object (reading it all if provided as a stream).
+
+    Args:
+        state: Serialized state (see :func:`chunks` for the accepted forms).
+
+    Returns:
+        Bytes-like state.
+    """
+    try:
+        memoryview(state)
+    except TypeError:
+        return b''.join(chunks(state))
+    return state
+
+
+def encode(
+    state: typing.Union[bytes, typing.BinaryIO, typing.Iterable[bytes]],
+    sink: typing.BinaryIO,
+    compression: typing.Optional[Compression],
+) -> None:
+    """Write the state into the given sink (compressed and framed if requested).
+
+    The state is processed in chunks to avoid creating a compressed copy of the entire state in
+    memory.
+
+    Args:
+        state: Serialized state to be persisted (see :func:`chunks` for the accepted forms).
+        sink: File-like object to write into.
+        compression: Optional compression codec.
+    """
+    if compression is None:
+        for chunk in chunks(state):
+            sink.write(chunk)
+        return
+    compressor = compression.compressor()
+    checksum = 0
+    sink.write(MAGIC + _CODEC.pack(compression.code))
+    for chunk in chunks(state):
+        checksum = zlib.crc32(chunk, checksum)
+        sink.write(compressor.compress(chunk))
+    sink.write(compressor.flush())
+    sink.write(_CRC.pack(checksum))
+
+
+def decode(data: bytes) -> bytes:
+    """Decode the state possibly previously compressed using :func:`encode`.
+
+    Args:
+        data: Raw persisted data.
+
+    Returns:
+        Decompressed state (or the original data if not compressed).
+
+    Raises:
+        forml.InvalidError: If the state checksum doesn't match.
+    """
+    view = memoryview(data)
+    if view[: len(MAGIC)] != MAGIC:
+        return data
+    (code,) = _CODEC.unpack_from(view, len(MAGIC))
+    if code not in Compression.CODES:
+        raise forml.InvalidError(f'Unknown compression code: {code}')
+    start = len(MAGIC) + _CODEC.size
+    end = view.nbytes - _CRC.size
+    state = Compression.CODES[code]().decompress(view[start:end])
+    (checksum,) = _CRC.unpack_from(view, end)
+    if zlib.crc32(state) != checksum:
+        raise forml.InvalidError('State checksum mismatch')
+    return state
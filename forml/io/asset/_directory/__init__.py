@@ -19,8 +19,13 @@ Generic assets directory.
 """
 
 import abc
-import functools
+import collections
 import logging
+import math
+import mmap
+import sys
+import threading
+import time
 import typing
 
 import forml
@@ -29,6 +34,7 @@ if typing.TYPE_CHECKING:
     from forml.io import asset
 
 LOGGER = logging.getLogger(__name__)
+KEEP: typing.Any = object()  # sentinel for the unspecified cache limits
 
 
 class Level(metaclass=abc.ABCMeta):
@@ -134,27 +140,181 @@ class Level(metaclass=abc.ABCMeta):
 
 
 class Cache:
-    """Helper for caching registry method calls."""
-
-    def __init__(self, method: typing.Callable):
+    """Thread-safe LRU cache of registry method calls with optional entry-count and byte-size
+    budgets, time-to-live expiration and hit/miss metrics.
+
+    Entries are keyed by the registry instance plus the call arguments and can be explicitly
+    invalidated (i.e. when a registry signals a new generation) using the :meth:`invalidate` hook.
+
+    Args:
+        method: Registry method to be cached.
+        size: Maximum number of cached entries (unlimited if None).
+        budget: Maximum total size of the cached values in bytes (unlimited if None).
+        ttl: Time-to-live of the cached entries in seconds (no expiration if None).
+        sizer: Callback for estimating the size of the cached values in bytes (defaults to the
+               length of bytes-like values including memory-mapped files).
+        key: Optional callback receiving the registry and the call arguments returning the
+             arguments to key the entry with (all the call arguments if None).
+    """
+
+    class Info(typing.NamedTuple):
+        """Cache metrics."""
+
+        hits: int
+        misses: int
+        maxsize: typing.Optional[int]
+        currsize: int
+        budget: typing.Optional[int]
+        nbytes: int
+        evictions: int
+        expirations: int
+
+    class Entry(typing.NamedTuple):
+        """Cached value with its metadata."""
+
+        value: typing.Any
+        size: int
+        expires: float
+
+    def __init__(
+        self,
+        method: typing.Callable,
+        size: typing.Optional[int] = 128,
+        budget: typing.Optional[int] = None,
+        ttl: typing.Optional[float] = None,
+        sizer: typing.Callable[[typing.Any], int] = lambda v: (
+            len(v) if isinstance(v, (bytes, bytearray, memoryview, mmap.mmap)) else sys.getsizeof(v)
+        ),
+        key: typing.Optional[typing.Callable[..., tuple]] = None,
+    ):
         self._method: str = method.__name__
+        self._size: typing.Optional[int] = size
+        self._budget: typing.Optional[int] = budget
+        self._ttl: typing.Optional[float] = ttl
+        self._sizer: typing.Callable[[typing.Any], int] = sizer
+        self._key: typing.Optional[typing.Callable[..., tuple]] = key
+        self._entries: collections.OrderedDict[tuple, Cache.Entry] = collections.OrderedDict()
+        self._lock: threading.RLock = threading.RLock()
+        self._nbytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._expirations: int = 0
 
     def __repr__(self):
         return repr(self.info)
 
-    @functools.lru_cache
     def __call__(self, registry: 'asset.Registry', *args, **kwargs):
-        return getattr(registry, self._method)(*args, **kwargs)
+        if self._key:
+            key = registry, self._key(registry, *args, **kwargs), frozenset()
+        else:
+            key = registry, args, frozenset(kwargs.items())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires > time.monotonic():
+                    self._hits += 1
+                    self._entries.move_to_end(key)
+                    return entry.value
+                self._expirations += 1
+                self._drop(key)
+            self._misses += 1
+        value = getattr(registry, self._method)(*args, **kwargs)
+        entry = self.Entry(value, self._sizer(value), time.monotonic() + self._ttl if self._ttl else math.inf)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if self._budget is None or entry.size <= self._budget:
+                self._entries[key] = entry
+                self._nbytes += entry.size
+                self._trim()
+            else:
+                LOGGER.debug('Not caching %s result exceeding the budget (%d bytes)', self._method, entry.size)
+        return value
+
+    def _drop(self, key: tuple) -> None:
+        """Remove the given entry (lock must be held by the caller).
+
+        Args:
+            key: Entry key.
+        """
+        self._nbytes -= self._entries.pop(key).size
+
+    def _trim(self) -> None:
+        """Evict the least recently used entries exceeding any of the limits (lock must be held by
+        the caller)."""
+        while self._entries and (
+            (self._size is not None and len(self._entries) > self._size)
+            or (self._budget is not None and self._nbytes > self._budget)
+        ):
+            self._drop(next(iter(self._entries)))
+            self._evictions += 1
+
+    def configure(
+        self,
+        size: typing.Optional[int] = KEEP,
+        budget: typing.Optional[int] = KEEP,
+        ttl: typing.Optional[float] = KEEP,
+    ) -> None:
+        """Reconfigure the cache limits (evicting entries exceeding the new limits).
+
+        Limits not specified keep their current values. The new TTL only applies to entries
+        cached from now on.
+
+        Args:
+            size: Maximum number of cached entries (unlimited if None).
+            budget: Maximum total size of the cached values in bytes (unlimited if None).
+            ttl: Time-to-live of the cached entries in seconds (no expiration if None).
+        """
+        with self._lock:
+            if size is not KEEP:
+                self._size = size
+            if budget is not KEEP:
+                self._budget = budget
+            if ttl is not KEEP:
+                self._ttl = ttl
+            self._trim()
+
+    def invalidate(self, registry: 'asset.Registry', *prefix: typing.Any) -> int:
+        """Drop all entries of the given registry whose call arguments start with the given prefix.
+
+        Args:
+            registry: Registry instance whose entries to drop.
+            prefix: Leading call arguments of the entries to drop (all entries of the registry if
+                    empty).
+
+        Returns:
+            Number of dropped entries.
+        """
+        with self._lock:
+            keys = [k for k in self._entries if k[0] == registry and k[1][: len(prefix)] == prefix]
+            for key in keys:
+                self._drop(key)
+        if keys:
+            LOGGER.debug('Invalidated %d %s entries', len(keys), self._method)
+        return len(keys)
 
     def clear(self) -> None:
-        """Clear the cache."""
-        self.__call__.cache_clear()  # pylint: disable=no-member
+        """Clear the cache (including its metrics)."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = self._hits = self._misses = self._evictions = self._expirations = 0
 
     @property
-    def info(self) -> functools._CacheInfo:  # pylint: disable=protected-access
+    def info(self) -> 'Cache.Info':
         """Return the cache info.
 
         Returns:
             Cache info tuple.
         """
-        return self.__call__.cache_info()  # pylint: disable=no-member
+        with self._lock:
+            return self.Info(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._size,
+                currsize=len(self._entries),
+                budget=self._budget,
+                nbytes=self._nbytes,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
@@ -23,7 +23,7 @@ import uuid
 
 from packaging import version as vermod
 
-from ... import _directory, _persistent
+from ... import _compression, _directory, _persistent
 from . import minor as genmod
 
 if typing.TYPE_CHECKING:
@@ -74,20 +74,24 @@ class Release(_directory.Level):
         """
         return ARTIFACTS(self.registry, self.project.key, self.key)
 
-    def dump(self, state: bytes) -> uuid.UUID:
+    def dump(self, state: typing.Union[bytes, typing.BinaryIO, typing.Iterable[bytes]]) -> uuid.UUID:
         """Dump an unbound state (not belonging to any project) under given state id.
 
         An unbound state is expected to be committed later into a new generation of specific release.
 
         Args:
-            state: Serialized state to be persisted.
+            state: Serialized state to be persisted provided either as a bytes-like object, a
+                   readable file-like object or an iterable of bytes-like chunks (which gets
+                   buffered if the registry is content-addressed to identify the state upfront).
 
         Returns:
             Associated state id.
         """
-        sid = uuid.uuid4()
+        if self.registry.addressed:
+            state = _compression.buffered(state)
+        sid = self.registry.identify(state)
         LOGGER.debug('%s: Dumping state %s', self, sid)
-        self.registry.write(self.project.key, self.key, sid, state)
+        self.registry.dump(self.project.key, self.key, sid, state)
         return sid
 
     def list(self) -> _directory.Level.Listing:
@@ -124,4 +128,5 @@ class Release(_directory.Level):
         except self.Listing.Empty:
             generation = 1
         self.registry.close(self.project.key, self.key, generation, tag)
+        genmod.TAGS.invalidate(self.registry, self.project.key, self.key)
         return self.get(generation)
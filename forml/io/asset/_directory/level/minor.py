@@ -32,6 +32,8 @@ from forml.io import dsl
 from ... import _directory, _persistent
 
 if typing.TYPE_CHECKING:
+    from forml.io import asset
+
     from . import case as prjmod
     from . import major as lngmod
 
@@ -175,8 +177,23 @@ class Tag(collections.namedtuple('Tag', 'training, tuning, states')):
 
 
 NOTAG = Tag()
-TAGS = _directory.Cache(_persistent.Registry.open)
-STATES = _directory.Cache(_persistent.Registry.read)
+TAGS = _directory.Cache(_persistent.Registry.open, size=1024, budget=16 << 20, ttl=600)
+
+
+def _address(
+    registry: 'asset.Registry',
+    project: 'asset.Project.Key',
+    release: 'asset.Release.Key',
+    generation: 'asset.Generation.Key',
+    sid: uuid.UUID,
+) -> tuple:
+    """States cache key - content-addressed states are shared across generations of the release."""
+    if registry.addressed:
+        return project, release, sid
+    return project, release, generation, sid
+
+
+STATES = _directory.Cache(_persistent.Registry.load, size=None, budget=1 << 30, key=_address)
 
 
 # pylint: disable=unsubscriptable-object; https://github.com/PyCQA/pylint/issues/2822
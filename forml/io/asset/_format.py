@@ -0,0 +1,103 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+State serialization format.
+
+Objects exposing *out-of-band* buffers (i.e. numpy arrays) when pickled using protocol 5 get
+serialized into a container with the following layout (all integers little-endian)::
+
+    MAGIC | count: uint32 | count x (offset: uint64, length: uint64) | segments...
+
+where the first segment is the pickle stream followed by the individual out-of-band buffers each
+starting at an offset aligned to :data:`ALIGNMENT` bytes. Objects without any out-of-band
+buffers are serialized as plain pickle streams.
+"""
+import logging
+import pickle
+import struct
+import typing
+
+import cloudpickle
+
+LOGGER = logging.getLogger(__name__)
+
+MAGIC = b'\x00FORML5\x00'  # can't collide with a pickle stream which starts with the PROTO opcode
+ALIGNMENT = 64
+_COUNT = struct.Struct('<I')
+_ENTRY = struct.Struct('<QQ')
+
+
+def _align(offset: int) -> int:
+    """Round the offset up to the nearest multiple of the alignment."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def serialize(state: typing.Any) -> bytes:
+    """Serialize the given object storing its *out-of-band* buffers as separate aligned segments.
+
+    Args:
+        state: Object to be serialized.
+
+    Returns:
+        Serialized representation.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    stream = cloudpickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        return stream
+    segments = [memoryview(stream), *(b.raw() for b in buffers)]
+    position = len(MAGIC) + _COUNT.size + len(segments) * _ENTRY.size
+    offsets = []
+    offset = _align(position)
+    for segment in segments:
+        offsets.append(offset)
+        offset = _align(offset + segment.nbytes)
+    parts = [MAGIC, _COUNT.pack(len(segments)), *(_ENTRY.pack(o, s.nbytes) for o, s in zip(offsets, segments))]
+    for offset, segment in zip(offsets, segments):
+        parts.extend((bytes(offset - position), segment))
+        position = offset + segment.nbytes
+    LOGGER.debug('Serialized state with %d out-of-band buffers', len(buffers))
+    return b''.join(parts)
+
+
+def deserialize(data: typing.Union[bytes, memoryview]) -> typing.Any:
+    """Deserialize the object previously serialized using :func:`serialize` (or a plain pickle).
+
+    The out-of-band buffers are reconstructed directly on top of the provided memory. Plain
+    ``bytes`` input is first copied into a writable buffer (matching the cost of the plain pickle
+    loading) while any other read-only input (i.e. a memory-mapped file) is used as is producing
+    read-only objects.
+
+    Args:
+        data: Serialized representation (as any bytes-like object).
+
+    Returns:
+        Deserialized object.
+    """
+    view = memoryview(data)
+    if view[: len(MAGIC)] != MAGIC:
+        return cloudpickle.loads(data)
+    if view.readonly and isinstance(data, bytes):
+        view = memoryview(bytearray(view))
+    (count,) = _COUNT.unpack_from(view, len(MAGIC))
+    segments = []
+    for index in range(count):
+        offset, length = _ENTRY.unpack_from(view, len(MAGIC) + _COUNT.size + index * _ENTRY.size)
+        end = offset + length
+        segments.append(view[offset:end])
+    return cloudpickle.loads(segments[0], buffers=segments[1:])
@@ -19,17 +19,25 @@
 ForML assets persistence.
 """
 import abc
+import asyncio
 import atexit
+import contextlib
+import hashlib
+import io
 import logging
 import pathlib
 import shutil
 import tempfile
+import threading
 import typing
 import uuid
+from concurrent import futures
 
 import forml
 from forml import provider, setup
 
+from . import _compression
+
 if typing.TYPE_CHECKING:
     from forml import application, project
     from forml.io import asset
@@ -52,6 +60,65 @@ def mkdtemp(prefix: typing.Optional[str] = None, suffix: typing.Optional[str] =
     return pathlib.Path(tempfile.mkdtemp(prefix, suffix, TMPDIR))
 
 
+class Offload:
+    """Base class for the asynchronous adapters of the (blocking) persistence services.
+
+    The blocking calls are offloaded to a dedicated I/O thread pool (shared by all the adapters
+    and independent of any application-level executors) and identical calls issued concurrently
+    within the same event loop are coalesced into a single invocation.
+
+    Providers with native asynchronous clients can override the particular coroutines.
+
+    Args:
+        target: Synchronous service instance to be adapted.
+    """
+
+    WORKERS = 32
+    """Maximum number of the I/O threads."""
+
+    _pool: typing.Optional[futures.ThreadPoolExecutor] = None
+    _lock: threading.Lock = threading.Lock()
+    _pending: dict[tuple, asyncio.Future] = {}
+
+    def __init__(self, target: typing.Any):
+        self._target: typing.Any = target
+
+    def __repr__(self):
+        return f'Async-{self._target!r}'
+
+    @classmethod
+    def _executor(cls) -> futures.ThreadPoolExecutor:
+        """Get the shared I/O thread pool (creating it upon first use).
+
+        Returns:
+            Thread pool executor.
+        """
+        with cls._lock:
+            if not Offload._pool:
+                Offload._pool = futures.ThreadPoolExecutor(cls.WORKERS, thread_name_prefix=f'{setup.APPNAME}-io')
+            return Offload._pool
+
+    async def _call(self, method: str, *args: typing.Any) -> typing.Any:
+        """Run the given method of the target service in the I/O thread pool.
+
+        Args:
+            method: Name of the target method to call.
+            args: Method arguments.
+
+        Returns:
+            Method result.
+        """
+        loop = asyncio.get_running_loop()
+        key = loop, self._target, method, args
+        if key not in Offload._pending:
+            future = loop.run_in_executor(self._executor(), getattr(self._target, method), *args)
+            future.add_done_callback(lambda _: Offload._pending.pop(key, None))
+            Offload._pending[key] = future
+        else:
+            LOGGER.debug('Coalescing concurrent %s%s call', method, args)
+        return await asyncio.shield(Offload._pending[key])
+
+
 class Registry(provider.Service, default=setup.Registry.default, path=setup.Registry.path):
     """Abstract base class of the ForML model registry concept.
 
@@ -59,13 +126,77 @@ class Registry(provider.Service, default=setup.Registry.default, path=setup.Regi
         staging: File system location reachable from all runner nodes to be used for :ref:`package
                  staging <registry-staging>` (defaults to a local temporal directory (invalid for
                  distributed runners)).
+        compression: Optional codec (``none``, ``zlib``, ``lzma``, ``zstd`` or ``lz4``) to compress
+                     the dumped states with (states are then also stored with a checksum -
+                     ``none`` can be used to get just the checksums without compression).
+        level: Optional codec-specific compression level.
+        lazy: Mount the packages lazily importing the modules directly from the archive (see
+              :meth:`project.Package.install <forml.project.Package.install>`).
     """
 
-    def __init__(self, staging: typing.Optional[typing.Union[str, pathlib.Path]] = None):
+    class Async(Offload):
+        """Asynchronous adapter of the registry read API.
+
+        Instances are expected to be obtained using the :attr:`Registry.aio
+        <forml.io.asset.Registry.aio>` property.
+        """
+
+        async def projects(self) -> typing.Sequence[typing.Union[str, 'asset.Project.Key']]:
+            """Asynchronous version of :meth:`Registry.projects <forml.io.asset.Registry.projects>`."""
+            return await self._call('_list', 'projects')
+
+        async def releases(
+            self, project: 'asset.Project.Key'
+        ) -> typing.Sequence[typing.Union[str, 'asset.Release.Key']]:
+            """Asynchronous version of :meth:`Registry.releases <forml.io.asset.Registry.releases>`."""
+            return await self._call('_list', 'releases', project)
+
+        async def generations(
+            self, project: 'asset.Project.Key', release: 'asset.Release.Key'
+        ) -> typing.Sequence[typing.Union[str, int, 'asset.Generation.Key']]:
+            """Asynchronous version of :meth:`Registry.generations
+            <forml.io.asset.Registry.generations>`."""
+            return await self._call('_list', 'generations', project, release)
+
+        async def mount(self, project: 'asset.Project.Key', release: 'asset.Release.Key') -> 'project.Artifact':
+            """Asynchronous version of :meth:`Registry.mount <forml.io.asset.Registry.mount>`."""
+            return await self._call('mount', project, release)
+
+        async def pull(self, project: 'asset.Project.Key', release: 'asset.Release.Key') -> 'project.Package':
+            """Asynchronous version of :meth:`Registry.pull <forml.io.asset.Registry.pull>`."""
+            return await self._call('pull', project, release)
+
+        async def load(
+            self,
+            project: 'asset.Project.Key',
+            release: 'asset.Release.Key',
+            generation: 'asset.Generation.Key',
+            sid: uuid.UUID,
+        ) -> bytes:
+            """Asynchronous version of :meth:`Registry.load <forml.io.asset.Registry.load>`."""
+            return await self._call('load', project, release, generation, sid)
+
+        async def open(
+            self, project: 'asset.Project.Key', release: 'asset.Release.Key', generation: 'asset.Generation.Key'
+        ) -> 'asset.Tag':
+            """Asynchronous version of :meth:`Registry.open <forml.io.asset.Registry.open>`."""
+            return await self._call('open', project, release, generation)
+
+    def __init__(
+        self,
+        staging: typing.Optional[typing.Union[str, pathlib.Path]] = None,
+        compression: typing.Optional[str] = None,
+        level: typing.Optional[int] = None,
+        lazy: bool = False,
+    ):
         if not staging:
             LOGGER.warning('Using temporal non-distributed staging for %s', self)
             staging = mkdtemp(prefix=f'{self}-staging-')
         self._staging: pathlib.Path = pathlib.Path(staging)
+        self._compression: typing.Optional[_compression.Compression] = (
+            _compression.Compression.get(compression, level) if compression else None
+        )
+        self._lazy: bool = lazy
 
     def __repr__(self):
         name = self.__class__.__module__.rsplit('.', 1)[-1].capitalize()
@@ -77,6 +208,54 @@ class Registry(provider.Service, default=setup.Registry.default, path=setup.Regi
     def __eq__(self, other):
         return isinstance(other, self.__class__) and other._staging == self._staging
 
+    @property
+    def aio(self) -> 'asset.Registry.Async':
+        """Asynchronous adapter of this registry to be used from within event loops (i.e. on the
+        serving path).
+
+        Returns:
+            Asynchronous registry adapter.
+        """
+        return self.Async(self)
+
+    def _list(self, level: str, *args: typing.Any) -> tuple:
+        """Helper for fully materializing the (possibly lazy) listings in the I/O threads.
+
+        Args:
+            level: Name of the listing method.
+            args: Listing method arguments.
+
+        Returns:
+            Listing tuple.
+        """
+        return tuple(getattr(self, level)(*args))
+
+    @property
+    def addressed(self) -> bool:
+        """Flag indicating the registry is *content-addressed* - identifying the states by their
+        content (so that identical states are stored just once and are shared across generations).
+
+        Returns:
+            True if content-addressed.
+        """
+        return False
+
+    def identify(self, state: bytes) -> uuid.UUID:
+        """Generate the ID for the given (yet to be dumped) state.
+
+        States of content-addressed registries are identified by their (uncompressed) content
+        digest, others get a random ID.
+
+        Args:
+            state: Serialized state to be identified.
+
+        Returns:
+            State ID.
+        """
+        if self.addressed:
+            return uuid.UUID(bytes=hashlib.blake2b(state, digest_size=16).digest())
+        return uuid.uuid4()
+
     @abc.abstractmethod
     def projects(self) -> typing.Iterable[typing.Union[str, 'asset.Project.Key']]:
         """List the existing projects contained in the repository.
@@ -117,6 +296,9 @@ class Registry(provider.Service, default=setup.Registry.default, path=setup.Regi
         """Pull and install the given project/release package using the *staging* file system
         location available to all runner nodes.
 
+        Installations are cached (keyed by the package digest) so repeated mounts by any process
+        sharing the staging location are served from the existing installation.
+
         Args:
             project: Name of the project to work with.
             release: Version of the release to be loaded.
@@ -129,7 +311,9 @@ class Registry(provider.Service, default=setup.Registry.default, path=setup.Regi
         """
         package = self.pull(project, release)
         try:
-            return package.install(self._staging / package.manifest.name / str(package.manifest.version))
+            return package.install(
+                self._staging / package.manifest.name / str(package.manifest.version), lazy=self._lazy
+            )
         except FileNotFoundError as err:
             raise forml.MissingError(f'Package artifact {project}-{release} not found') from err
 
@@ -172,11 +356,78 @@ class Registry(provider.Service, default=setup.Registry.default, path=setup.Regi
             sid: ID of the state object to be loaded.
 
         Returns:
-            Serialized state or empty byte-array if there is no such state for the given (existing)
-            generation.
+            Serialized state (as any bytes-like object - i.e. possibly memory-mapped) or empty
+            byte-array if there is no such state for the given (existing) generation.
         """
         raise NotImplementedError()
 
+    def load(
+        self,
+        project: 'asset.Project.Key',
+        release: 'asset.Release.Key',
+        generation: 'asset.Generation.Key',
+        sid: uuid.UUID,
+    ) -> bytes:
+        """Load the state using the :meth:`read` method decompressing it and verifying its
+        checksum if it has been stored compressed.
+
+        Args:
+            project: Project to read the state from.
+            release: Project release to read the state from.
+            generation: Project generation to read the state from.
+            sid: ID of the state object to be loaded.
+
+        Returns:
+            Serialized state.
+
+        Raises:
+            forml.InvalidError: If the state checksum doesn't match.
+        """
+        return _compression.decode(self.read(project, release, generation, sid))
+
+    def dump(
+        self,
+        project: 'asset.Project.Key',
+        release: 'asset.Release.Key',
+        sid: uuid.UUID,
+        state: typing.Union[bytes, typing.BinaryIO, typing.Iterable[bytes]],
+    ) -> None:
+        """Dump the state streaming it (possibly compressed) into the :meth:`writer` sink.
+
+        Args:
+            project: Project to store the state into.
+            release: Project release to store the state into.
+            sid: State ID to associate the payload with.
+            state: Serialized state to be persisted provided either as a bytes-like object, a
+                   readable file-like object or an iterable of bytes-like chunks.
+        """
+        with self.writer(project, release, sid) as sink:
+            _compression.encode(state, sink, self._compression)
+
+    @contextlib.contextmanager
+    def writer(
+        self, project: 'asset.Project.Key', release: 'asset.Release.Key', sid: uuid.UUID
+    ) -> typing.Iterator[typing.BinaryIO]:
+        """Context manager providing a file-like sink for streaming a generation-unbound state into
+        an *existing* release under the given state ID.
+
+        The state is expected to be persisted (only) upon successful exit of the context.
+
+        Unless overridden, the default implementation buffers the content in memory and passes it
+        to the :meth:`write` method.
+
+        Args:
+            project: Project to store the state into.
+            release: Project release to store the state into.
+            sid: State ID to associate the payload with.
+
+        Returns:
+            Writable file-like object.
+        """
+        with io.BytesIO() as buffer:
+            yield buffer
+            self.write(project, release, sid, buffer.getvalue())
+
     @abc.abstractmethod
     def write(self, project: 'asset.Project.Key', release: 'asset.Release.Key', sid: uuid.UUID, state: bytes) -> None:
         """Dump a generation-unbound state within an *existing* release under the given state ID.
@@ -234,10 +485,42 @@ class Inventory(provider.Service, default=setup.Inventory.default, path=setup.In
         <forml.application.Descriptor.name>`.
     """
 
+    class Async(Offload):
+        """Asynchronous adapter of the inventory read API.
+
+        Instances are expected to be obtained using the :attr:`Inventory.aio
+        <forml.io.asset.Inventory.aio>` property.
+        """
+
+        async def list(self) -> typing.Sequence[str]:
+            """Asynchronous version of :meth:`Inventory.list <forml.io.asset.Inventory.list>`."""
+            return await self._call('_list')
+
+        async def get(self, application: str) -> 'application.Descriptor':
+            """Asynchronous version of :meth:`Inventory.get <forml.io.asset.Inventory.get>`."""
+            return await self._call('get', application)
+
     def __repr__(self):
         name = self.__class__.__module__.rsplit('.', 1)[-1].capitalize()
         return f'{name}-inventory'
 
+    @property
+    def aio(self) -> 'asset.Inventory.Async':
+        """Asynchronous adapter of this inventory to be used from within event loops.
+
+        Returns:
+            Asynchronous inventory adapter.
+        """
+        return self.Async(self)
+
+    def _list(self) -> tuple[str]:
+        """Helper for fully materializing the (possibly lazy) listing in the I/O threads.
+
+        Returns:
+            Listing tuple.
+        """
+        return tuple(self.list())
+
     @abc.abstractmethod
     def list(self) -> typing.Iterable[str]:
         """List all the application names contained within the inventory.
@@ -172,10 +172,50 @@ class Any(metaclass=Meta):
         """
         return cls.__type__(value)
 
+    @classmethod
+    def cast_column(cls, values: pandas.Series) -> pandas.Series:
+        """Cast the whole column of values to this kind at once.
+
+        This is the vectorized counterpart of the :meth:`cast` method.
+
+        Args:
+            values: Column of values to cast.
+
+        Returns:
+            Column of values as this kind.
+
+        Raises:
+            dsl.CastError: If casting any of the values is not possible.
+        """
+        try:
+            return cls._cast_column(values)
+        except (ValueError, TypeError) as err:
+            raise _exception.CastError(f'Unable to cast column {values.name!r} as {cls.__name__}') from err
+
+    @classmethod
+    def _cast_column(cls, values: pandas.Series) -> pandas.Series:
+        """Cast the whole column of values to this kind.
+
+        Unless overridden, this falls back to casting the values one by one.
+
+        Args:
+            values: Column of values to cast.
+
+        Returns:
+            Column of values as this kind.
+        """
+        return values.map(cls._cast)
+
 
 class Primitive(Any, metaclass=Singleton):  # pylint: disable=abstract-method
     """Primitive data type base class."""
 
+    __dtypes__: str = ''
+    """Numpy dtype kind codes (as in ``numpy.dtype.kind``) natively holding values of this kind."""
+    __inferred__: tuple[str] = ()
+    """Pandas inferred types (as in ``pandas.api.types.infer_dtype``) of object columns holding
+    values of this kind."""
+
     def __new__(cls, *args, **kwargs):
         """This gets actually overwritten by metaclass."""
         raise AssertionError('Expected to be replaced by metaclass')
@@ -187,6 +227,15 @@ class Primitive(Any, metaclass=Singleton):  # pylint: disable=abstract-method
             return value
         return super().cast(value)
 
+    @classmethod
+    @typing.final
+    def cast_column(cls, values: pandas.Series) -> pandas.Series:
+        if values.dtype.kind in cls.__dtypes__ or (
+            values.dtype.kind == 'O' and pandas.api.types.infer_dtype(values) in cls.__inferred__
+        ):
+            return values
+        return super().cast_column(values)
+
 
 class Numeric(Primitive, metaclass=abc.ABCMeta):  # pylint: disable=abstract-method
     """Numeric data type base class."""
@@ -197,12 +246,22 @@ class Numeric(Primitive, metaclass=abc.ABCMeta):  # pylint: disable=abstract-met
     def _cast(cls, value: 'dsl.Native') -> 'dsl.Native':
         return pandas.to_numeric(value)
 
+    @classmethod
+    def _cast_column(cls, values: pandas.Series) -> pandas.Series:
+        return pandas.to_numeric(values)
+
 
 class Boolean(Primitive):
     """Boolean data type class."""
 
     __type__ = bool
     __rank__ = 0
+    __dtypes__ = 'b'
+    __inferred__ = ('boolean',)
+
+    @classmethod
+    def _cast_column(cls, values: pandas.Series) -> pandas.Series:
+        return values.astype(bool)
 
 
 class Integer(Numeric):
@@ -210,39 +269,64 @@ class Integer(Numeric):
 
     __type__ = numbers.Integral
     __rank__ = 1
+    __dtypes__ = 'biu'
+    __inferred__ = ('integer',)
 
     @classmethod
     def _cast(cls, value: 'dsl.Native') -> 'dsl.Native':
         return int(value)
 
+    @classmethod
+    def _cast_column(cls, values: pandas.Series) -> pandas.Series:
+        values = pandas.to_numeric(values)
+        if values.dtype.kind == 'f' and not (values % 1 == 0).all():  # also rejects NaNs and infinities
+            raise ValueError('Non-integral values')
+        return values.astype(int)
+
 
 class Float(Numeric):
     """Float data type class."""
 
     __type__ = numbers.Real
     __rank__ = 2
+    __dtypes__ = 'biuf'
+    __inferred__ = ('integer', 'floating', 'mixed-integer-float')
 
     @classmethod
     def _cast(cls, value: 'dsl.Native') -> 'dsl.Native':
         return float(value)
 
+    @classmethod
+    def _cast_column(cls, values: pandas.Series) -> pandas.Series:
+        return pandas.to_numeric(values).astype(float)
+
 
 class Decimal(Numeric):
     """Decimal data type class."""
 
     __type__ = decimal.Decimal
     __rank__ = 1
+    __inferred__ = ('decimal',)
 
     @classmethod
     def _cast(cls, value: 'dsl.Native') -> 'dsl.Native':
         return decimal.Decimal(value)
 
+    @classmethod
+    def _cast_column(cls, values: pandas.Series) -> pandas.Series:
+        return values.map(cls._cast)
+
 
 class String(Primitive):
     """String data type class."""
 
     __type__ = str
     __rank__ = 1
+    __inferred__ = ('string',)  # covering both the object and the extension string columns
+
+    @classmethod
+    def _cast_column(cls, values: pandas.Series) -> pandas.Series:
+        return values.astype(str)
 
 
 class Date(Primitive):
@@ -250,22 +334,33 @@ class Date(Primitive):
 
     __type__ = datetime.date
     __rank__ = 2
+    __dtypes__ = 'M'
+    __inferred__ = ('date', 'datetime')
 
     @classmethod
     def _cast(cls, value: 'dsl.Native') -> 'dsl.Native':
         return pandas.to_datetime(value).date()
 
+    @classmethod
+    def _cast_column(cls, values: pandas.Series) -> pandas.Series:
+        return pandas.to_datetime(values).dt.date
+
 
 class Timestamp(Date):
     """Timestamp data type class."""
 
     __type__ = datetime.datetime
     __rank__ = 1
+    __inferred__ = ('datetime',)
 
     @classmethod
     def _cast(cls, value: 'dsl.Native') -> 'dsl.Native':
         return pandas.to_datetime(value)
 
+    @classmethod
+    def _cast_column(cls, values: pandas.Series) -> pandas.Series:
+        return pandas.to_datetime(values)
+
 
 class Compound(Any, tuple, metaclass=abc.ABCMeta):
     """Complex data type class."""
@@ -885,6 +885,23 @@ class NotNull(Comparison, Postfix):
     symbol = 'NOT NULL'
 
 
+class IsIn(Comparison, Operator, Expression):
+    """Is-In operator (membership of the operand within the list of values)."""
+
+    symbol = 'IN'
+
+    operand: 'dsl.Operable' = property(opermod.itemgetter(0))
+    values: tuple['dsl.Operable'] = property(lambda self: self[1:])
+
+    def __new__(cls, arg: 'dsl.Operable', *values: typing.Any):
+        if not values:
+            raise _exception.GrammarError('Empty list of values')
+        return super().__new__(cls, Operable.ensure_is(arg), *(Operable.ensure_is(cast(v)) for v in values))
+
+    def __repr__(self):
+        return f'{repr(self[0])} {self.symbol} ({", ".join(repr(v) for v in self.values)})'
+
+
 class Arithmetic:
     """Mixin for numerical operators."""
 
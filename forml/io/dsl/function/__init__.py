@@ -26,6 +26,7 @@ from .._struct.series import (  # noqa: F401
     Equal,
     GreaterEqual,
     GreaterThan,
+    IsIn,
     IsNull,
     LessEqual,
     LessThan,
@@ -56,6 +57,7 @@ __all__ = [
     'Floor',
     'GreaterEqual',
     'GreaterThan',
+    'IsIn',
     'IsNull',
     'LessEqual',
     'LessThan',
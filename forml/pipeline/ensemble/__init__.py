@@ -25,6 +25,7 @@ Ensembling comes in a number of different flavors each with its strengths and tr
 module provides some major implementations.
 """
 
+from ._reducing import GeometricReducer, MeanReducer, MedianReducer, RankReducer
 from ._stacking import FullStack
 
-__all__ = ['FullStack']
+__all__ = ['FullStack', 'GeometricReducer', 'MeanReducer', 'MedianReducer', 'RankReducer']
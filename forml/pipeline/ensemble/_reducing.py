@@ -0,0 +1,192 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Vectorized fold-models prediction reducers.
+
+All the reducers stack the individual fold predictions into a single ``(nfolds, nrows, ncols)``
+array and reduce it along the first axis at once (instead of combining the predictions column by
+column).
+"""
+import typing
+
+import numpy
+import pandas
+from pandas.core import generic as pdtype
+
+from forml import flow
+from forml.pipeline import payload, wrap
+
+
+@payload.pandas_params
+def stack(*folds: pdtype.NDFrame) -> tuple[numpy.ndarray, pandas.DataFrame]:
+    """Stack the individual fold predictions into a single 3-dimensional array.
+
+    Predictions can either be :class:`pandas:pandas.Series` or multicolumn
+    :class:`pandas:pandas.DataFrame` (or anything convertible to these).
+
+    Args:
+        *folds: Individual model predictions.
+
+    Returns:
+        Tuple of the ``(nfolds, nrows, ncols)`` array and the template frame (the first fold)
+        providing the index and columns for the reduced output.
+
+    Raises:
+        ValueError: If the folds shapes are not equal.
+    """
+    if not (folds and all(f.shape == folds[0].shape for f in folds)):
+        raise ValueError('Folds must have same shape')
+    template = folds[0] if folds[0].ndim > 1 else folds[0].to_frame()
+    return numpy.stack([f.to_numpy() for f in folds]).reshape(len(folds), *template.shape), template
+
+
+def unstack(values: numpy.ndarray, template: pandas.DataFrame) -> pandas.DataFrame:
+    """Wrap the reduced array back into a dataframe.
+
+    Args:
+        values: Reduced ``(nrows, ncols)`` array.
+        template: Template frame providing the index and columns.
+
+    Returns:
+        Dataframe of the reduced values.
+    """
+    return pandas.DataFrame(values, index=template.index, columns=template.columns, copy=False)
+
+
+@wrap.Actor.apply
+def MeanReducer(  # pylint: disable=invalid-name
+    *folds: pdtype.NDFrame, weights: typing.Optional[typing.Sequence[float]] = None
+) -> pandas.DataFrame:
+    """MeanReducer(weights: typing.Optional[typing.Sequence[float]] = None)
+
+    Fold-models prediction reducer based on the (possibly weighted) arithmetic mean.
+
+    Predictions can either be :class:`pandas:pandas.Series` or multicolumn
+    :class:`pandas:pandas.DataFrame` in which case same-position columns are merged together.
+
+    Args:
+        weights: Optional weights of the individual folds (in order of the input ports).
+
+    Returns:
+        Single dataframe with the mean value of the individual predictions representing the same
+        event.
+
+    Examples:
+        >>> REDUCER = ensemble.MeanReducer.builder(weights=[0.2, 0.3, 0.5])
+    """
+    values, template = stack(*folds)
+    return unstack(numpy.average(values, axis=0, weights=weights), template)
+
+
+@wrap.Actor.apply
+def MedianReducer(*folds: pdtype.NDFrame) -> pandas.DataFrame:  # pylint: disable=invalid-name
+    """MedianReducer()
+
+    Fold-models prediction reducer based on the median.
+
+    Returns:
+        Single dataframe with the median value of the individual predictions representing the same
+        event.
+
+    Examples:
+        >>> REDUCER = ensemble.MedianReducer.builder()
+    """
+    values, template = stack(*folds)
+    return unstack(numpy.median(values, axis=0), template)
+
+
+@wrap.Actor.apply
+def GeometricReducer(*folds: pdtype.NDFrame) -> pandas.DataFrame:  # pylint: disable=invalid-name
+    """GeometricReducer()
+
+    Fold-models prediction reducer based on the geometric mean (suitable for probabilities).
+
+    Zero predictions are valid (resulting in a zero mean) but negative ones are rejected.
+
+    Returns:
+        Single dataframe with the geometric mean of the individual predictions representing the
+        same event.
+
+    Raises:
+        ValueError: If any of the predictions is negative.
+
+    Examples:
+        >>> REDUCER = ensemble.GeometricReducer.builder()
+    """
+    values, template = stack(*folds)
+    if (values < 0).any():
+        raise ValueError('Geometric mean of negative predictions')
+    with numpy.errstate(divide='ignore'):
+        return unstack(numpy.exp(numpy.log(values).mean(axis=0)), template)
+
+
+class RankReducer(flow.Actor[pdtype.NDFrame, pdtype.NDFrame, pandas.DataFrame]):
+    """RankReducer(size: int = 1000)
+
+    Stateful fold-models prediction reducer based on the rank-average.
+
+    In the train-mode, the reducer keeps a (column-wise) sample of the sorted training predictions
+    as the *reference distribution*. In the apply-mode, the predictions of each fold are then
+    replaced by their ranks within the reference distribution normalized to the ``[0, 1]`` range
+    which are then averaged. This makes the reducer insensitive to the (potentially different)
+    calibration of the individual fold models while keeping the result of each row independent of
+    the rest of the batch (i.e. consistent for individual serving requests).
+
+    When used within the :class:`ensemble.FullStack <forml.pipeline.ensemble.FullStack>`, the
+    reducer is trained using the stacked out-of-fold predictions of its base model.
+
+    Args:
+        size: Maximum number of the (evenly spaced) reference values to keep per column.
+
+    Returns:
+        Single dataframe with the mean of the normalized ranks of the individual predictions
+        representing the same event.
+
+    Examples:
+        >>> REDUCER = ensemble.RankReducer.builder(size=100)
+    """
+
+    def __init__(self, size: int = 1000):
+        if size < 2:
+            raise ValueError('Invalid reference size')
+        self._size: int = size
+        self._reference: typing.Optional[numpy.ndarray] = None
+
+    def train(self, features: pdtype.NDFrame, labels: pdtype.NDFrame, /) -> None:
+        values = numpy.sort(numpy.asarray(features, dtype=float).reshape(len(features), -1), axis=0)
+        if not len(values):
+            raise ValueError('Empty reference')
+        self._reference = values[numpy.linspace(0, len(values) - 1, min(len(values), self._size)).round().astype(int)]
+
+    def apply(self, *folds: pdtype.NDFrame) -> pandas.DataFrame:
+        if self._reference is None:
+            raise RuntimeError('Reducer not trained')
+        values, template = stack(*folds)
+        if values.shape[2] != self._reference.shape[1]:
+            raise ValueError('Reference columns mismatch')
+        ranks = numpy.empty(values.shape)
+        for column, reference in enumerate(self._reference.T):  # mid-ranks of the ties
+            ranks[..., column] = numpy.searchsorted(reference, values[..., column], side='left')
+            ranks[..., column] += numpy.searchsorted(reference, values[..., column], side='right')
+        return unstack(ranks.mean(axis=0) / (2 * len(self._reference)), template)
+
+    def get_params(self) -> dict[str, typing.Any]:
+        return {'size': self._size}
+
+    def set_params(self, size: int) -> None:  # pylint: disable=arguments-differ
+        self._size = size
@@ -22,6 +22,7 @@ Implementations of stacking ensemblers.
 import abc
 import collections
 import inspect
+import itertools
 import typing
 
 import pandas
@@ -30,6 +31,8 @@ from pandas.core import generic as pdtype
 from forml import flow as flowmod
 from forml.pipeline import payload as paymod
 
+from . import _reducing
+
 if typing.TYPE_CHECKING:
     from forml import flow  # pylint: disable=reimported
     from forml.pipeline import payload  # pylint: disable=reimported
@@ -83,27 +86,42 @@ class Ensembler(flowmod.Operator):
             self._bases: tuple['flow.Composable'] = tuple(bases)
             self._kwargs: typing.Mapping[str, typing.Any] = kwargs
 
-        def __call__(self, folds: typing.Sequence[Fold]) -> tuple['flow.Node', 'flow.Node', 'flow.Node']:
+        def __call__(
+            self,
+            folds: typing.Sequence[Fold],
+            served: typing.Sequence[int],
+            whole: typing.Optional[Fold.Train] = None,
+        ) -> tuple['flow.Node', 'flow.Node', 'flow.Node']:
             """Stack the folds using the given bases and produce a tran and apply outputs.
 
             Args:
                 folds: Sequence of the split data folds.
+                served: Indices of the folds whose models are to be used in the apply-mode.
+                whole: Optional non-split data to refit the models on for the apply-mode (instead
+                       of using the fold models).
 
             Returns:
                 Tuple of tail nodes returning the train and apply mode stack outputs.
             """
-            return self.build(self._bases, folds, **self._kwargs)
+            return self.build(self._bases, folds, served, whole, **self._kwargs)
 
         @classmethod
         @abc.abstractmethod
         def build(
-            cls, bases: typing.Sequence['flow.Composable'], folds: typing.Sequence[Fold], **kwargs
+            cls,
+            bases: typing.Sequence['flow.Composable'],
+            folds: typing.Sequence[Fold],
+            served: typing.Sequence[int],
+            whole: typing.Optional[Fold.Train],
+            **kwargs,
         ) -> tuple['flow.Node', 'flow.Node', 'flow.Node']:
             """Stack the folds using the given bases and produce a tran and apply outputs.
 
             Args:
                 bases: Sequence of the base model operators (or compositions) to be ensembled.
                 folds: Sequence of the split data folds.
+                served: Indices of the folds whose models are to be used in the apply-mode.
+                whole: Optional non-split data to refit the models on for the apply-mode.
                 **kwargs: Builder specific kwargs.
 
             Returns:
@@ -116,6 +134,9 @@ class Ensembler(flowmod.Operator):
         *bases: 'flow.Composable',
         crossvalidator: 'payload.CrossValidable',
         splitter: 'type[payload.CVFoldable]' = paymod.PandasCVFolds,
+        keep: typing.Optional[typing.Sequence[int]] = None,
+        refit: bool = False,
+        coschedule: bool = False,
         **kwargs,
     ):
         """Simplified constructor based on splitter supplied in form of a cross-validator and
@@ -126,6 +147,10 @@ class Ensembler(flowmod.Operator):
             crossvalidator: Implementation of the split-selection logic.
             splitter: Folding actor type that is expected to take the *cross-validator* as its
                       parameter. Defaults to `payload.PandasCVFolds`.
+            keep: Optional subset of fold indices whose models are to be kept for serving.
+            refit: Refit the models on the entire training data for serving (instead of keeping
+                   the fold models).
+            coschedule: Hint the runner to co-schedule the fold branches within a single process.
         """
 
     @typing.overload
@@ -134,6 +159,9 @@ class Ensembler(flowmod.Operator):
         *bases: 'flow.Composable',
         splitter: 'flow.Builder[payload.CVFoldable]',
         nsplits: int,
+        keep: typing.Optional[typing.Sequence[int]] = None,
+        refit: bool = False,
+        coschedule: bool = False,
         **kwargs,
     ):
         """Ensembler constructor based on splitter supplied in form of an actor builder object.
@@ -143,6 +171,10 @@ class Ensembler(flowmod.Operator):
             splitter: Actor builder object defining the folding splitter.
             nsplits: The number of splits the splitter is going to generate (needs to be explicit as
                      there is no reliable way to extract it from the actor builder).
+            keep: Optional subset of fold indices whose models are to be kept for serving.
+            refit: Refit the models on the entire training data for serving (instead of keeping
+                   the fold models).
+            coschedule: Hint the runner to co-schedule the fold branches within a single process.
         """
 
     def __init__(
@@ -151,6 +183,9 @@ class Ensembler(flowmod.Operator):
         crossvalidator=None,
         splitter=paymod.PandasCVFolds,
         nsplits=None,
+        keep=None,
+        refit=False,
+        coschedule=False,
         **kwargs,
     ):
         if not bases:
@@ -164,7 +199,19 @@ class Ensembler(flowmod.Operator):
             nsplits = crossvalidator.get_n_splits()
         if nsplits < 2:
             raise ValueError('At least 2 splits required')
+        if keep is not None and refit:
+            raise TypeError('Invalid combination of keep and refit')
+        if refit:
+            keep = ()
+        elif keep is None:
+            keep = range(nsplits)
+        elif not keep or any(not 0 <= f < nsplits for f in keep):
+            raise ValueError(f'Invalid fold selection: {keep}')
+        if coschedule:  # each fold is represented by a pair of consecutive splitter ports
+            splitter = splitter.hint(coschedule=2)
         self._nsplits: int = nsplits
+        self._served: tuple[int] = tuple(sorted(set(keep)))
+        self._refit: bool = refit
         self._splitter: 'flow.Builder[payload.CVFoldable]' = splitter
         self._builder: Ensembler.Builder = self.Builder(bases, **kwargs)  # pylint: disable=abstract-class-instantiated
 
@@ -190,7 +237,8 @@ class Ensembler(flowmod.Operator):
             pipeline_fold: 'flow.Trunk' = scope.expand()
             pipeline_fold.train.subscribe(feature_folds[2 * fid])
             pipeline_fold.label.subscribe(label_folds[2 * fid])
-            pipeline_fold.apply.subscribe(head.apply.publisher)
+            if fid in self._served:  # models of the other folds are not used in apply-mode
+                pipeline_fold.apply.subscribe(head.apply.publisher)
             test_fold = pipeline_fold.apply.copy()
             test_fold.subscribe(feature_folds[2 * fid + 1])
             data_folds.append(
@@ -202,7 +250,16 @@ class Ensembler(flowmod.Operator):
                     label_folds[2 * fid + 1],
                 )
             )
-        train_tail, apply_tail, label_tail = self._builder(data_folds)
+        whole = None
+        if self._refit:
+            pipeline_whole: 'flow.Trunk' = scope.expand()
+            pipeline_whole.train.subscribe(head.train.publisher)
+            pipeline_whole.label.subscribe(head.label.publisher)
+            pipeline_whole.apply.subscribe(head.apply.publisher)
+            whole = Fold.Train(
+                pipeline_whole.apply.publisher, pipeline_whole.train.publisher, pipeline_whole.label.publisher
+            )
+        train_tail, apply_tail, label_tail = self._builder(data_folds, self._served, whole)
         return flowmod.Trunk(
             apply=head.apply.extend(tail=apply_tail),
             train=head.train.extend(tail=train_tail),
@@ -210,7 +267,6 @@ class Ensembler(flowmod.Operator):
         )
 
 
-@paymod.pandas_params
 def pandas_mean(*folds: pdtype.NDFrame) -> pandas.DataFrame:
     """Specific fold-models prediction reducer for Pandas dataframes based on arithmetic mean.
 
@@ -224,16 +280,8 @@ def pandas_mean(*folds: pdtype.NDFrame) -> pandas.DataFrame:
         Single dataframe with the mean value of the individual predictions representing the same
         event.
     """
-    if not (folds and all(f.shape == folds[0].shape for f in folds)):
-        raise ValueError('Folds must have same shape')
-    folds = (
-        [([folds[0].name], folds)] if folds[0].ndim == 1 else (zip(*i) for i in zip(*(f.iteritems() for f in folds)))
-    )
-    return pandas.concat(
-        (pandas.concat(s, axis='columns', copy=False).mean(axis='columns').rename(n[0]) for n, s in folds),
-        axis='columns',
-        copy=False,
-    )
+    values, template = _reducing.stack(*folds)
+    return _reducing.unstack(values.mean(axis=0), template)
 
 
 class FullStack(Ensembler):
@@ -255,6 +303,11 @@ class FullStack(Ensembler):
     using the ``reducer`` function (e.g. an arithmetical mean). This results in a computationally
     more expensive serving but potentially better accuracy.
 
+    The serving topology can optionally be pruned either to just a subset of the fold models (using
+    the ``keep`` parameter) or to a single instance of each base model refitted on the entire
+    training dataset (using ``refit``). Models that are not served are used only during training to
+    produce the stacked predictions - their states are not persisted in the model generation.
+
     Args:
         bases: Sequence of the base model operators (or compositions) to be ensembled.
         crossvalidator: Implementation of the split-selection logic.
@@ -266,12 +319,26 @@ class FullStack(Ensembler):
                   2. Actor builder instance defining the folding splitter.
         nsplits: The number of splits the splitter is going to generate (needs to be explicit as
                  there is no generic way to extract it from the actor builder).
+        keep: Optional subset of the fold indices whose models are to be kept for serving (all by
+              default).
+        refit: Refit one instance of each base model on the entire training dataset at the end of
+               the training and serve it instead of the fold models (making the ``reducer``
+               irrelevant).
+        coschedule: Hint the runner to co-schedule the (train-mode) fold branches within a single
+                    process using a shared-memory thread pool (avoiding serialization of the fold
+                    payloads between the workers - see :func:`flow.fuse <forml.flow.fuse>`).
         appender: Horizontal column concatenator (combining base model predictions in *train-mode*)
                   provided either as a *function* or as an actor *builder*.
         stacker: Vertical column concatenator (combining folds predictions in *train-mode*)
                  provided either as a *function* or as an actor *builder*.
         reducer: Horizontal column merger (combining base model predictions in *apply-mode*)
-                 provided either as a *function* or as an actor *builder*.
+                 provided either as a *function* or as an actor *builder*. Defaults to the
+                 vectorized :class:`ensemble.MeanReducer <forml.pipeline.ensemble.MeanReducer>`
+                 (other options are the :class:`ensemble.MedianReducer
+                 <forml.pipeline.ensemble.MedianReducer>`, :class:`ensemble.GeometricReducer
+                 <forml.pipeline.ensemble.GeometricReducer>` or the stateful
+                 :class:`ensemble.RankReducer <forml.pipeline.ensemble.RankReducer>` trained using
+                 the out-of-fold predictions of the particular base model).
 
     Examples:
             >>> PIPELINE = (
@@ -289,25 +356,45 @@ class FullStack(Ensembler):
 
         @classmethod
         def build(
-            cls, bases: typing.Sequence['flow.Composable'], folds: typing.Sequence[Fold], **kwargs
+            cls,
+            bases: typing.Sequence['flow.Composable'],
+            folds: typing.Sequence[Fold],
+            served: typing.Sequence[int],
+            whole: typing.Optional[Fold.Train],
+            **kwargs,
         ) -> tuple['flow.Node', 'flow.Node', 'flow.Node']:
             nsplits = len(folds)
             label_output: 'flow.Worker' = flowmod.Worker(kwargs['stacker'], nsplits, 1)
             train_output: 'flow.Worker' = flowmod.Worker(kwargs['appender'], len(bases), 1)
             apply_output: 'flow.Worker' = train_output.fork()
             stacker_forks: typing.Iterable['flow.Worker'] = flowmod.Worker.fgen(kwargs['stacker'], nsplits, 1)
-            reducer_forks: typing.Iterable['flow.Worker'] = flowmod.Worker.fgen(kwargs['reducer'], nsplits, 1)
+            reducer_forks: typing.Iterable[typing.Optional['flow.Worker']] = itertools.repeat(None)
+            if served:
+                if kwargs['reducer'].actor.is_stateful():  # each base model needs its own reducer state
+                    reducer_forks = (flowmod.Worker(kwargs['reducer'], len(served), 1) for _ in bases)
+                else:
+                    reducer_forks = flowmod.Worker.fgen(kwargs['reducer'], len(served), 1)
             for fold_idx, pipeline_fold in enumerate(folds):
                 label_output[fold_idx].subscribe(pipeline_fold.test.label)
             for base_idx, (base, stacker, reducer) in enumerate(zip(bases, stacker_forks, reducer_forks)):
                 train_output[base_idx].subscribe(stacker[0])
-                apply_output[base_idx].subscribe(reducer[0])
                 for fold_idx, pipeline_fold in enumerate(folds):
                     base_fold: 'flow.Trunk' = base.expand()
                     fold_apply = base_fold.apply.copy()
                     pipeline_fold.publish(base_fold.apply, base_fold.train, base_fold.label, fold_apply)
                     stacker[fold_idx].subscribe(fold_apply.publisher)
-                    reducer[fold_idx].subscribe(base_fold.apply.publisher)
+                    if reducer is not None and fold_idx in served:
+                        reducer[served.index(fold_idx)].subscribe(base_fold.apply.publisher)
+                if reducer is not None and reducer.stateful:  # trained using the out-of-fold predictions
+                    reducer.fork().train(stacker[0], label_output[0])
+                if whole:
+                    base_whole: 'flow.Trunk' = base.expand()
+                    base_whole.apply.subscribe(whole.apply)
+                    base_whole.train.subscribe(whole.train)
+                    base_whole.label.subscribe(whole.label)
+                    apply_output[base_idx].subscribe(base_whole.apply.publisher)
+                else:
+                    apply_output[base_idx].subscribe(reducer[0])
             return train_output, apply_output, label_output
 
     @typing.overload
@@ -316,13 +403,18 @@ class FullStack(Ensembler):
         *bases: 'flow.Composable',
         crossvalidator: 'payload.CrossValidable',
         splitter: 'type[payload.CVFoldable]' = paymod.PandasCVFolds,
+        keep: typing.Optional[typing.Sequence[int]] = None,
+        refit: bool = False,
+        coschedule: bool = False,
         appender: 'typing.Union[typing.Callable[..., flow.Features], flow.Builder]' = (
             paymod.PandasConcat.builder(axis='columns', ignore_index=False)  # noqa: B008
         ),
         stacker: 'typing.Union[typing.Callable[..., flow.Features], flow.Builder]' = (
             paymod.PandasConcat.builder(axis='index', ignore_index=True)  # noqa: B008
         ),
-        reducer: 'typing.Union[typing.Callable[..., flow.Features], flow.Builder]' = pandas_mean,
+        reducer: 'typing.Union[typing.Callable[..., flow.Features], flow.Builder]' = (
+            _reducing.MeanReducer.builder()  # noqa: B008
+        ),
     ):
         """Simplified constructor based on splitter supplied in form of a crossvalidator and
         a folding actor type.
@@ -334,13 +426,18 @@ class FullStack(Ensembler):
         *bases: 'flow.Composable',
         splitter: 'flow.Builder[payload.CVFoldable]',
         nsplits: int,
+        keep: typing.Optional[typing.Sequence[int]] = None,
+        refit: bool = False,
+        coschedule: bool = False,
         appender: 'typing.Union[typing.Callable[..., flow.Features], flow.Builder]' = (
             paymod.PandasConcat.builder(axis='columns', ignore_index=False)  # noqa: B008
         ),
         stacker: 'typing.Union[typing.Callable[..., flow.Features], flow.Builder]' = (
             paymod.PandasConcat.builder(axis='index', ignore_index=True)  # noqa: B008
         ),
-        reducer: 'typing.Union[typing.Callable[..., flow.Features], flow.Builder]' = pandas_mean,
+        reducer: 'typing.Union[typing.Callable[..., flow.Features], flow.Builder]' = (
+            _reducing.MeanReducer.builder()  # noqa: B008
+        ),
     ):
         """Ensembler constructor based on splitter supplied in form of an actor builder object."""
 
@@ -350,9 +447,12 @@ class FullStack(Ensembler):
         crossvalidator=None,
         splitter=paymod.PandasCVFolds,
         nsplits=None,
+        keep=None,
+        refit=False,
+        coschedule=False,
         appender=paymod.PandasConcat.builder(axis='columns', ignore_index=False),  # noqa: B008
         stacker=paymod.PandasConcat.builder(axis='index', ignore_index=True),  # noqa: B008
-        reducer=pandas_mean,
+        reducer=_reducing.MeanReducer.builder(),  # noqa: B008
     ):
         def ensure_builder(merger: 'typing.Union[typing.Callable[..., flow.Features], flow.Builder]') -> 'flow.Builder':
             """If the merger is provided as a plain function/method, wrap it using ``payload.Apply``."""
@@ -365,6 +465,9 @@ class FullStack(Ensembler):
             crossvalidator=crossvalidator,
             splitter=splitter,
             nsplits=nsplits,
+            keep=keep,
+            refit=refit,
+            coschedule=coschedule,
             appender=ensure_builder(appender),
             stacker=ensure_builder(stacker),
             reducer=ensure_builder(reducer),
@@ -34,7 +34,7 @@ Note:
 from ._convert import ToPandas, pandas_params
 from ._debug import Dump, Dumpable, PandasCSVDumper, Sniff
 from ._generic import Apply, MapReduce, PandasConcat, PandasDrop, PandasSelect
-from ._split import CrossValidable, CVFoldable, PandasCVFolds
+from ._split import CrossValidable, CVFoldable, NumpyCVFolds, PandasCVFolds
 
 __all__ = [
     'Apply',
@@ -43,6 +43,7 @@ __all__ = [
     'Dump',
     'Dumpable',
     'MapReduce',
+    'NumpyCVFolds',
     'PandasConcat',
     'PandasCSVDumper',
     'PandasCVFolds',
@@ -19,9 +19,11 @@
 Payload splitting functions.
 """
 import abc
+import functools
 import logging
 import typing
 
+import numpy
 import pandas
 from pandas.core import generic as pdtype
 
@@ -128,6 +130,13 @@ class CVFoldable(
                         splitting.
         groups_extractor: Optional *callable* to be applied to the data to extract the group
                           membership vector.
+        view: Provide the folds with contiguous indices as zero-copy *views* of the source data
+              (instead of copies) - the consuming actors then must not modify the fold data in
+              place as it is shared with the source.
+
+    The folds are produced *lazily* - the actor output is just a lightweight sequence holding the
+    source data and the fold indices with the individual folds getting materialized only upon
+    access by their particular consumers (so that not all of the folds need to coexist in memory).
 
     Following is the abstract method that needs to be defined in the implementing classes:
 
@@ -141,15 +150,52 @@ class CVFoldable(
             Returns:
                 Sequence of repeated *train*, *test*, *train*, *test*, ... sets of split fold
                 indexes.
+
+    Implementations should also override the :meth:`take` method to provide an efficient
+    materialization of a single fold (the default falls back to the full :meth:`split`).
     """
 
+    class Folds(typing.Sequence[flow.Features]):
+        """Lazy sequence of the repeated train, test, train, test, ... folds materializing the
+        particular fold only when accessed.
+
+        Args:
+            take: Callable materializing a fold from the source data and its indices.
+            features: Source data to be split.
+            indices: Sequence of fold indices to split by.
+        """
+
+        def __init__(
+            self,
+            take: typing.Callable[[flow.Features, typing.Sequence[int]], flow.Features],
+            features: flow.Features,
+            indices: typing.Sequence[tuple[typing.Sequence[int], typing.Sequence[int]]],
+        ):
+            self._take: typing.Callable[[flow.Features, typing.Sequence[int]], flow.Features] = take
+            self._features: flow.Features = features
+            self._indices: typing.Sequence[typing.Sequence[int]] = tuple(i for f in indices for i in f)
+
+        def __repr__(self):
+            return f'Folds[{len(self) // 2}]'
+
+        def __len__(self):
+            return len(self._indices)
+
+        def __getitem__(self, index: int) -> flow.Features:
+            if isinstance(index, slice):
+                return tuple(self._take(self._features, i) for i in self._indices[index])
+            LOGGER.debug('Materializing fold #%d', index)
+            return self._take(self._features, self._indices[index])
+
     def __init__(
         self,
         crossvalidator: 'payload.CrossValidable[flow.Features, flow.Labels, Column]',
         groups_extractor: typing.Optional[typing.Callable[['flow.Features'], Column]] = None,
+        view: bool = False,
     ):
         self._crossvalidator: CrossValidable[flow.Features, flow.Labels, Column] = crossvalidator
         self._groups_extractor: typing.Optional[typing.Callable[[flow.Features], Column]] = groups_extractor
+        self._view: bool = view
         self._indices: typing.Optional[tuple[tuple[typing.Sequence[int], typing.Sequence[int]]]] = None
 
     def train(self, features: flow.Features, labels: flow.Labels, /) -> None:
@@ -175,7 +221,8 @@ class CVFoldable(
         if not self._indices:
             raise RuntimeError('Splitter not trained')
         LOGGER.debug('Splitting into %d train-test folds', len(self._indices))
-        return self.split(features, self._indices)
+        take = functools.partial(self.take, view=True) if self._view else self.take
+        return self.Folds(take, features, self._indices)
 
     @classmethod
     @abc.abstractmethod
@@ -193,6 +240,38 @@ class CVFoldable(
         """
         raise NotImplementedError()
 
+    @classmethod
+    def take(cls, features: flow.Features, index: typing.Sequence[int], view: bool = False) -> flow.Features:
+        """Materialize a single fold.
+
+        Args:
+            features: Source features to take the fold from.
+            index: Fold indices.
+            view: Provide a zero-copy view of the source data if the indices are contiguous.
+
+        Returns:
+            Fold data.
+        """
+        return cls.split(features, ((index, ()),))[0]
+
+    @staticmethod
+    def contiguous(index: typing.Sequence[int]) -> typing.Optional[slice]:
+        """Get the slice equivalent to the given index if it represents a contiguous range.
+
+        Args:
+            index: Fold indices.
+
+        Returns:
+            Slice instance if contiguous or None.
+        """
+        index = numpy.asarray(index)
+        if not index.size:
+            return None
+        start, stop = int(index[0]), int(index[-1]) + 1
+        if stop - start != index.size or (index.size > 1 and not numpy.all(numpy.diff(index) == 1)):
+            return None
+        return slice(start, stop)
+
     def get_params(self) -> dict[str, typing.Any]:
         """Standard param getter.
 
@@ -229,8 +308,40 @@ class PandasCVFolds(CVFoldable[pandas.DataFrame, pdtype.NDFrame, pandas.Series])
     def split(
         cls, features: pandas.DataFrame, indices: typing.Sequence[tuple[typing.Sequence[int], typing.Sequence[int]]]
     ) -> typing.Sequence[pandas.DataFrame]:
-        return tuple(
-            s
-            for a, b in indices
-            for s in (features.iloc[a].reset_index(drop=True), features.iloc[b].reset_index(drop=True))
-        )
+        return tuple(cls.take(features, i) for f in indices for i in f)
+
+    @classmethod
+    def take(cls, features: pdtype.NDFrame, index: typing.Sequence[int], view: bool = False) -> pdtype.NDFrame:
+        if span := cls.contiguous(index):
+            fold = features.iloc[span] if view else features.iloc[span].copy()
+        else:
+            fold = features.take(index)
+        return fold.set_axis(pandas.RangeIndex(len(fold)), axis=0, copy=False)
+
+
+class NumpyCVFolds(CVFoldable[numpy.ndarray, numpy.ndarray, numpy.ndarray]):
+    """Cross-validation splitter of train-test folds working with Numpy array payloads.
+
+    See the :class:`payload.CVFoldable <forml.pipeline.payload.CVFoldable>` base class for more
+    details and the synopsis.
+
+    Folds with non-contiguous indices are gathered directly into preallocated buffers.
+    """
+
+    @classmethod
+    def split(
+        cls, features: numpy.ndarray, indices: typing.Sequence[tuple[typing.Sequence[int], typing.Sequence[int]]]
+    ) -> typing.Sequence[numpy.ndarray]:
+        return tuple(cls.take(features, i) for f in indices for i in f)
+
+    @classmethod
+    def take(cls, features: numpy.ndarray, index: typing.Sequence[int], view: bool = False) -> numpy.ndarray:
+        features = numpy.asarray(features)
+        index = numpy.asarray(index, dtype=numpy.intp)
+        if index.size and (index.min() < 0 or index.max() >= len(features)):
+            raise IndexError(f'Fold indices out of bounds for size {len(features)}')
+        if span := cls.contiguous(index):
+            return features[span] if view else features[span].copy()
+        fold = numpy.empty((len(index), *features.shape[1:]), dtype=features.dtype)
+        # the indices are validated so clipping is a no-op allowing to write directly into the buffer
+        return numpy.take(features, index, axis=0, out=fold, mode='clip')
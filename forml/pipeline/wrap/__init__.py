@@ -24,7 +24,7 @@ defined using the wrappers provided within this module.
 """
 
 from ._actor import Actor
-from ._auto import AUTO, Auto, AutoSklearnClassifier, AutoSklearnRegressor, AutoSklearnTransformer, importer
+from ._auto import AUTO, Auto, AutoSklearnClassifier, AutoSklearnRegressor, AutoSklearnTransformer, Fast, importer
 from ._operator import Operator
 
 #: The default list of :class:`auto-wrapper <forml.pipeline.wrap.Auto>` implementations
@@ -40,6 +40,7 @@ __all__ = [
     'AutoSklearnTransformer',
     'AutoSklearnClassifier',
     'AutoSklearnRegressor',
+    'Fast',
     'importer',
     'Operator',
 ]
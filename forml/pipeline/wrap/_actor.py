@@ -28,9 +28,8 @@ import logging
 import types
 import typing
 
-import cloudpickle
-
 from forml import flow
+from forml.io import asset
 
 LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +62,7 @@ class Class(abc.ABCMeta):
 
         def __init__(self, *args, **kwargs):
             self._origin = self.Origin(*args, **kwargs)
+            self._targets: dict[str, typing.Any] = {}  # cache of the resolved mapping targets
 
         def apply(self, *features: flow.Features) -> flow.Result:
             return self.Mapping['apply'](*features)
@@ -72,11 +72,19 @@ class Class(abc.ABCMeta):
             attr = cls.Mapping[flow.Actor.train.__name__]
             return callable(attr) or hasattr(cls.Origin, attr)
 
+        _dumps = staticmethod(asset.serialize)
+        _loads = staticmethod(asset.deserialize)
+
         def __getattribute__(self, item):
-            if item not in {'Origin', 'Mapping', '_origin'}:
+            if item not in {'Origin', 'Mapping', '_origin', '_targets', '_dumps', '_loads'}:
+                targets = super().__getattribute__('_targets')
+                if item in targets:  # fast path for the already resolved targets
+                    return targets[item]
                 if item in self.Mapping:
                     attr = self.Mapping[item]
-                    return self.Decorated(self._origin, attr) if callable(attr) else getattr(self._origin, attr)
+                    origin = self._origin
+                    targets[item] = target = self.Decorated(origin, attr) if callable(attr) else getattr(origin, attr)
+                    return target
                 if hasattr(self._origin, item):
                     return getattr(self._origin, item)
             return super().__getattribute__(item)
@@ -231,11 +239,11 @@ class Stateful(abc.ABCMeta):
         def get_state(self) -> bytes:
             if self._state is None:
                 return b''
-            return cloudpickle.dumps(self._state)
+            return asset.serialize(self._state)
 
         def set_state(self, state: bytes) -> None:
             if state:
-                self._state = cloudpickle.loads(state)
+                self._state = asset.deserialize(state)
 
     def __new__(
         mcs,
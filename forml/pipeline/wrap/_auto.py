@@ -28,6 +28,8 @@ import sys
 import types
 import typing
 
+import numpy
+import pandas
 from sklearn import base as sklbase
 
 from . import _actor, _operator
@@ -110,6 +112,62 @@ class AutoClass(collections.namedtuple('AutoClass', 'base, apply'), typing.Gener
         return inspect.isclass(entity) and issubclass(entity, self.base) and not inspect.isabstract(entity)
 
 
+class Fast(collections.namedtuple('Fast', 'target, train')):
+    """Fast-path actor mapping target passing the features to the wrapped target as plain numpy
+    arrays.
+
+    When trained using a dataframe, its column order gets remembered (within the origin instance
+    so that it becomes part of the actor state) and any dataframe subsequently passed in the
+    apply-mode is first aligned to this order. Numpy arrays are passed through directly (assuming
+    the same column order) and any other (e.g. raw sequence of rows) payload is converted straight
+    to a numpy array without constructing any dataframe.
+
+    Since the wrapped estimator never sees any dataframe, it also skips its feature names
+    validation (which dominates the cost of small-batch predictions).
+
+    Args:
+        target: Origin method name or decorator function implementing the given actor endpoint.
+        train: Whether this is a *train-mode* target (expecting the features and labels).
+    """
+
+    COLUMNS = '_forml_columns'
+    """Name of the origin attribute holding the trained column order."""
+
+    target: typing.Union[str, typing.Callable[..., typing.Any]]
+    train: bool
+
+    def __new__(cls, target: typing.Union[str, typing.Callable[..., typing.Any]], train: bool = False):
+        return super().__new__(cls, target, train)
+
+    def __call__(self, origin: object, features: typing.Any, *args, **kwargs) -> typing.Any:
+        if self.train:
+            setattr(origin, self.COLUMNS, features.columns if isinstance(features, pandas.DataFrame) else None)
+            args = tuple(a.to_numpy() if isinstance(a, (pandas.Series, pandas.DataFrame)) else a for a in args)
+        features = self.numpy(features, getattr(origin, self.COLUMNS, None))
+        if callable(self.target):
+            return self.target(origin, features, *args, **kwargs)
+        return getattr(origin, self.target)(features, *args, **kwargs)
+
+    @staticmethod
+    def numpy(features: typing.Any, columns: typing.Optional[pandas.Index] = None) -> numpy.ndarray:
+        """Convert the features to a numpy array.
+
+        Args:
+            features: Features to be converted.
+            columns: Optional column order to align the dataframe features to.
+
+        Returns:
+            Numpy array of the features.
+        """
+        if isinstance(features, numpy.ndarray):
+            return features
+        if isinstance(features, pandas.DataFrame):
+            if columns is not None and not features.columns.equals(columns):
+                features = features.loc[:, columns]
+            return features.to_numpy()
+        return numpy.asarray(features)
+
+
 class AutoSklearnTransformer(AutoClass[type[sklbase.TransformerMixin]]):
     """Auto-wrapper for turning Scikit-learn *transformers* into ForML operators.
 
@@ -123,11 +181,12 @@ class AutoSklearnTransformer(AutoClass[type[sklbase.TransformerMixin]]):
     Args:
         apply: Customizable :meth:`mapping <forml.pipeline.wrap.Actor.type>` for the *apply-mode*
                target endpoint. Defaults to a ``transform`` literal.
+        fast: Use the :class:`fast-path <forml.pipeline.wrap.Fast>` numpy-only endpoints.
     """
 
-    def __new__(cls, apply: typing.Union[str, typing.Callable[..., typing.Any]] = 'transform'):
+    def __new__(cls, apply: typing.Union[str, typing.Callable[..., typing.Any]] = 'transform', fast: bool = False):
         def wrap(transformer: type[sklbase.TransformerMixin]):
-            return _operator.Operator.mapper(_actor.Actor.type(transformer, train='fit', apply=apply))
+            return _operator.Operator.mapper(_actor.Actor.type(transformer, **_mapping(apply, fast)))
 
         return super().__new__(cls, sklbase.TransformerMixin, wrap)
 
@@ -149,6 +208,11 @@ class AutoSklearnClassifier(AutoClass[type[sklbase.ClassifierMixin]]):
                target endpoint. Defaults to a callback hitting the ``.predict_proba`` and returning
                the last of its produced columns (conveniently the 1-class probability in case of
                binary classification; for multiclass this needs tweaking).
+        fast: Use the :class:`fast-path <forml.pipeline.wrap.Fast>` numpy-only endpoints.
+
+    Examples:
+        >>> with wrap.importer(wrap.AutoSklearnClassifier(fast=True)):
+        ...     from sklearn.linear_model import LogisticRegression
     """
 
     def __new__(
@@ -156,9 +220,10 @@ class AutoSklearnClassifier(AutoClass[type[sklbase.ClassifierMixin]]):
         apply: typing.Union[str, typing.Callable[..., typing.Any]] = lambda c, *a, **kw: c.predict_proba(  # noqa: B008
             *a, **kw
         ).transpose()[-1],
+        fast: bool = False,
     ):
         def wrap(classifier: type[sklbase.ClassifierMixin]):
-            return _operator.Operator.apply(_actor.Actor.type(classifier, train='fit', apply=apply))
+            return _operator.Operator.apply(_actor.Actor.type(classifier, **_mapping(apply, fast)))
 
         return super().__new__(cls, sklbase.ClassifierMixin, wrap)
 
@@ -176,15 +241,31 @@ class AutoSklearnRegressor(AutoClass[type[sklbase.RegressorMixin]]):
     Args:
         apply: Customizable :meth:`mapping <forml.pipeline.wrap.Actor.type>` for the *apply-mode*
                target endpoint. Defaults to a ``predict`` literal.
+        fast: Use the :class:`fast-path <forml.pipeline.wrap.Fast>` numpy-only endpoints.
     """
 
-    def __new__(cls, apply: typing.Union[str, typing.Callable[..., typing.Any]] = 'predict'):
+    def __new__(cls, apply: typing.Union[str, typing.Callable[..., typing.Any]] = 'predict', fast: bool = False):
         def wrap(regressor: type[sklbase.RegressorMixin]):
-            return _operator.Operator.apply(_actor.Actor.type(regressor, train='fit', apply=apply))
+            return _operator.Operator.apply(_actor.Actor.type(regressor, **_mapping(apply, fast)))
 
         return super().__new__(cls, sklbase.RegressorMixin, wrap)
 
 
+def _mapping(apply: typing.Union[str, typing.Callable[..., typing.Any]], fast: bool) -> dict[str, typing.Any]:
+    """Helper for assembling the Scikit-learn actor mapping.
+
+    Args:
+        apply: Apply-mode target endpoint.
+        fast: Use the fast-path endpoints.
+
+    Returns:
+        Actor mapping.
+    """
+    if fast:
+        return {'train': Fast('fit', train=True), 'apply': Fast(apply)}
+    return {'train': 'fit', 'apply': apply}
+
+
 #: Default list of auto-wrapper implementations.
 AUTO = [
     AutoSklearnTransformer(),
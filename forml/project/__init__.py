@@ -22,7 +22,7 @@ import pathlib
 import typing
 
 from ._body import Artifact, Components
-from ._component import Evaluation, Source, setup
+from ._component import Evaluation, Source, Tuning, setup
 from ._distribution import Manifest, Package
 from ._setuptools import Tree
 
@@ -36,6 +36,7 @@ __all__ = [
     'setup',
     'Source',
     'Tree',
+    'Tuning',
 ]
 
 
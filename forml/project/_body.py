@@ -38,12 +38,13 @@ if typing.TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 
-class Components(collections.namedtuple('Components', 'source, pipeline, evaluation')):
+class Components(collections.namedtuple('Components', 'source, pipeline, evaluation, tuning')):
     """Tuple of all the principal components constituting a ForML project."""
 
     source: 'project.Source'
     pipeline: flow.Composable
     evaluation: typing.Optional['project.Evaluation']
+    tuning: typing.Optional['project.Tuning']
 
     class Builder(abc.Set):
         """Descriptor builder allowing to setup attributes one by one."""
@@ -89,6 +90,7 @@ class Components(collections.namedtuple('Components', 'source, pipeline, evaluat
         source: 'project.Source',
         pipeline: flow.Composable,
         evaluation: typing.Optional['project.Evaluation'] = None,
+        tuning: typing.Optional['project.Tuning'] = None,
     ):
         if not isinstance(pipeline, flow.Composable):
             raise forml.InvalidError('Invalid pipeline')
@@ -96,7 +98,9 @@ class Components(collections.namedtuple('Components', 'source, pipeline, evaluat
             raise forml.InvalidError('Invalid source')
         if evaluation and not isinstance(evaluation, _component.Evaluation):
             raise forml.InvalidError('Invalid evaluation')
-        return super().__new__(cls, source, pipeline, evaluation)
+        if tuning and not isinstance(tuning, _component.Tuning):
+            raise forml.InvalidError('Invalid tuning')
+        return super().__new__(cls, source, pipeline, evaluation, tuning)
 
     @classmethod
     def load(
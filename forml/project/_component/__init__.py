@@ -22,6 +22,7 @@ import collections
 import enum
 import functools
 import importlib
+import itertools
 import logging
 import operator
 import secrets
@@ -73,6 +74,15 @@ def setup(evaluation: 'project.Evaluation') -> None:
     """
 
 
+@typing.overload
+def setup(tuning: 'project.Tuning') -> None:
+    """Tuning component setup entrypoint.
+
+    Args:
+        tuning: Tuning descriptor.
+    """
+
+
 def setup(component) -> None:  # pylint: disable=unused-argument
     """Interface for registering principal component instances.
 
@@ -87,6 +97,7 @@ def setup(component) -> None:  # pylint: disable=unused-argument
         pipeline: Workflow expression.
         schema: Optional schema of the pipeline output.
         evaluation: Evaluation descriptor.
+        tuning: Tuning descriptor.
     """
     LOGGER.debug('Principal component setup attempted outside of a loader context: %s', component)
 
@@ -131,7 +142,7 @@ class Source(typing.NamedTuple):
     class Extract(collections.namedtuple('Extract', 'train, apply, labels, ordinal')):
         """Combo of select statements for the different modes."""
 
-        class Ordinal(collections.namedtuple('Ordinal', 'column, once')):
+        class Ordinal(collections.namedtuple('Ordinal', 'column, once, incremental')):
             """Ordinal specs."""
 
             @enum.unique
@@ -172,14 +183,19 @@ class Source(typing.NamedTuple):
 
             column: 'dsl.Operable'
             once: 'project.Source.Extract.Ordinal.Once'
+            incremental: bool
 
             def __new__(
                 cls,
                 column: 'dsl.Operable',
                 once: typing.Optional[typing.Union[str, 'project.Source.Extract.Ordinal.Once']],
+                incremental: bool = False,
             ):
                 return super().__new__(
-                    cls, dslmod.Operable.ensure_is(column), cls.Once(once) if once else cls.Once.EXACTLY
+                    cls,
+                    dslmod.Operable.ensure_is(column),
+                    cls.Once(once) if once else cls.Once.EXACTLY,
+                    bool(incremental),
                 )
 
             def where(
@@ -213,6 +229,7 @@ class Source(typing.NamedTuple):
             labels: typing.Optional['project.Source.Labels'],
             ordinal: typing.Optional['dsl.Operable'],
             once: typing.Optional[typing.Union[str, 'project.Source.Extract.Ordinal.Once']],
+            incremental: bool = False,
         ):
             train = train.statement
             apply = apply.statement
@@ -226,9 +243,11 @@ class Source(typing.NamedTuple):
             if train.schema != apply.schema:
                 raise forml.InvalidError('Train-apply schema mismatch')
             if ordinal:
-                ordinal = cls.Ordinal(ordinal, once)
+                ordinal = cls.Ordinal(ordinal, once, incremental)
             elif once:
                 raise forml.InvalidError('Once without an Ordinal')
+            elif incremental:
+                raise forml.InvalidError('Incremental without an Ordinal')
             return super().__new__(cls, train, apply, labels, ordinal)
 
     @classmethod
@@ -239,6 +258,7 @@ class Source(typing.NamedTuple):
         apply: typing.Optional['dsl.Source'] = None,
         ordinal: typing.Optional['dsl.Operable'] = None,
         once: typing.Optional[str] = None,
+        incremental: bool = False,
     ) -> 'project.Source':
         """Factory method for creating a new Source descriptor instance with the given *extraction*
         parameters.
@@ -264,11 +284,21 @@ class Source(typing.NamedTuple):
                     loss in case of continuous ordinals - safe for discrete values).
                   * ``exactly``: Include the lower bound but leave the upper bound out for the next
                     batch (excludes processing of the tail records).
+            incremental: Enable the *incremental training* mode in which each training run only
+                         extracts the slice of data added since the previous generation (tracked
+                         as the ordinal *watermark* persisted in the generation tag). Requires the
+                         ``ordinal`` column and is only meaningful if all the stateful actors of
+                         the pipeline support incremental (``partial_fit``-style) training on top of
+                         their previous states. Note that with the ``exactly`` (once) semantic,
+                         the records at the watermark are left for the next run which is skipped
+                         unless newer data arrives.
 
         Returns:
             Source component instance.
         """
-        return cls(cls.Extract(features, apply or features, labels, ordinal, once))  # pylint: disable=no-member
+        return cls(
+            cls.Extract(features, apply or features, labels, ordinal, once, incremental)  # pylint: disable=no-member
+        )
 
     def __rshift__(self, transform: 'flow.Composable') -> 'project.Source':
         return self.__class__(self.extract, self.transform >> transform if self.transform else transform)
@@ -302,6 +332,9 @@ class Evaluation(typing.NamedTuple):
         metric: Loss/Score function to be used to quantify the prediction quality.
         method: Strategy for generating data for the development train-test evaluation (e.g.
                 *holdout* or *cross-validation*, etc).
+        chunks: Number of contiguous chunks to split the production window into for the
+                :ref:`performance tracking <evaluation-perftrack>` (see
+                :class:`evaluation.PerfTrackScore <forml.evaluation.PerfTrackScore>`).
 
     Examples:
         >>> EVALUATION = project.Evaluation(
@@ -316,6 +349,68 @@ class Evaluation(typing.NamedTuple):
     method: 'evaluation.Method'
     """Strategy for generating data for the development train-test evaluation. """
 
+    chunks: int = 1
+    """Number of chunks to split the production window into for the performance tracking."""
+
+
+class Tuning(typing.NamedTuple):
+    """Tuning component descriptor representing the hyper-parameter search configuration.
+
+    The search space is the cartesian product of all the candidate values of all the listed
+    hyper-parameters. All the variants are evaluated using the project :class:`Evaluation
+    <forml.project.Evaluation>` spec with the *successive-halving* early stopping - each *rung*
+    evaluates the remaining variants on a growing random sample of the training data and only the
+    best ``1/eta`` of them advance to the next rung (the last rung uses the full dataset).
+
+    Args:
+        space: Mapping of actor types (or their names) to the mappings of their hyper-parameter
+               names and the candidate values.
+        rungs: Number of the successive-halving rungs (``1`` means plain exhaustive search).
+        eta: Reduction factor of the successive-halving.
+        maximize: Whether the evaluation metric is a score to be maximized (rather than a loss to
+                  be minimized).
+        seed: Optional random seed for the training data sampling.
+
+    Examples:
+        >>> TUNING = project.Tuning(
+        ...     {LogisticRegression: {'C': [0.1, 1, 10], 'max_iter': [50, 100]}},
+        ...     rungs=2,
+        ... )
+    """
+
+    space: typing.Mapping[typing.Union[type['flow.Actor'], str], typing.Mapping[str, typing.Sequence[typing.Any]]]
+    """Mapping of actor types (or names) to their hyper-parameter candidates."""
+
+    rungs: int = 1
+    """Number of the successive-halving rungs."""
+
+    eta: int = 3
+    """Reduction factor of the successive-halving."""
+
+    maximize: bool = False
+    """Whether the evaluation metric is a score to be maximized."""
+
+    seed: typing.Optional[int] = None
+    """Random seed for the training data sampling."""
+
+    @property
+    def variants(
+        self,
+    ) -> tuple[typing.Mapping[typing.Union[type['flow.Actor'], str], typing.Mapping[str, typing.Any]]]:
+        """Expand the search space into the individual hyper-parameter variants.
+
+        Returns:
+            Sequence of mappings of actor types (or names) to their particular hyper-parameters.
+        """
+        keys = [(a, p) for a, c in self.space.items() for p in c]
+        variants = []
+        for values in itertools.product(*(self.space[a][p] for a, p in keys)):
+            variant = collections.defaultdict(dict)
+            for (actor, param), value in zip(keys, values):
+                variant[actor][param] = value
+            variants.append(dict(variant))
+        return tuple(variants)
+
 
 class Virtual:
     """Virtual component module based on a real component instance."""
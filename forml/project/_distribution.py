@@ -19,7 +19,9 @@
 Project distribution.
 """
 import collections
+import contextlib
 import functools
+import hashlib
 import json
 import logging
 import pathlib
@@ -30,6 +32,7 @@ import sys
 import tempfile
 import types
 import typing
+import uuid
 import zipfile
 
 import forml
@@ -38,6 +41,11 @@ from forml.io import asset
 
 from . import _body
 
+try:
+    import fcntl
+except ImportError:  # non-posix platform
+    fcntl = None
+
 if typing.TYPE_CHECKING:
     from forml import project
 
@@ -59,6 +67,7 @@ class Package(collections.namedtuple('Package', 'path, manifest')):
     FORMAT = '4ml'
     COMPRESSION = zipfile.ZIP_DEFLATED
     PYSFX = re.compile(r'\.py[co]?$')
+    NATIVE = re.compile(r'\.(so|pyd|dylib)$')
 
     def __new__(cls, path: typing.Union[str, pathlib.Path]):
         path = pathlib.Path(path)
@@ -111,9 +120,8 @@ class Package(collections.namedtuple('Package', 'path, manifest')):
                 target = item.relative_to(root)
                 if not valid(target):
                     continue
-                if not item.is_dir():
-                    archive.write(item, target)
-                else:
+                archive.write(item, target)  # including directory entries required by zipimport
+                if item.is_dir():
                     writeall(item, archive, root)
 
         descriptor = Manifest.path('.')
@@ -124,57 +132,140 @@ class Package(collections.namedtuple('Package', 'path, manifest')):
             writeall(pathlib.Path(source), package)
         return cls(path)
 
-    def install(self, path: typing.Union[str, pathlib.Path]) -> 'project.Artifact':
+    @functools.cached_property
+    def digest(self) -> typing.Optional[str]:
+        """Content hash of a zip-file package (None for directory based packages).
+
+        Returns:
+            Hex digest of the package file.
+        """
+        if not self.path.is_file():
+            return None
+        digest = hashlib.sha256()
+        with self.path.open('rb') as package:
+            for chunk in iter(lambda: package.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def install(self, path: typing.Union[str, pathlib.Path], lazy: bool = False) -> 'project.Artifact':
         """Return the project artifact based on this package mounted on the given path.
 
+        The installation is keyed by the package digest so repeated installs of the same package to
+        the same location (even by different processes sharing the file system) are served from the
+        existing installation. Concurrent installations are serialized using a file lock.
+
+        Zip-safe packages (containing only python modules) are installed as the plain archive
+        importable using the :mod:`python:zipimport` mechanism, other packages are extracted unless
+        installed in the *lazy* mode.
+
         Args:
             path: Target install path.
+            lazy: Install the archive (unless containing native extensions) to be lazily imported
+                  directly from it even if it contains non-python data files (which are then only
+                  accessible using the :mod:`python:importlib.resources` API).
 
         Returns:
             Artifact instance.
         """
-
-        def uninstalled() -> bool:
-            """Prune the existing path if not matching the target manifest.
-
-            Returns:
-                True if uninstalled.
-            """
-            try:
-                # to allow installing "virtual" packages this even ignores invalid self.path
-                if Manifest.read(path) == self.manifest:
-                    LOGGER.debug('Package %s already installed', self.path)
-                    return False
-            except forml.InvalidError:
-                pass
-            if path.exists():
-                LOGGER.warning('Deleting existing content at %s', path)
-                if path.is_dir():
-                    shutil.rmtree(path)
-                else:
-                    path.unlink()
-            return True
-
         path = pathlib.Path(path)
         if path.exists() and path.samefile(self.path):
             LOGGER.debug('Same source-target install attempt ignored')
-        elif uninstalled():
-            if not zipfile.is_zipfile(self.path):
-                assert self.path.is_dir(), f'Expecting zip file or directory: {self.path}'
-                LOGGER.debug('Installing directory based package %s to %s', self.path, path)
-                shutil.copytree(self.path, path)
-            else:
-                with zipfile.ZipFile(self.path) as package:
-                    if all(self.PYSFX.search(n) for n in package.namelist()):  # is a zip-safe
-                        LOGGER.debug('Installing zip-safe package %s to %s', self.path, path)
-                        path.parent.mkdir(parents=True, exist_ok=True)
-                        path.write_bytes(self.path.read_bytes())
-                    else:
-                        LOGGER.debug('Extracting non zip-safe package %s to %s', self.path, path)
-                        package.extractall(path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock(path):
+                if self._installed(path):
+                    LOGGER.debug('Package %s already installed', self.path)
+                else:
+                    self._deploy(path, lazy)
         setup.search(path)
         return _body.Artifact(path, self.manifest.package, **self.manifest.modules)
 
+    @staticmethod
+    @contextlib.contextmanager
+    def _lock(path: pathlib.Path) -> typing.Iterator[None]:
+        """Exclusive inter-process lock of the given install path.
+
+        Args:
+            path: Install path to be locked.
+        """
+        if not fcntl:
+            yield
+            return
+        with (path.parent / f'.{path.name}.lock').open('w') as lockfile:
+            fcntl.flock(lockfile, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lockfile, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _stamp(path: pathlib.Path) -> pathlib.Path:
+        """Path of the file holding the digest of the package installed on the given path.
+
+        Args:
+            path: Install path.
+
+        Returns:
+            Stamp file path.
+        """
+        return path.parent / f'.{path.name}.sha256'
+
+    def _installed(self, path: pathlib.Path) -> bool:
+        """Check this package is already installed on the given path.
+
+        Args:
+            path: Install path.
+
+        Returns:
+            True if installed.
+        """
+        if not path.exists():
+            return False
+        if self.digest:
+            stamp = self._stamp(path)
+            return stamp.exists() and stamp.read_text() == self.digest
+        try:
+            # to allow installing "virtual" packages this even ignores invalid self.path
+            return Manifest.read(path) == self.manifest
+        except forml.InvalidError:
+            return False
+
+    def _deploy(self, path: pathlib.Path, lazy: bool) -> None:
+        """Install the package content to the given path replacing any existing content.
+
+        Args:
+            path: Install path.
+            lazy: Install the archive for lazy import if possible.
+        """
+        partial = path.with_name(f'.{path.name}.{uuid.uuid4().hex}')
+        if not zipfile.is_zipfile(self.path):
+            assert self.path.is_dir(), f'Expecting zip file or directory: {self.path}'
+            LOGGER.debug('Installing directory based package %s to %s', self.path, path)
+            shutil.copytree(self.path, partial)
+        else:
+            with zipfile.ZipFile(self.path) as package:
+                names = package.namelist()
+                names = [n for n in names if not n.endswith('/')]
+                if all(self.PYSFX.search(n) for n in names) or (lazy and not any(self.NATIVE.search(n) for n in names)):
+                    LOGGER.debug('Installing zip-importable package %s to %s', self.path, path)
+                    shutil.copyfile(self.path, partial)
+                else:
+                    LOGGER.debug('Extracting non zip-safe package %s to %s', self.path, path)
+                    package.extractall(partial)
+        if path.exists():
+            LOGGER.warning('Deleting existing content at %s', path)
+            obsolete = path.rename(path.with_name(f'.{path.name}.{uuid.uuid4().hex}'))
+            if obsolete.is_dir():
+                shutil.rmtree(obsolete)
+            else:
+                obsolete.unlink()
+        partial.rename(path)
+        stamp = self._stamp(path)
+        if self.digest:
+            stamp.write_text(self.digest)
+        else:
+            stamp.unlink(missing_ok=True)
+
 
 class Manifest(collections.namedtuple('Manifest', 'name, version, package, modules')):
     """ForML distribution package metadata manifest.
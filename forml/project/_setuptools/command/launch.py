@@ -99,8 +99,8 @@ class Tune(Mode):
     description = 'trigger the development tune mode'
 
     @staticmethod
-    def launch(launcher: 'runtime.Virtual.Handler', *args, **kwargs) -> None:
-        raise NotImplementedError('Tune mode is not yet supported')
+    def launch(launcher: 'runtime.Virtual.Handler', *args, **kwargs) -> typing.Sequence[tuple[typing.Mapping, float]]:
+        return launcher.tune(*args, **kwargs)
 
 
 class Eval(Mode):
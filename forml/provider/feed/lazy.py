@@ -213,7 +213,8 @@ class Feed(alchemy.Feed):
 
         def __call__(self, statement: dsl.Statement, entry: typing.Optional[layout.Entry] = None) -> layout.Tabular:
             complete = entry and self._match_entry(statement.schema, entry.schema)[0]
-            if not complete and not self.RESULTS.exists(self._parse_statement(statement)):
+            # augmentation lookups bypass the results cache so the origins always need registering
+            if not complete and (entry or not self.RESULTS.exists(self._parse_statement(statement))):
                 for table, columns in _Columns.extract(statement):
                     LOGGER.debug('Request for %s using columns: %s', table, columns)
                     if table not in self._origins:
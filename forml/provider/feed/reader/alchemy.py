@@ -18,15 +18,28 @@
 """
 SQLAlchemy based ETL reader.
 """
+import collections
+import enum
+import functools
+import hashlib
+import itertools
+import json
 import logging
 import operator
+import os
+import pathlib
+import tempfile
+import threading
+import time
 import typing
 
 import pandas
-from sqlalchemy import func, sql
+import sqlalchemy
+from sqlalchemy import engine, func, sql
 from sqlalchemy import types as sqltypes
 from sqlalchemy.engine import interfaces
 
+import forml
 from forml import io
 from forml.io import dsl
 from forml.io.dsl import function
@@ -60,6 +73,7 @@ class Parser(parsmod.Visitor[sql.Selectable, sql.ColumnElement]):  # pylint: dis
         function.GreaterEqual: operator.ge,
         function.Equal: operator.eq,
         function.NotEqual: operator.ne,
+        function.IsIn: lambda c, *v: c.in_(v),
         function.IsNull: lambda c: c.is_(None),
         function.NotNull: lambda c: c.is_not(None),
         function.And: operator.and_,
@@ -77,6 +91,15 @@ class Parser(parsmod.Visitor[sql.Selectable, sql.ColumnElement]):  # pylint: dis
         function.Floor: func.floor,
     }
 
+    def __init__(
+        self,
+        sources: typing.Mapping[dsl.Source, sql.Selectable],
+        features: typing.Mapping[dsl.Feature, sql.ColumnElement],
+        literals: typing.Optional[typing.Mapping[tuple[typing.Any, dsl.Any], str]] = None,
+    ):
+        super().__init__(sources, features)
+        self._literals: typing.Mapping[tuple[typing.Any, dsl.Any], str] = literals or {}
+
     def resolve_feature(self, feature: dsl.Feature) -> sql.ColumnElement:
         """Resolver falling back to a field name in case of no explicit mapping.
 
@@ -128,7 +151,7 @@ class Parser(parsmod.Visitor[sql.Selectable, sql.ColumnElement]):  # pylint: dis
             Literal.
         """
         try:
-            return sql.bindparam(None, value, self.KIND[kind])
+            return sql.bindparam(self._literals.get((value, kind)), value, self.KIND[kind])
         except KeyError as err:
             raise dsl.UnsupportedError(f'Unsupported literal kind: {kind}') from err
 
@@ -255,49 +278,472 @@ class Parser(parsmod.Visitor[sql.Selectable, sql.ColumnElement]):  # pylint: dis
         return ref, ref
 
 
+class Pool:
+    """Process-local registry of pooled SQLAlchemy engines.
+
+    Engines (owning the actual connection pools) are not serializable, so the readers only carry
+    the connection URL together with the pool options and the engine gets lazily created within
+    each process upon its first use. All readers (and their concurrently executing drivers) of the
+    same URL and options within the process share the single engine.
+
+    Processes forked from a parent holding any engines drop the inherited instances (without closing
+    the parent connections) to avoid sharing sockets across process boundaries.
+    """
+
+    _ENGINES: dict[tuple[str, tuple[tuple[str, typing.Any], ...]], engine.Engine] = {}
+    _LOCK: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get(cls, url: str, **options: typing.Any) -> engine.Engine:
+        """Get the (cached) engine instance for the given URL and pool options.
+
+        Args:
+            url: SQLAlchemy database URL.
+            options: Engine (pool) options as accepted by :func:`sqlalchemy.create_engine`.
+
+        Returns:
+            Pooled engine instance.
+        """
+        key = url, tuple(sorted(options.items()))
+        with cls._LOCK:
+            if key not in cls._ENGINES:
+                LOGGER.debug('Creating pooled engine for %s', url)
+                cls._ENGINES[key] = sqlalchemy.create_engine(url, **options)
+            return cls._ENGINES[key]
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop all the engines held by this process without closing the pooled connections (which
+        might still be in use by a parent process).
+        """
+        for instance in cls._ENGINES.values():
+            instance.dispose(close=False)
+        cls._ENGINES.clear()
+        cls._LOCK = threading.Lock()
+
+
+os.register_at_fork(after_in_child=Pool.reset)
+
+
+class Plans:
+    """Filesystem backed cache of compiled query plans shared across processes.
+
+    Each plan is the parsed statement compiled (for the particular dialect) into a plain SQL text
+    with the DSL literals turned into named bind parameters. It is keyed by a *structural*
+    fingerprint of the DSL statement (excluding the literal values) and the reader content resolver
+    mappings so that repeated runs (or independent processes) can skip the parsing (and compiling)
+    entirely - even if the literal values change (i.e. the ordinal bounds of the incremental
+    extraction). The plans are stored as plain JSON documents (never unpickled).
+
+    The cache directory is only created upon storing the first plan. Plans not used for longer than
+    the ``ttl`` are dropped as well as the least recently used ones exceeding the ``capacity`` (which
+    also limits the number of plans kept in memory).
+
+    Args:
+        path: Cache directory.
+        capacity: Maximum number of the plans kept on disk (and in memory).
+        ttl: Maximum age (in seconds since the last use) of the plans kept on disk.
+    """
+
+    SUFFIX = '.plan'
+    RUNTIME = f'forml-{forml.__version__}:sqlalchemy-{sqlalchemy.__version__}'
+    """Versions of the libraries the compiled plans depend on (part of the fingerprint)."""
+    PARAMETER = 'literal_{}'
+    """Bind parameter name template for the statement literals."""
+
+    class Plan(typing.NamedTuple):
+        """Compiled plan."""
+
+        text: str
+        """SQL text of the statement."""
+        parameters: typing.Sequence[str]
+        """Names of the bind parameters representing the statement literals."""
+        fixed: typing.Mapping[str, typing.Any]
+        """Values of the remaining bind parameters (i.e. the row limits)."""
+        columns: typing.Sequence[tuple[str, str]]
+        """Names and the (generic SQLAlchemy) type names of the result columns."""
+
+    def __init__(self, path: pathlib.Path, capacity: int = 1024, ttl: float = 30 * 24 * 3600):
+        self._plans: collections.OrderedDict[str, Plans.Plan] = collections.OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._path: pathlib.Path = path
+        self._capacity: int = capacity
+        self._ttl: float = ttl
+
+    def __getstate__(self):
+        return self._path, self._capacity, self._ttl
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @classmethod
+    def literals(cls, statement: dsl.Statement) -> typing.Mapping[tuple[typing.Any, dsl.Any], str]:
+        """Get the bind parameter names of the distinct literals of the given statement.
+
+        The names are assigned in the order of the first occurrence of each literal so that
+        statements of the same structure get the same names for the literals in the same
+        positions.
+
+        Args:
+            statement: DSL statement to get the literals for.
+
+        Returns:
+            Mapping of the literal (value, kind) tuples to the bind parameter names.
+        """
+        literals = {}
+
+        def walk(node: typing.Any) -> None:
+            """Recursive literal collector."""
+            if isinstance(node, dsl.Literal):
+                literals.setdefault((node.value, node.kind), cls.PARAMETER.format(len(literals)))
+            elif isinstance(node, tuple) and not isinstance(node, (enum.Enum, dsl.Source.Schema)):
+                for item in node:
+                    walk(item)
+
+        walk(statement)
+        return literals
+
+    @classmethod
+    def fingerprint(
+        cls,
+        statement: dsl.Statement,
+        sources: typing.Mapping[dsl.Source, sql.Selectable],
+        features: typing.Mapping[dsl.Feature, sql.ColumnElement],
+        dialect: interfaces.Dialect,
+    ) -> str:
+        """Get the stable key for the given statement and resolver mappings.
+
+        Unlike the object hashes (or the DSL representations), the key is stable across processes
+        and reflects the full structure including the schema definitions (as well as the versions
+        of the involved libraries). The literal values are represented just by their kinds and
+        their bind parameter names (see :meth:`literals`).
+
+        Args:
+            statement: DSL statement to get the key for.
+            sources: Source mappings used by the parser.
+            features: Feature mappings used by the parser.
+            dialect: Target SQL dialect.
+
+        Returns:
+            Hexadecimal key digest.
+        """
+        literals = cls.literals(statement)
+
+        def update(node: typing.Any) -> None:
+            """Recursive structure digest."""
+            if isinstance(node, dsl.Source.Schema):
+                digest.update(f'<{node.__qualname__}>('.encode())
+                for field in node:
+                    update(field)
+                digest.update(b')')
+            elif isinstance(node, dsl.Literal):
+                digest.update(f'<Literal>{node.kind!r}:{literals[node.value, node.kind]},'.encode())
+            elif isinstance(node, tuple) and not isinstance(node, enum.Enum):
+                digest.update(f'<{node.__class__.__module__}:{node.__class__.__qualname__}>('.encode())
+                for item in node:
+                    update(item)
+                digest.update(b')')
+            else:
+                digest.update(f'<{node.__class__.__qualname__}>{node!r},'.encode())
+
+        digest = hashlib.sha256(f'{cls.RUNTIME}:{dialect.name}'.encode())
+        update(statement)
+        for mapping in sources, features:
+            for key, value in sorted(((k, str(v)) for k, v in mapping.items()), key=lambda i: (repr(i[0]), i[1])):
+                update(key)
+                digest.update(f'={value};'.encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def compile(
+        statement: sql.Selectable, dialect: interfaces.Dialect, literals: typing.Collection[str]
+    ) -> typing.Optional['Plans.Plan']:
+        """Compile the statement into a plan.
+
+        Args:
+            statement: Parsed statement to be compiled.
+            dialect: Target SQL dialect.
+            literals: Bind parameter names of the statement literals.
+
+        Returns:
+            Compiled plan or None if the statement can't be represented as a static text.
+        """
+        dialect = dialect.__class__(paramstyle='named')
+        compiled = statement.compile(dialect=dialect)
+        text = str(compiled)
+        if 'POSTCOMPILE' in text:  # expanding parameters can't be precompiled
+            return None
+        fixed = {k: v for k, v in compiled.params.items() if k not in literals}
+        if not all(isinstance(v, (bool, int, float, str, type(None))) for v in fixed.values()):
+            return None
+        columns = [(c.key, c.type.__class__.__name__) for c in statement.selected_columns]
+        return Plans.Plan(text, [k for k in compiled.params if k in literals], fixed, columns)
+
+    @staticmethod
+    def bind(plan: 'Plans.Plan', literals: typing.Mapping[tuple[typing.Any, dsl.Any], str]) -> sqlalchemy.TextualSelect:
+        """Bind the plan to the actual literal values.
+
+        The result columns get typed (as in the original parsed statement) so that the result
+        values are processed the same way.
+
+        Args:
+            plan: Compiled plan.
+            literals: Literals of the actual statement and their bind parameter names.
+
+        Returns:
+            Executable textual select.
+        """
+
+        def column(name: str, kind: str) -> sql.ColumnElement:
+            """Typed result column (falling back to no type if not a generic one)."""
+            kind = getattr(sqltypes, kind, None)
+            try:
+                kind = kind() if isinstance(kind, type) and issubclass(kind, sqltypes.TypeEngine) else None
+            except TypeError:  # requiring arguments
+                kind = None
+            return sql.column(name, kind)
+
+        parameters = set(plan.parameters)
+        return (
+            sql.text(plan.text)
+            .bindparams(
+                *(sql.bindparam(n, v, type_=Parser.KIND[k]) for (v, k), n in literals.items() if n in parameters),
+                *(sql.bindparam(n, v) for n, v in plan.fixed.items()),
+            )
+            .columns(*(column(n, k) for n, k in plan.columns))
+        )
+
+    def get_or_parse(
+        self,
+        statement: dsl.Statement,
+        key: str,
+        parser: typing.Callable[[typing.Mapping[tuple[typing.Any, dsl.Any], str]], sql.Selectable],
+        dialect: interfaces.Dialect,
+    ) -> sql.Selectable:
+        """Get the plan from the cache or parse and compile it.
+
+        Args:
+            statement: DSL statement to get the plan for.
+            key: Plan key (see :meth:`fingerprint`).
+            parser: Callback for parsing the statement using the given literal parameter names.
+            dialect: Target SQL dialect.
+
+        Returns:
+            The bound plan (or the parsed statement if not compilable).
+        """
+        literals = self.literals(statement)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan:
+                self._plans.move_to_end(key)
+        if not plan:
+            path = self._path / f'{key}{self.SUFFIX}'
+            plan = self._load(path)
+            if plan:
+                LOGGER.debug('Plan cache hit for %s', key)
+                os.utime(path)  # mark as recently used
+            else:
+                LOGGER.debug('Plan cache miss for %s', key)
+                parsed = parser(literals)
+                plan = self.compile(parsed, dialect, set(literals.values()))
+                if plan is None:
+                    return parsed
+                self._path.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile('w', dir=self._path, suffix='.tmp', delete=False) as planfile:
+                    json.dump(plan._asdict(), planfile)
+                os.replace(planfile.name, path)  # atomic for concurrent writers
+                self._prune()
+            with self._lock:
+                self._plans[key] = plan
+                while len(self._plans) > self._capacity:
+                    self._plans.popitem(last=False)
+        return self.bind(plan, literals)
+
+    @classmethod
+    def _load(cls, path: pathlib.Path) -> typing.Optional['Plans.Plan']:
+        """Load the plan from the given file.
+
+        Args:
+            path: Plan file path.
+
+        Returns:
+            Loaded plan or None if not available (or not valid).
+        """
+        try:
+            with path.open() as planfile:
+                return cls.Plan(**json.load(planfile))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError):
+            LOGGER.warning('Ignoring invalid plan %s', path)
+            return None
+
+    def _prune(self) -> None:
+        """Drop the expired plans and the least recently used plans exceeding the capacity."""
+        now = time.time()
+        plans = []
+        for path in self._path.glob(f'*{self.SUFFIX}'):
+            try:
+                used = path.stat().st_mtime
+            except FileNotFoundError:  # concurrently pruned
+                continue
+            if now - used > self._ttl:
+                path.unlink(missing_ok=True)
+            else:
+                plans.append((used, path))
+        for _, path in itertools.islice(sorted(plans, reverse=True), self._capacity, None):
+            LOGGER.debug('Pruning plan %s', path.name)
+            path.unlink(missing_ok=True)
+
+
 class Reader(io.Feed.Reader[sql.Selectable, sql.ColumnElement, pandas.DataFrame]):
     """:doc:`SQLAlchemy <sqlalchemy:index>` based reader.
 
     Using the :doc:`SQLAlchemy core <sqlalchemy:core/index>` for accessing any compatible SQL
     engine.
+
+    If the ``connection`` is given as a database URL, the reader executes the queries using a
+    process-wide pooled engine (see :class:`Pool`) so that independent reads can run concurrently
+    (e.g. under a threaded runner) without re-establishing the DB connections.
+
+    Args:
+        sources: Source mappings to be used by the parser.
+        features: Feature mappings to be used by the parser.
+        connection: Database URL or an explicit SQLAlchemy connectable.
+        pool: Optional engine pool options (i.e. ``pool_size``, ``max_overflow``, ``pool_recycle``,
+              ``pool_pre_ping``) passed to :func:`sqlalchemy.create_engine` when the
+              ``connection`` is an URL.
+        chunksize: If provided, the query is executed using a server-side cursor (where supported
+                   by the DB driver) fetching the results in chunks of the given number of rows.
+        kwargs: Optional :func:`pandas.read_sql <pandas:pandas.read_sql>` parameters.
+
+    Attributes:
+        PLANS: Optional persistent cache of the compiled query plans (disabled unless set on the
+               particular reader class).
     """
 
+    PLANS: typing.Optional[Plans] = None
+
     def __init__(
         self,
         sources: typing.Mapping[dsl.Source, parsmod.Source],
         features: typing.Mapping[dsl.Feature, parsmod.Feature],
         connection: typing.Union[str, interfaces.Connectable],
+        pool: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        chunksize: typing.Optional[int] = None,
         **kwargs,
     ):
+        if pool:
+            kwargs['pool'] = dict(pool)
+        if chunksize:
+            kwargs['chunksize'] = chunksize
         super().__init__(sources, features, **{**kwargs, 'con': connection})
 
+    @property
+    def _dialect(self) -> interfaces.Dialect:
+        """Dialect of the configured connection.
+
+        Returns:
+            SQL dialect instance.
+        """
+        con = self._kwargs['con']
+        if isinstance(con, str):
+            return sqlalchemy.engine.make_url(con).get_dialect()()
+        return con.dialect
+
+    @functools.lru_cache
+    def _parse_statement(self, statement: dsl.Statement) -> sql.Selectable:
+        """Parse the statement possibly using the persistent plan cache.
+
+        Args:
+            statement: DSL query statement.
+
+        Returns:
+            Statement in the target representation.
+        """
+        if self.PLANS is None:
+            return self._parse(statement)
+
+        def parse(literals: typing.Mapping[tuple[typing.Any, dsl.Any], str]) -> sql.Selectable:
+            """Parse the statement using the given literal parameter names."""
+            with self.parser(self._sources, self._features, literals) as visitor:
+                statement.accept(visitor)
+                return visitor.fetch()
+
+        dialect = self._dialect
+        return self.PLANS.get_or_parse(
+            statement, self.PLANS.fingerprint(statement, self._sources, self._features, dialect), parse, dialect
+        )
+
     @classmethod
     def parser(
         cls,
         sources: typing.Mapping[dsl.Source, sql.Selectable],
         features: typing.Mapping[dsl.Feature, sql.ColumnElement],
+        literals: typing.Optional[typing.Mapping[tuple[typing.Any, dsl.Any], str]] = None,
     ) -> Parser:
         """Return the parser instance of this reader.
 
         Args:
             sources: Source mappings to be used by the parser.
             features: Feature mappings to be used by the parser.
+            literals: Optional bind parameter names of the statement literals.
 
         Returns:
             Parser instance.
         """
-        return Parser(sources, features)
+        return Parser(sources, features, literals)
 
     @classmethod
-    def read(cls, statement: sql.Selectable, **kwargs) -> pandas.DataFrame:
+    def read(
+        cls,
+        statement: sql.Selectable,
+        con: typing.Union[str, interfaces.Connectable],
+        pool: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        chunksize: typing.Optional[int] = None,
+        **kwargs,
+    ) -> pandas.DataFrame:
         """Perform the read operation with the given statement.
 
         Args:
             statement: SQLAlchemy select statement.
+            con: Database URL or an explicit SQLAlchemy connectable.
+            pool: Optional engine pool options (used only if ``con`` is an URL).
+            chunksize: Optional number of rows to be streamed at a time using a server-side cursor.
+            kwargs: Pandas read_sql parameters.
+
+        Returns:
+            Pandas DataFrame of the requested data.
+        """
+        if isinstance(con, str):
+            con = Pool.get(con, **(pool or {}))
+        if isinstance(con, engine.Engine):
+            with con.connect() as connection:
+                return cls._fetch(statement, connection, chunksize, **kwargs)
+        return cls._fetch(statement, con, chunksize, **kwargs)
+
+    @staticmethod
+    def _fetch(
+        statement: sql.Selectable,
+        connection: interfaces.Connectable,
+        chunksize: typing.Optional[int],
+        **kwargs,
+    ) -> pandas.DataFrame:
+        """Execute the statement using the given connection.
+
+        Args:
+            statement: SQLAlchemy select statement.
+            connection: Connection to execute the statement with.
+            chunksize: Optional number of rows to be streamed at a time using a server-side cursor.
             kwargs: Pandas read_sql parameters.
 
         Returns:
             Pandas DataFrame of the requested data.
         """
         LOGGER.debug('Submitting SQL query')
-        return pandas.read_sql(statement, **kwargs)
+        if not chunksize:
+            return pandas.read_sql(statement, con=connection, **kwargs)
+        statement = statement.execution_options(yield_per=chunksize)
+        return pandas.concat(
+            pandas.read_sql(statement, con=connection, chunksize=chunksize, **kwargs), ignore_index=True
+        )
@@ -19,4 +19,4 @@
 Registry implementations.
 """
 
-__all__ = ['mlflow', 'filesystem']
+__all__ = ['mlflow', 'filesystem', 's3']
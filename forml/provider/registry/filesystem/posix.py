@@ -19,12 +19,19 @@
 File system registry is a plain hierarchical file based locally-accessible structure.
 """
 import abc
+import contextlib
 import functools
 import logging
+import mmap
+import os
 import pathlib
 import shutil
+import sys
+import threading
+import time
 import typing
 import uuid
+import weakref
 
 from forml import project as prj
 from forml import setup
@@ -129,6 +136,7 @@ class Path(type(pathlib.Path())):  # https://bugs.python.org/issue24132
             return (level / Path.TAGFILE).exists()
 
     STAGEDIR = '.stage'
+    BLOBDIR = '.blobs'
     STATESFX = 'bin'
     TAGFILE = 'tag.toml'
     PKGFILE = f'package.{prj.Package.FORMAT}'
@@ -210,6 +218,20 @@ class Path(type(pathlib.Path())):  # https://bugs.python.org/issue24132
             generation = self.STAGEDIR
         return self.generation(project, release, generation) / f'{sid}.{self.STATESFX}'
 
+    @functools.lru_cache
+    def blob(self, sid: uuid.UUID, project: asset.Project.Key, release: asset.Release.Key) -> pathlib.Path:
+        """Content-addressed state blob file path of given sid and project name.
+
+        Args:
+            sid: State id.
+            project: Name of the project.
+            release: Release key.
+
+        Returns:
+            Blob file path.
+        """
+        return self.release(project, release) / self.BLOBDIR / f'{sid}.{self.STATESFX}'
+
     @functools.lru_cache
     def tag(
         self, project: asset.Project.Key, release: asset.Release.Key, generation: asset.Generation.Key
@@ -227,6 +249,118 @@ class Path(type(pathlib.Path())):  # https://bugs.python.org/issue24132
         return self.generation(project, release, generation) / self.TAGFILE
 
 
+class Mapped(mmap.mmap):
+    """Read-only memory-mapped state file.
+
+    Being a bytes-like object, it can be passed directly to the state deserializer without first
+    copying the file content into memory. The same instance is shared by all the consumers of the
+    given state so the objects deserialized on top of it are read-only (consumers intending to
+    modify the state need to copy it first). Serializing the instance only carries the file path so
+    that the receiving process maps the very same file sharing the OS page cache.
+
+    Unless supported by the platform to map the file without keeping its descriptor open
+    (Python 3.13+), each live mapping holds one file descriptor so their number is capped by the
+    :attr:`LIMIT` (see :meth:`available`).
+
+    Args:
+        path: State file to be mapped.
+    """
+
+    LIMIT: int = 256
+    """Maximum number of simultaneously live mappings holding an open file descriptor."""
+    TRACKFD: bool = sys.version_info < (3, 13)
+    """Whether the mappings keep the (duplicated) file descriptor open."""
+
+    _live: 'weakref.WeakSet[Mapped]' = weakref.WeakSet()
+    _lock: threading.Lock = threading.Lock()
+
+    def __new__(cls, path: pathlib.Path):
+        with path.open('rb') as statefile:
+            if not cls.TRACKFD:
+                mapped = super().__new__(cls, statefile.fileno(), 0, access=mmap.ACCESS_READ, trackfd=False)
+            else:
+                mapped = super().__new__(cls, statefile.fileno(), 0, access=mmap.ACCESS_READ)
+                with cls._lock:
+                    cls._live.add(mapped)
+        mapped.path = path
+        return mapped
+
+    @classmethod
+    def available(cls) -> bool:
+        """Check whether another file can be mapped without exceeding the descriptor limit.
+
+        Returns:
+            True if the number of live descriptor-holding mappings is below the limit.
+        """
+        if not cls.TRACKFD:
+            return True
+        with cls._lock:
+            return len(cls._live) < cls.LIMIT
+
+    def __repr__(self):
+        return f'Mapped({self.path})'
+
+    def __reduce__(self):
+        return self.__class__, (self.path,)
+
+
+class Index:
+    """In-memory cache of the registry level listings validated using the directory modification
+    times.
+
+    A cached listing is reused as long as the modification time of its directory is unchanged.
+    Otherwise, only the entries not previously found valid get validated (valid levels are expected
+    to remain valid), so the refresh cost is proportional to the number of changes rather than to
+    the level size. Invalid entries (i.e. incomplete levels still being populated) are re-validated
+    upon every listing.
+
+    Directories modified within the last ``SETTLE`` seconds are always rescanned to account for the
+    coarse modification time resolution of some (network) file systems.
+    """
+
+    SETTLE = 2
+
+    class Entry(typing.NamedTuple):
+        """Cached listing of a single directory."""
+
+        mtime: int
+        valid: dict[str, asset.Level.Key]
+        pending: frozenset[str]
+
+    def __init__(self):
+        self._entries: dict[pathlib.Path, Index.Entry] = {}
+
+    def __reduce__(self):
+        return self.__class__, ()  # not carrying the cached content
+
+    def __call__(self, path: pathlib.Path, matcher: type[Path.Matcher]) -> list[asset.Level.Key]:
+        """Get the (possibly cached) level listing.
+
+        Args:
+            path: Path to be listed.
+            matcher: Item matcher.
+
+        Returns:
+            Level listing.
+        """
+        mtime = path.stat().st_mtime_ns
+        entry = self._entries.get(path)
+        if entry is None or entry.mtime != mtime or time.time_ns() - mtime < self.SETTLE * 1_000_000_000:
+            names = {p.name for p in path.iterdir()}
+            valid = {n: k for n, k in entry.valid.items() if n in names} if entry else {}
+            pending = names.difference(valid)
+        else:
+            valid, pending = entry.valid, entry.pending
+        if pending:
+            valid = dict(valid)
+            for name in pending:
+                if matcher.valid(path / name):
+                    valid[name] = matcher.constructor(name)
+            pending = pending.difference(valid)
+        self._entries[path] = self.Entry(mtime, valid, frozenset(pending))
+        return list(valid.values())
+
+
 class Registry(asset.Registry, alias='posix'):
     """File-based registry backed by a locally-accessible posix file system.
 
@@ -235,6 +369,22 @@ class Registry(asset.Registry, alias='posix'):
               Defaults to :file:`$FORML_HOME/registry`.
         staging: File system location reachable from all runner nodes to be used for
                  :ref:`package staging <registry-staging>` (defaults to :file:`<path>/.stage`).
+        memmap: If True, the states are read as (read-only) memory-mapped files instead of
+                loading their entire content into memory (which allows processes loading the same
+                states to share the underlying memory pages). Note arrays deserialized from such
+                states without copying (see :func:`asset.deserialize
+                <forml.io.asset.deserialize>`) are read-only (the states are copied when used for
+                warm-starting the training).
+        compression: Optional codec to compress the states with (see :class:`asset.Registry
+                     <forml.io.asset.Registry>`).
+        level: Optional codec-specific compression level.
+        dedup: If True, the registry is *content-addressed* storing identical states of a release
+               just once (as a blob hard-linked into all the generations referencing it) so
+               that committing unchanged states is near-free. Note the blobs are not garbage
+               collected - any blobs left unreferenced (i.e. states dumped by an unfinished
+               training) stay in the release until removed manually.
+        lazy: Mount the packages lazily importing the modules directly from the archive (see
+              :meth:`project.Package.install <forml.project.Package.install>`).
 
     The provider can be enabled using the following :ref:`platform configuration <platform-config>`:
 
@@ -244,20 +394,35 @@ class Registry(asset.Registry, alias='posix'):
         [REGISTRY.devrepo]
         provider = "posix"
         path = "/mnt/forml/dev/repo/"
+        memmap = true
+        compression = "zstd"
+        level = 3
+        dedup = true
     """
 
     def __init__(
         self,
         path: typing.Union[str, pathlib.Path] = setup.USRDIR / 'registry',
         staging: typing.Optional[typing.Union[str, pathlib.Path]] = None,
+        memmap: bool = False,
+        compression: typing.Optional[str] = None,
+        level: typing.Optional[int] = None,
+        dedup: bool = False,
+        lazy: bool = False,
     ):
         path = pathlib.Path(path).resolve()
-        super().__init__(staging or path / Path.STAGEDIR)
+        super().__init__(staging or path / Path.STAGEDIR, compression, level, lazy)
         self._path: Path = Path(path)
+        self._memmap: bool = memmap
+        self._dedup: bool = dedup
+        self._index: Index = Index()
+
+    @property
+    def addressed(self) -> bool:
+        return self._dedup
 
-    @staticmethod
-    def _listing(path: pathlib.Path, matcher: type[Path.Matcher]) -> typing.Iterable:
-        """Helper for listing given repository level.
+    def _listing(self, path: pathlib.Path, matcher: type[Path.Matcher]) -> typing.Iterable:
+        """Helper for listing given repository level using the listing index.
 
         Args:
             path: Path to be listed.
@@ -267,7 +432,7 @@ class Registry(asset.Registry, alias='posix'):
             Repository level listing.
         """
         try:
-            return [matcher.constructor(p.name) for p in path.iterdir() if matcher.valid(p)]
+            return self._index(path, matcher)
         except NotADirectoryError as err:
             raise asset.Level.Invalid(f'Path {path} is not a valid registry component') from err
         except FileNotFoundError:
@@ -304,23 +469,52 @@ class Registry(asset.Registry, alias='posix'):
         release: asset.Release.Key,
         generation: asset.Generation.Key,
         sid: uuid.UUID,
-    ) -> bytes:
+    ) -> typing.Union[bytes, Mapped]:
         path = self._path.state(sid, project, release, generation)
         LOGGER.debug('Reading state from %s', path)
         if not path.parent.exists():
             raise asset.Level.Invalid(f'Invalid registry component {project}/{release}/{generation}')
         try:
+            if self._memmap and path.stat().st_size:  # empty files can't be mapped
+                if Mapped.available():
+                    return Mapped(path)
+                LOGGER.debug('Mapped states limit reached - reading %s into memory', path)
             with path.open('rb') as statefile:
                 return statefile.read()
         except FileNotFoundError:
             LOGGER.warning('No state %s under %s', sid, path)
             return b''
 
-    def write(self, project: asset.Project.Key, release: asset.Release.Key, sid: uuid.UUID, state: bytes) -> None:
-        path = self._path.state(sid, project, release)
-        LOGGER.debug('Staging state of %d bytes to %s', len(state), path)
+    def dump(
+        self,
+        project: asset.Project.Key,
+        release: asset.Release.Key,
+        sid: uuid.UUID,
+        state: typing.Union[bytes, typing.BinaryIO, typing.Iterable[bytes]],
+    ) -> None:
+        if self._dedup and self._path.blob(sid, project, release).exists():
+            LOGGER.debug('State %s already stored', sid)
+            return
+        super().dump(project, release, sid, state)
+
+    @contextlib.contextmanager
+    def writer(
+        self, project: asset.Project.Key, release: asset.Release.Key, sid: uuid.UUID
+    ) -> typing.Iterator[typing.BinaryIO]:
+        path = self._path.blob(sid, project, release) if self._dedup else self._path.state(sid, project, release)
+        LOGGER.debug('Streaming state to %s', path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open('wb') as statefile:
+        partial = path.with_name(f'.{path.name}.{uuid.uuid4().hex}')  # hidden until complete
+        try:
+            with partial.open('wb') as statefile:
+                yield statefile
+            partial.replace(path)
+        finally:
+            partial.unlink(missing_ok=True)
+
+    def write(self, project: asset.Project.Key, release: asset.Release.Key, sid: uuid.UUID, state: bytes) -> None:
+        LOGGER.debug('Staging state of %d bytes', len(state))
+        with self.writer(project, release, sid) as statefile:
             statefile.write(state)
 
     def open(
@@ -344,10 +538,19 @@ class Registry(asset.Registry, alias='posix'):
         LOGGER.debug('Committing states of tag %s as %s', tag, path)
         path.parent.mkdir(parents=True, exist_ok=True)
         for sid in tag.states:
+            target = self._path.state(sid, project, release, generation)
+            if target.exists():  # content-addressed state referenced repeatedly
+                continue
             source = self._path.state(sid, project, release)
-            if not source.exists():
+            if source.exists():
+                source.rename(target)
+                continue
+            blob = self._path.blob(sid, project, release)
+            if not blob.exists():
                 raise asset.Level.Invalid(f'State {sid} not staged')
-            target = self._path.state(sid, project, release, generation)
-            source.rename(target)
+            try:
+                os.link(blob, target)
+            except OSError:  # hard links not supported
+                shutil.copyfile(blob, target)
         with path.open('wb') as tagfile:
             tagfile.write(tag.dumps())
@@ -19,12 +19,15 @@
 Model registry implementation based on the MLFlow Tracking Server.
 """
 import collections
+import contextlib
 import functools
 import logging
 import os
 import pathlib
 import re
+import shutil
 import tempfile
+import time
 import typing
 import uuid
 
@@ -42,7 +45,14 @@ Entity = typing.TypeVar('Entity')
 
 
 class Client:
-    """MLflow tracking server wrapper."""
+    """MLflow tracking server wrapper.
+
+    The experiment and run listings are cached for the given TTL period (invalidated upon any
+    local modification).
+
+    Args:
+        ttl: Listing cache time-to-live in seconds.
+    """
 
     class Pager(typing.Generic[Entity], typing.Iterable[Entity]):
         """Rest API paging iterator."""
@@ -59,9 +69,33 @@ class Client:
                     break
                 token = page.token
 
-    def __init__(self, *args, common_tags: typing.Optional[typing.Mapping[str, str]] = None, **kwargs):
+    def __init__(self, *args, common_tags: typing.Optional[typing.Mapping[str, str]] = None, ttl: float = 0, **kwargs):
         self._mlflow: tracking.MlflowClient = tracking.MlflowClient(*args, **kwargs)
         self._common_tags: typing.Mapping[str, str] = dict(common_tags) or {}
+        self._ttl: float = ttl
+        self._listings: dict[tuple, tuple[float, tuple]] = {}
+
+    def _listing(self, key: tuple, loader: typing.Callable[[], typing.Iterable[Entity]]) -> tuple[Entity]:
+        """Get the listing from the cache or load it if expired.
+
+        Args:
+            key: Listing cache key.
+            loader: Callable returning the fresh listing.
+
+        Returns:
+            Listing tuple.
+        """
+        now = time.monotonic()
+        expiry, items = self._listings.get(key, (0, ()))
+        if now >= expiry:
+            items = tuple(loader())
+            if self._ttl > 0:
+                self._listings[key] = now + self._ttl, items
+        return items
+
+    def invalidate(self) -> None:
+        """Drop all the cached listings."""
+        self._listings.clear()
 
     def list_experiments(self) -> typing.Iterable[entities.Experiment]:
         """Get a list of the existing experiments.
@@ -69,7 +103,10 @@ class Client:
         Returns:
             Iterator of Experiment instances.
         """
-        return self.Pager[entities.Experiment](lambda t: self._mlflow.search_experiments(page_token=t))
+        return self._listing(
+            ('experiments',),
+            lambda: self.Pager[entities.Experiment](lambda t: self._mlflow.search_experiments(page_token=t)),
+        )
 
     def list_runs(self, experiment: entities.Experiment, **tags: str) -> typing.Iterable[entities.Run]:
         """Get a list of the existing runs matching the given tags.
@@ -81,20 +118,26 @@ class Client:
         Returns:
             Iterator of Experiment instances.
         """
-        return self.Pager[entities.Run](
-            lambda t: self._mlflow.search_runs(
-                [experiment.experiment_id],
-                filter_string=' AND '.join(f"tag.{k} = '{v}'" for k, v in (self._common_tags | tags).items()),
-                page_token=t,
-            )
+        return self._listing(
+            ('runs', experiment.experiment_id, *sorted(tags.items())),
+            lambda: self.Pager[entities.Run](
+                lambda t: self._mlflow.search_runs(
+                    [experiment.experiment_id],
+                    filter_string=' AND '.join(f"tag.{k} = '{v}'" for k, v in (self._common_tags | tags).items()),
+                    page_token=t,
+                )
+            ),
         )
 
-    def download_artifact(self, run: entities.Run, name: str, dstdir: typing.Union[str, pathlib.Path]) -> pathlib.Path:
+    def download_artifact(
+        self, run: entities.Run, name: typing.Optional[str], dstdir: typing.Union[str, pathlib.Path]
+    ) -> pathlib.Path:
         """Fetch the file artifact stored under the run instance.
 
         Args:
             run: Run entity holding the artifact.
-            name: Artifact name to fetch.
+            name: Artifact name to fetch (all artifacts of the run are downloaded - in parallel - if
+                  None).
             dstdir: Target directory to download the artifact into.
 
         Returns:
@@ -127,6 +170,7 @@ class Client:
         """
         self._mlflow.set_tag(run.info.run_id, key, value)
         run.data.tags[key] = value
+        self.invalidate()
         return run
 
     @functools.lru_cache
@@ -141,6 +185,7 @@ class Client:
         """
         entity = self._mlflow.get_experiment_by_name(name)
         if not entity:
+            self.invalidate()
             return self._mlflow.get_experiment(self._mlflow.create_experiment(name))
         if entity.lifecycle_stage != 'active':
             self._mlflow.restore_experiment(entity.experiment_id)
@@ -165,6 +210,7 @@ class Client:
             filter_string=' AND '.join(f"tag.{k} = '{v}'" for k, v in tags.items()),
         )
         if not result:
+            self.invalidate()
             return eobj, self._mlflow.create_run(eobj.experiment_id, tags=tags)
         if len(result) == 1:
             run = result[0]
@@ -190,6 +236,16 @@ class Registry(asset.Registry, alias='mlflow'):
         staging: File system location reachable from all runner nodes to be used for
                  :ref:`package staging <registry-staging>` (defaults to a local temporal
                  directory (invalid for distributed runners)).
+        compression: Optional codec to compress the states with (see :class:`asset.Registry
+                     <forml.io.asset.Registry>`).
+        level: Optional codec-specific compression level.
+        ttl: Time-to-live in seconds of the client-side cache of the experiment/run listings (zero to
+             disable caching).
+        lazy: Mount the packages lazily importing the modules directly from the archive (see
+              :meth:`project.Package.install <forml.project.Package.install>`).
+
+    Artifacts of the committed generations are downloaded in bulk (upon the first state access) and
+    reused from the local disk afterwards.
 
     The provider can be enabled using the following :ref:`platform configuration <platform-config>`:
 
@@ -200,6 +256,8 @@ class Registry(asset.Registry, alias='mlflow'):
         provider = "mlflow"
         tracking_uri = "http://127.0.0.1:5000"
         staging = "/mnt/forml/.stage"
+        compression = "zstd"
+        ttl = 60
 
     Important:
         Select the ``mlflow`` :ref:`extras to install <install-extras>` ForML together with the
@@ -267,9 +325,13 @@ class Registry(asset.Registry, alias='mlflow'):
         registry_uri: typing.Optional[str] = None,
         repoid: str = DEFAULT_REPOID,
         staging: typing.Optional[typing.Union[str, pathlib.Path]] = None,
+        compression: typing.Optional[str] = None,
+        level: typing.Optional[int] = None,
+        ttl: float = 60,
+        lazy: bool = False,
     ):
-        super().__init__(staging)
-        self._client = Client(tracking_uri, registry_uri, common_tags={self.TAG_REPOID: repoid})
+        super().__init__(staging, compression, level, lazy)
+        self._client = Client(tracking_uri, registry_uri, common_tags={self.TAG_REPOID: repoid}, ttl=ttl)
         self._repoid: str = repoid
         self._session: uuid.UUID = uuid.uuid4()
         self._projects: dict[asset.Project.Key, entities.Experiment] = {}
@@ -308,11 +370,7 @@ class Registry(asset.Registry, alias='mlflow'):
             yield key
 
     def pull(self, project: asset.Project.Key, release: asset.Release.Key) -> prj.Package:
-        return prj.Package(
-            self._client.download_artifact(
-                self._releases[project, release], self.PKGFILE, tempfile.mkdtemp(dir=self._tmp)
-            )
-        )
+        return prj.Package(self._fetch(self._releases[project, release], self.PKGFILE))
 
     def push(self, package: prj.Package) -> None:
         project = package.manifest.name
@@ -328,39 +386,39 @@ class Registry(asset.Registry, alias='mlflow'):
     def read(
         self, project: asset.Project.Key, release: asset.Release.Key, generation: asset.Generation.Key, sid: uuid.UUID
     ) -> bytes:
-        with tempfile.TemporaryDirectory(dir=self._tmp) as tmp:
-            try:
-                artifact = self._client.download_artifact(
-                    self._generations[project, release, generation], f'{sid}.{self.STATESFX}', tmp
-                )
-            except FileNotFoundError:
-                LOGGER.warning('No state %s under runid %s', sid, self._generations[project, release, generation])
-                return b''
-            with artifact.open('rb') as statefile:
-                return statefile.read()
-
-    def write(self, project: asset.Project.Key, release: asset.Release.Key, sid: uuid.UUID, state: bytes) -> None:
+        run = self._generations[project, release, generation]
+        path = self._prefetch(run) / f'{sid}.{self.STATESFX}'
+        if not path.exists():
+            LOGGER.warning('No state %s under runid %s', sid, run)
+            return b''
+        with path.open('rb') as statefile:
+            return statefile.read()
+
+    @contextlib.contextmanager
+    def writer(
+        self, project: asset.Project.Key, release: asset.Release.Key, sid: uuid.UUID
+    ) -> typing.Iterator[typing.BinaryIO]:
         unbounded_generation = self._get_unbound_generation(project, release)
         with tempfile.TemporaryDirectory(dir=self._tmp) as tmp:
             path = os.path.join(tmp, f'{sid}.{self.STATESFX}')
             with open(path, 'wb') as statefile:
-                statefile.write(state)
+                yield statefile
             self._client.upload_artifact(unbounded_generation, path)
 
+    def write(self, project: asset.Project.Key, release: asset.Release.Key, sid: uuid.UUID, state: bytes) -> None:
+        with self.writer(project, release, sid) as statefile:
+            statefile.write(state)
+
     def open(
         self, project: asset.Project.Key, release: asset.Release.Key, generation: asset.Generation.Key
     ) -> asset.Tag:
-        with tempfile.TemporaryDirectory(dir=self._tmp) as tmp:
-            try:
-                artifact = self._client.download_artifact(
-                    self._generations[project, release, generation], self.TAGFILE, tmp
-                )
-            except FileNotFoundError as err:
-                raise asset.Level.Listing.Empty(
-                    f'No tag under runid {self._generations[project, release, generation]}'
-                ) from err
-            with artifact.open('rb') as tagfile:
-                return asset.Tag.loads(tagfile.read())
+        run = self._generations[project, release, generation]
+        try:
+            path = self._fetch(run, self.TAGFILE)
+        except FileNotFoundError as err:
+            raise asset.Level.Listing.Empty(f'No tag under runid {run}') from err
+        with path.open('rb') as tagfile:
+            return asset.Tag.loads(tagfile.read())
 
     def close(
         self, project: asset.Project.Key, release: asset.Release.Key, generation: asset.Generation.Key, tag: asset.Tag
@@ -375,6 +433,51 @@ class Registry(asset.Registry, alias='mlflow'):
             unbounded_generation, self.TAG_GENERATION_KEY, f'{generation}'
         )
 
+    def _prefetch(self, run: entities.Run) -> pathlib.Path:
+        """Download all the artifacts of the given (immutable) run at once unless already available
+        locally.
+
+        Args:
+            run: Run entity whose artifacts to download.
+
+        Returns:
+            Local directory containing all the run artifacts.
+        """
+        path = self._tmp / 'runs' / run.info.run_id
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial = pathlib.Path(tempfile.mkdtemp(dir=path.parent, prefix='.'))
+            LOGGER.debug('Prefetching artifacts of runid %s', run.info.run_id)
+            self._client.download_artifact(run, None, partial)
+            try:
+                partial.rename(path)
+            except OSError:  # concurrently prefetched
+                shutil.rmtree(partial, ignore_errors=True)
+        return path
+
+    def _fetch(self, run: entities.Run, name: str) -> pathlib.Path:
+        """Get the local path of the given artifact reusing any previous download.
+
+        Args:
+            run: Run entity holding the artifact.
+            name: Artifact name to fetch.
+
+        Returns:
+            Local path of the artifact.
+
+        Raises:
+            FileNotFoundError: If the artifact doesn't exist.
+        """
+        path = self._tmp / 'runs' / run.info.run_id / name
+        if path.exists():  # prefetched
+            return path
+        path = self._tmp / 'files' / run.info.run_id / name
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(dir=path.parent) as tmp:
+                self._client.download_artifact(run, name, tmp).replace(path)
+        return path
+
     def _get_release(self, project: asset.Project.Key, release: asset.Release.Key) -> entities.Run:
         """Get the run instance for the release if exists or create a new one.
 
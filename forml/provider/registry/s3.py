@@ -0,0 +1,387 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Model registry implementation based on an S3-compatible object store.
+"""
+import contextlib
+import functools
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+import typing
+import urllib.parse
+import uuid
+
+import boto3
+from boto3.s3 import transfer
+from botocore import exceptions
+
+from forml import project as prj
+from forml.io import asset
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Cache:
+    """Local on-disk read-through cache of the (immutable) registry objects.
+
+    The cache directory can be shared by multiple processes on the same node. Least recently used
+    objects get evicted once the total cache size exceeds the given limit. The total size is
+    tracked incrementally (rescanning the directory only when the limit gets exceeded) and the
+    evicted objects are first atomically renamed so that concurrent readers never observe a
+    partially removed object.
+
+    Args:
+        path: Cache directory.
+        size: Maximum cache size in bytes.
+    """
+
+    def __init__(self, path: typing.Union[str, pathlib.Path], size: int):
+        self._path: pathlib.Path = pathlib.Path(path)
+        self._size: int = size
+        self._nbytes: typing.Optional[int] = None  # lazily initialized total size estimate
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self):
+        return f'Cache({self._path})'
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_nbytes'] = None
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, _lock=threading.Lock())
+
+    def get(self, key: str, fetch: typing.Callable[[pathlib.Path], None]) -> pathlib.Path:
+        """Get the local path of the given object, fetching it first if not cached.
+
+        Args:
+            key: Object key.
+            fetch: Callback for downloading the object into the given local path.
+
+        Returns:
+            Local path of the cached object.
+        """
+        path = self._path / key
+        try:
+            os.utime(path)  # bump for the LRU eviction
+        except FileNotFoundError:
+            pass
+        else:
+            LOGGER.debug('Cache hit for %s', key)
+            return path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f'.{path.name}.{uuid.uuid4().hex}')
+        try:
+            fetch(partial)
+            size = partial.stat().st_size
+            partial.replace(path)
+        finally:
+            partial.unlink(missing_ok=True)
+        with self._lock:
+            if self._nbytes is None:
+                self._nbytes = self._scan()[1]
+            else:
+                self._nbytes += size
+            if self._nbytes > self._size:
+                self._evict()
+        return path
+
+    def _scan(self) -> tuple[list[tuple[int, int, str]], int]:
+        """Collect the cached objects.
+
+        Returns:
+            Tuple of the list of (mtime, size, path) tuples of the cached objects and their total
+            size.
+        """
+        files = []
+        for root, _, names in os.walk(self._path):
+            for name in names:
+                if name.startswith('.'):  # partial download or eviction
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except FileNotFoundError:  # concurrently evicted
+                    continue
+                files.append((stat.st_mtime_ns, stat.st_size, os.path.join(root, name)))
+        return files, sum(s for _, s, _ in files)
+
+    def _evict(self) -> None:
+        """Remove the least recently used objects exceeding the cache size (lock must be held by
+        the caller)."""
+        files, self._nbytes = self._scan()
+        for _, size, path in sorted(files):
+            if self._nbytes <= self._size:
+                break
+            LOGGER.debug('Evicting %s from cache', path)
+            head, tail = os.path.split(path)
+            victim = os.path.join(head, f'.{tail}.{uuid.uuid4().hex}.evicted')
+            with contextlib.suppress(FileNotFoundError):  # concurrently evicted
+                os.rename(path, victim)
+                os.unlink(victim)
+            self._nbytes -= size
+
+
+class Registry(asset.Registry, alias='s3'):
+    """ForML model registry implementation using an S3-compatible object store as the artifact
+    storage.
+
+    All the content is stored under the given bucket/prefix using the following key structure:
+
+    * ``<project>/<release>/package.4ml`` - the release package
+    * ``<project>/<release>/states/<sid>.bin`` - the (immutable) states of all the generations
+    * ``<project>/<release>/<generation>/tag.toml`` - the generation tag
+
+    States are dumped straight into their final location so that committing a generation is just
+    the single upload of its tag (a generation is therefore never visible without its tag).
+
+    Large objects are transferred using parallel multipart uploads and parallel ranged downloads.
+    Packages and states are fetched through a local on-disk read-through cache (namespaced by the
+    endpoint and bucket) with size-bounded LRU eviction so that serving nodes don't download the
+    same objects repeatedly.
+
+    Args:
+        bucket: Bucket name.
+        prefix: Optional key prefix to host the registry under.
+        cache: Local cache directory (defaults to a temporal directory).
+        cache_size: Maximum size of the local cache in bytes.
+        concurrency: Maximum number of parallel transfer threads.
+        chunk_size: Size of the individual multipart upload/download chunks in bytes.
+        staging: File system location reachable from all runner nodes to be used for
+                 :ref:`package staging <registry-staging>` (defaults to a local temporal
+                 directory (invalid for distributed runners)).
+        compression: Optional codec to compress the states with (see :class:`asset.Registry
+                     <forml.io.asset.Registry>`).
+        level: Optional codec-specific compression level.
+        lazy: Mount the packages lazily importing the modules directly from the archive (see
+              :meth:`project.Package.install <forml.project.Package.install>`).
+        client: Additional keyword arguments for the ``boto3.client`` constructor (i.e.
+                ``endpoint_url``, ``region_name`` or the credentials).
+
+    The provider can be enabled using the following :ref:`platform configuration <platform-config>`:
+
+    .. code-block:: toml
+       :caption: config.toml
+
+        [REGISTRY.objstore]
+        provider = "s3"
+        bucket = "forml"
+        prefix = "registry"
+        cache = "/var/cache/forml"
+        cache_size = 10_000_000_000
+        endpoint_url = "http://minio.local:9000"
+
+    Important:
+        Select the ``s3`` :ref:`extras to install <install-extras>` ForML together with the
+        S3 support.
+    """
+
+    STATEDIR = 'states'
+    STATESFX = 'bin'
+    TAGFILE = 'tag.toml'
+    PKGFILE = f'package.{prj.Package.FORMAT}'
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = '',
+        cache: typing.Optional[typing.Union[str, pathlib.Path]] = None,
+        cache_size: int = 1 << 30,
+        concurrency: int = 8,
+        chunk_size: int = 8 << 20,
+        staging: typing.Optional[typing.Union[str, pathlib.Path]] = None,
+        compression: typing.Optional[str] = None,
+        level: typing.Optional[int] = None,
+        lazy: bool = False,
+        **client: typing.Any,
+    ):
+        super().__init__(staging, compression, level, lazy)
+        self._bucket: str = bucket
+        self._prefix: str = prefix.strip('/')
+        self._cache: Cache = Cache(cache or asset.mkdtemp(prefix='s3-cache-'), cache_size)
+        self._transfer: transfer.TransferConfig = transfer.TransferConfig(
+            multipart_threshold=chunk_size, multipart_chunksize=chunk_size, max_concurrency=concurrency
+        )
+        self._tmp: pathlib.Path = asset.mkdtemp()
+        self._kwargs: dict[str, typing.Any] = client
+        # cache namespace to avoid clashes between registries of different endpoints/buckets
+        self._endpoint: str = urllib.parse.urlsplit(client.get('endpoint_url') or '').netloc or 'default'
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop('_client', None)  # clients are not serializable
+        return state
+
+    def __hash__(self):
+        return hash(self.__class__) ^ hash(self._endpoint) ^ hash(self._bucket) ^ hash(self._prefix)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, self.__class__)
+            and other._endpoint == self._endpoint
+            and other._bucket == self._bucket
+            and other._prefix == self._prefix
+            and other._kwargs == self._kwargs
+        )
+
+    @functools.cached_property
+    def _client(self):
+        """Lazily constructed S3 client."""
+        return boto3.client('s3', **self._kwargs)
+
+    def _key(self, *parts: typing.Any) -> str:
+        """Construct the object key from the given parts.
+
+        Args:
+            parts: Key components.
+
+        Returns:
+            Object key including the prefix.
+        """
+        return '/'.join(str(p) for p in (self._prefix, *parts) if p != '')
+
+    def _listing(self, *parts: typing.Any) -> typing.Iterator[str]:
+        """List the names of the (pseudo)directories under the given key.
+
+        Args:
+            parts: Key components.
+
+        Returns:
+            Directory names.
+        """
+        prefix = self._key(*parts)
+        if prefix:
+            prefix += '/'
+        for page in self._client.get_paginator('list_objects_v2').paginate(
+            Bucket=self._bucket, Prefix=prefix, Delimiter='/'
+        ):
+            for item in page.get('CommonPrefixes', ()):
+                yield item['Prefix'].removeprefix(prefix).rstrip('/')
+
+    def _fetch(self, key: str) -> pathlib.Path:
+        """Get the object through the local cache.
+
+        Args:
+            key: Object key.
+
+        Returns:
+            Local path of the object.
+
+        Raises:
+            FileNotFoundError: If the object doesn't exist.
+        """
+
+        def download(path: pathlib.Path) -> None:
+            """Download callback."""
+            LOGGER.debug('Downloading %s', key)
+            try:
+                self._client.download_file(self._bucket, key, str(path), Config=self._transfer)
+            except exceptions.ClientError as err:
+                if err.response['Error']['Code'] in {'404', 'NoSuchKey'}:
+                    raise FileNotFoundError(f'No object {key}') from err
+                raise
+
+        return self._cache.get(f'{self._endpoint}/{self._bucket}/{key}', download)
+
+    def _upload(self, source: typing.Union[str, pathlib.Path], key: str) -> None:
+        """Upload the file under the given key.
+
+        Args:
+            source: Local file path.
+            key: Target object key.
+        """
+        LOGGER.debug('Uploading %s', key)
+        self._client.upload_file(str(source), self._bucket, key, Config=self._transfer)
+
+    def projects(self) -> typing.Iterable[typing.Union[str, asset.Project.Key]]:
+        return (asset.Project.Key(p) for p in self._listing())
+
+    def releases(self, project: asset.Project.Key) -> typing.Iterable[typing.Union[str, asset.Release.Key]]:
+        return (asset.Release.Key(r) for r in self._listing(project))
+
+    def generations(
+        self, project: asset.Project.Key, release: asset.Release.Key
+    ) -> typing.Iterable[typing.Union[str, int, asset.Generation.Key]]:
+        return (asset.Generation.Key(g) for g in self._listing(project, release) if g != self.STATEDIR)
+
+    def pull(self, project: asset.Project.Key, release: asset.Release.Key) -> prj.Package:
+        return prj.Package(self._fetch(self._key(project, release, self.PKGFILE)))
+
+    def push(self, package: prj.Package) -> None:
+        key = self._key(package.manifest.name, package.manifest.version, self.PKGFILE)
+        if package.path.is_file():
+            self._upload(package.path, key)
+            return
+        with tempfile.TemporaryDirectory(dir=self._tmp) as tmp:
+            path = pathlib.Path(tmp) / self.PKGFILE
+            prj.Package.create(package.path, package.manifest, path)
+            self._upload(path, key)
+
+    def read(
+        self, project: asset.Project.Key, release: asset.Release.Key, generation: asset.Generation.Key, sid: uuid.UUID
+    ) -> bytes:
+        key = self._key(project, release, self.STATEDIR, f'{sid}.{self.STATESFX}')
+        while True:
+            try:
+                path = self._fetch(key)
+            except FileNotFoundError:
+                LOGGER.warning('No state %s under %s/%s', sid, project, release)
+                return b''
+            try:
+                return path.read_bytes()
+            except FileNotFoundError:  # concurrently evicted from the local cache
+                LOGGER.debug('Refetching evicted %s', key)
+
+    @contextlib.contextmanager
+    def writer(
+        self, project: asset.Project.Key, release: asset.Release.Key, sid: uuid.UUID
+    ) -> typing.Iterator[typing.BinaryIO]:
+        with tempfile.TemporaryDirectory(dir=self._tmp) as tmp:
+            path = pathlib.Path(tmp) / f'{sid}.{self.STATESFX}'
+            with path.open('wb') as statefile:
+                yield statefile
+            self._upload(path, self._key(project, release, self.STATEDIR, path.name))
+
+    def write(self, project: asset.Project.Key, release: asset.Release.Key, sid: uuid.UUID, state: bytes) -> None:
+        with self.writer(project, release, sid) as statefile:
+            statefile.write(state)
+
+    def open(
+        self, project: asset.Project.Key, release: asset.Release.Key, generation: asset.Generation.Key
+    ) -> asset.Tag:
+        key = self._key(project, release, generation, self.TAGFILE)
+        try:
+            response = self._client.get_object(Bucket=self._bucket, Key=key)
+        except self._client.exceptions.NoSuchKey as err:
+            raise asset.Level.Listing.Empty(f'No tag under {key}') from err
+        return asset.Tag.loads(response['Body'].read())
+
+    def close(
+        self,
+        project: asset.Project.Key,
+        release: asset.Release.Key,
+        generation: asset.Generation.Key,
+        tag: asset.Tag,
+    ) -> None:
+        key = self._key(project, release, generation, self.TAGFILE)
+        LOGGER.debug('Committing states of tag %s as %s', tag, key)
+        self._client.put_object(Bucket=self._bucket, Key=key, Body=tag.dumps())
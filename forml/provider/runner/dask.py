@@ -48,6 +48,12 @@ class Runner(runtime.Runner, alias='dask'):
                    * to submit to a remote :doc:`Dask Cluster <distributed:index>`, set the
                      ``scheduler`` to ``distributed`` and provide the master ``scheduler-address``
 
+    Branches of actors hinted for co-scheduling (i.e. the folds of a :class:`evaluation.CrossVal
+    <forml.evaluation.CrossVal>` or of the :class:`ensemble.FullStack
+    <forml.pipeline.ensemble.FullStack>` with ``coschedule=True``) are :func:`fused
+    <forml.flow.fuse>` into single tasks executed using a thread pool within one worker process so
+    that the fold payloads are shared in memory rather than being serialized between the workers.
+
     The provider can be enabled using the following :ref:`platform configuration <platform-config>`:
 
     .. code-block:: toml
@@ -120,4 +126,4 @@ class Runner(runtime.Runner, alias='dask'):
 
     @classmethod
     def run(cls, symbols: typing.Collection[flow.Symbol], **kwargs) -> None:
-        dask.compute(cls._mkjob(symbols))
+        dask.compute(cls._mkjob(flow.fuse(symbols)))
@@ -30,6 +30,9 @@ from forml import io as iomod
 from forml import project, provider, setup
 from forml.io import asset as assetmod
 from forml.io import dsl
+from forml.pipeline import payload
+
+from . import _tuning
 
 if typing.TYPE_CHECKING:
     from forml import flow, io  # pylint: disable=reimported
@@ -84,14 +87,32 @@ class Runner(provider.Service, default=setup.Runner.default, path=setup.Runner.p
     def train(self, lower: typing.Optional[dsl.Native] = None, upper: typing.Optional[dsl.Native] = None) -> None:
         """Run the training code.
 
+        In case of an *incremental* source extract, the lower bound defaults to the *watermark*
+        of the previous generation and the upper bound gets fixed to the current watermark of the
+        feed which is then persisted in the new generation tag.
+
+        Note:
+            With the default ``exactly`` (once) ordinal semantic, the upper bound is exclusive so
+            the records with ordinal equal to the watermark are deferred to the next run (as its
+            inclusive lower bound). If no newer data arrives by then, the run gets skipped and
+            these records stay untrained.
+
         Args:
             lower: Ordinal value as the lower bound for the ETL cycle.
             upper:  Ordinal value as the upper bound for the ETL cycle.
         """
-        composition = self._build(lower or self._instance.tag.training.ordinal, upper, self._instance.project.pipeline)
-        self._exec(
-            composition.train, self._instance.state(composition.persistent, self._instance.tag.training.trigger())
-        )
+        lower = lower or self._instance.tag.training.ordinal
+        tag = self._instance.tag.training.trigger()
+        ordinal = self._instance.project.source.extract.ordinal
+        if ordinal and ordinal.incremental:
+            if upper is None:
+                upper = self._feed.watermark(self._instance.project.source.extract, lower)
+                if upper is None or (lower is not None and upper <= ordinal.column.kind.cast(lower)):
+                    LOGGER.info('No new data since the previous watermark (%s) - skipping training', lower)
+                    return
+            tag = tag.training.replace(ordinal=upper)
+        composition = self._build(lower, upper, self._instance.project.pipeline)
+        self._exec(composition.train, self._instance.state(composition.persistent, tag))
 
     def apply(self, lower: typing.Optional[dsl.Native] = None, upper: typing.Optional[dsl.Native] = None) -> None:
         """Run the applying code.
@@ -103,14 +124,82 @@ class Runner(provider.Service, default=setup.Runner.default, path=setup.Runner.p
         composition = self._build(lower, upper, self._instance.project.pipeline, output=None)  # TO-DO: sink schema
         self._exec(composition.apply, self._instance.state(composition.persistent))
 
-    def tune(self, lower: typing.Optional[dsl.Native] = None, upper: typing.Optional[dsl.Native] = None) -> None:
+    def tune(
+        self, lower: typing.Optional[dsl.Native] = None, upper: typing.Optional[dsl.Native] = None
+    ) -> typing.Sequence[_tuning.Trial]:
         """Run the tune mode.
 
+        All the variants of the project :class:`tuning space <forml.project.Tuning>` are evaluated
+        using the project evaluation spec applying the *successive-halving* early stopping. Each
+        rung is executed as a single task graph with the variants expanded into parallel branches
+        sharing their common upstream part.
+
+        Args:
+            lower: Ordinal value as the lower bound for the ETL cycle.
+            upper: Ordinal value as the upper bound for the ETL cycle.
+
+        Returns:
+            Trials of the last rung ranked from the best.
+        """
+        spec = self._instance.project.evaluation
+        tuning = self._instance.project.tuning
+        if not spec:
+            raise forml.MissingError('Project not evaluable')
+        if not tuning:
+            raise forml.MissingError('Project not tunable')
+        if tuning.rungs < 1 or tuning.eta < 2:
+            raise forml.InvalidError(f'Invalid successive-halving setup (rungs={tuning.rungs}, eta={tuning.eta})')
+        trials = [_tuning.Trial(v, float('nan')) for v in tuning.variants]
+        for rung in range(tuning.rungs):
+            if rung:
+                trials = _tuning.halve(trials, tuning.eta, tuning.maximize)
+            fraction = float(tuning.eta) ** (rung - tuning.rungs + 1)
+            LOGGER.info('Tuning rung #%d: evaluating %d variants on %.1f%% of data', rung, len(trials), fraction * 100)
+            scores = self._trial(lower, upper, [t.params for t in trials], fraction, tuning.seed)
+            trials = [t._replace(score=s) for t, s in zip(trials, scores)]
+        trials = _tuning.rank(trials, tuning.maximize)
+        for trial in trials:
+            LOGGER.info('Tuning trial score %f: %s', trial.score, trial.params)
+        return trials
+
+    def _trial(
+        self,
+        lower: typing.Optional[dsl.Native],
+        upper: typing.Optional[dsl.Native],
+        variants: typing.Sequence[_tuning.Variant],
+        fraction: float,
+        seed: typing.Optional[int],
+    ) -> typing.Sequence[float]:
+        """Evaluate the given variants within a single run.
+
         Args:
             lower: Ordinal value as the lower bound for the ETL cycle.
             upper: Ordinal value as the upper bound for the ETL cycle.
+            variants: Hyper-parameter variants to be evaluated.
+            fraction: Fraction of the training data to be sampled for the evaluation.
+            seed: Optional random seed for the sampling.
+
+        Returns:
+            Metric values of the individual variants.
         """
-        raise forml.MissingError('Not yet supported')
+        spec = self._instance.project.evaluation
+        blocks = [self._instance.project.pipeline >> evaluation.TrainTestScore(spec.metric, spec.method)]
+        if fraction < 1:
+            blocks.insert(0, _tuning.Sample(fraction, seed))
+        composition = flowmod.Composition.builder(
+            self._feed.load(self._instance.project.source.extract, lower, upper),
+            self._instance.project.source.transform,
+        )
+        composition = functools.reduce(flowmod.Composition.Builder.via, blocks, composition).build()
+        value, client, result = payload.Sniff.Value.open()
+        try:
+            self.run(_tuning.expand(flowmod.compile(composition.train), variants, client), **self._kwargs)
+        finally:
+            value.close()
+        try:
+            return result.result()
+        except payload.Sniff.Lost as err:
+            raise forml.FailedError('Tuning trial results not delivered') from err
 
     def eval_traintest(
         self, lower: typing.Optional[dsl.Native] = None, upper: typing.Optional[dsl.Native] = None
@@ -133,7 +222,7 @@ class Runner(provider.Service, default=setup.Runner.default, path=setup.Runner.p
             lower: Ordinal value as the lower bound for the ETL cycle.
             upper: Ordinal value as the upper bound for the ETL cycle.
         """
-        composition = self._eval(lower, upper, lambda s: evaluation.PerfTrackScore(s.metric))
+        composition = self._eval(lower, upper, lambda s: evaluation.PerfTrackScore(s.metric, s.chunks))
         self._exec(composition.train, self._instance.state(composition.persistent))
 
     def _eval(
@@ -112,18 +112,20 @@ class Launcher:
         def __init__(
             self,
             runner: _agent.Runner,
-            action: typing.Callable[[_agent.Runner, typing.Optional[dsl.Native], typing.Optional[dsl.Native]], None],
+            action: typing.Callable[
+                [_agent.Runner, typing.Optional[dsl.Native], typing.Optional[dsl.Native]], typing.Any
+            ],
         ):
             self._runner: _agent.Runner = runner
             self._action: typing.Callable[
-                [_agent.Runner, typing.Optional[dsl.Native], typing.Optional[dsl.Native]], None
+                [_agent.Runner, typing.Optional[dsl.Native], typing.Optional[dsl.Native]], typing.Any
             ] = action
 
         def __call__(
             self, lower: typing.Optional[dsl.Native] = None, upper: typing.Optional[dsl.Native] = None
-        ) -> None:
+        ) -> typing.Any:
             with self._runner as runner:
-                self._action(runner, lower, upper)
+                return self._action(runner, lower, upper)
 
     def __init__(self, runner: setup.Runner, assets: asset.Instance, feeds: io.Importer, sink: io.Exporter):
         self._runner: setup.Runner = runner
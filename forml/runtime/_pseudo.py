@@ -59,9 +59,13 @@ class Virtual:
             Returns:
                 Accessor of the train-mode features/outcomes outputs.
 
-        tune(lower=None, upper=None) -> None:
+        tune(lower=None, upper=None) -> typing.Sequence[tuple[typing.Mapping, float]]:
             Trigger the *tune* action.
 
+            Returns:
+                Leaderboard of the evaluated hyper-parameter variants as ``(params, score)``
+                tuples ranked from the best.
+
         apply(lower=None, upper=None) -> flow.Features:
             Trigger the *apply* action.
 
@@ -167,13 +171,14 @@ class Virtual:
                 LOGGER.warning(err)
             return float('nan')
 
-        @property
-        def tune(self) -> typing.Callable[[typing.Optional['dsl.Native'], typing.Optional['dsl.Native']], None]:
+        def tune(
+            self, lower: typing.Optional['dsl.Native'] = None, upper: typing.Optional['dsl.Native'] = None
+        ) -> typing.Sequence[tuple[typing.Mapping, float]]:
             """Trigger the *tune* action.
 
             See Also: Full description in the Virtual class docstring.
             """
-            return self._launcher.tune
+            return self._launcher.tune(lower, upper)
 
     class Sink(io.Sink):
         """Sniffer sink."""
@@ -165,13 +165,13 @@ class Wrapper:
         max_workers: typing.Optional[int] = None,
         loop: typing.Optional[asyncio.AbstractEventLoop] = None,
     ):
-        self._inventory: asset.Inventory = inventory
+        self._inventory: asset.Inventory.Async = inventory.aio
         self._registry: asset.Directory = asset.Directory(self.Frozen(registry))
         self._processes: Wrapper.Executor = self.Executor(futures.ProcessPoolExecutor(max_workers), loop)
         self._threads: Wrapper.Executor = self.Executor(futures.ThreadPoolExecutor(max_workers), loop)
         self._descriptors: dict[str, typing.Optional['appmod.Descriptor']] = {}
 
-    def _get_descriptor(self, application: str) -> 'appmod.Descriptor':
+    async def _get_descriptor(self, application: str) -> 'appmod.Descriptor':
         """Get the application descriptor.
 
         Args:
@@ -181,12 +181,12 @@ class Wrapper:
             Application descriptor.
         """
         if application not in self._descriptors:
-            updates = set(self._inventory.list()).difference(self._descriptors)
+            updates = set(await self._inventory.list()).difference(self._descriptors)
             self._descriptors.update({a: None for a in updates})
             if application not in updates:
                 raise forml.MissingError(f'Application {application} not found in {self._registry}')
         if not self._descriptors[application]:
-            self._descriptors[application] = self._inventory.get(application)
+            self._descriptors[application] = await self._inventory.get(application)
         return self._descriptors[application]
 
     @staticmethod
@@ -237,7 +237,7 @@ class Wrapper:
         Raises:
             forml.FailedError: In case of any processing error.
         """
-        descriptor = await self._threads(self._get_descriptor, application)
+        descriptor = await self._get_descriptor(application)
         instance, decoded = await self._threads(self._dispatch, descriptor, self._registry, request, stats)
         return self.Query(descriptor, instance, request.accept, decoded)
 
@@ -0,0 +1,253 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Hyper-parameter tuning utilities.
+"""
+import copy
+import logging
+import typing
+
+import numpy
+
+from forml import flow
+
+if typing.TYPE_CHECKING:
+    from forml.pipeline import payload
+
+LOGGER = logging.getLogger(__name__)
+
+#: Variant of the hyper-parameters keyed by the actor types (or names).
+Variant = typing.Mapping[typing.Union[type[flow.Actor], str], typing.Mapping[str, typing.Any]]
+
+
+class Trial(typing.NamedTuple):
+    """Tuning trial result."""
+
+    params: Variant
+    """Hyper-parameters of the evaluated variant."""
+    score: float
+    """Evaluation metric of the variant."""
+
+
+class Params(flow.Instruction):
+    """Instruction providing the constant hyper-parameters for the actor params preset."""
+
+    def __init__(self, params: typing.Mapping[str, typing.Any]):
+        self._params: typing.Mapping[str, typing.Any] = dict(params)
+
+    def __repr__(self):
+        return f'{super().__repr__()}{self._params}'
+
+    def execute(self) -> typing.Mapping[str, typing.Any]:  # pylint: disable=arguments-differ
+        """Instruction functionality.
+
+        Returns:
+            The hyper-parameters.
+        """
+        return self._params
+
+
+class Collector(flow.Instruction):
+    """Instruction collecting the metrics of all the variants and delivering them to the launcher."""
+
+    def __init__(self, client: 'payload.Sniff.Value.Client'):
+        self._client: 'payload.Sniff.Value.Client' = client
+
+    def execute(self, *scores: float) -> None:  # pylint: disable=arguments-differ
+        """Instruction functionality.
+
+        Args:
+            *scores: Metric values of the individual variants.
+        """
+        self._client.set(tuple(float(s) for s in scores))
+
+
+class Sampler(flow.Actor[flow.Features, flow.Labels, tuple[flow.Features, flow.Labels]]):
+    """Stateless actor drawing a random sample of the (aligned) features and labels.
+
+    Args:
+        fraction: Sampling fraction.
+        seed: Optional random seed.
+    """
+
+    def __init__(self, fraction: float, seed: typing.Optional[int] = None):
+        self._fraction: float = fraction
+        self._seed: typing.Optional[int] = seed
+
+    @staticmethod
+    def _take(data: typing.Any, index: numpy.ndarray) -> typing.Any:
+        """Select the given rows of the data.
+
+        Args:
+            data: Tabular data (pandas, numpy or plain sequence).
+            index: Row positions to select.
+
+        Returns:
+            Selected rows.
+        """
+        if hasattr(data, 'iloc'):
+            return data.iloc[index]
+        if isinstance(data, numpy.ndarray):
+            return data[index]
+        return [data[i] for i in index]
+
+    def apply(self, features: flow.Features, labels: flow.Labels) -> tuple[flow.Features, flow.Labels]:
+        size = len(features)
+        count = max(1, round(size * self._fraction))
+        index = numpy.sort(numpy.random.default_rng(self._seed).choice(size, count, replace=False))
+        LOGGER.debug('Sampling %d out of %d rows', count, size)
+        return self._take(features, index), self._take(labels, index)
+
+
+class Sample(flow.Operator):
+    """Operator sampling the train-mode features and labels (apply-mode is left intact).
+
+    Args:
+        fraction: Sampling fraction.
+        seed: Optional random seed.
+    """
+
+    def __init__(self, fraction: float, seed: typing.Optional[int] = None):
+        self._fraction: float = fraction
+        self._seed: typing.Optional[int] = seed
+
+    def compose(self, scope: flow.Composable) -> flow.Trunk:
+        left = scope.expand()
+        sampler = flow.Worker(Sampler.builder(self._fraction, self._seed), 2, 2)
+        sampler[0].subscribe(left.train.publisher)
+        sampler[1].subscribe(left.label.publisher)
+        train = flow.Future()
+        label = flow.Future()
+        train[0].subscribe(sampler[0])
+        label[0].subscribe(sampler[1])
+        return left.use(train=left.train.extend(tail=train), label=left.label.extend(tail=label))
+
+
+def match(builder: flow.Builder, key: typing.Union[type[flow.Actor], str]) -> bool:
+    """Check the builder actor matches the given tuning space key.
+
+    Args:
+        builder: Actor builder to check.
+        key: Actor type or name from the tuning space.
+
+    Returns:
+        True if matching.
+    """
+    actor = builder.actor
+    if isinstance(key, str):
+        return key in {actor.__name__, f'{actor.__module__}.{actor.__qualname__}'}
+    return (
+        actor is key
+        or (isinstance(key, type) and issubclass(actor, key))
+        or (actor.__module__, actor.__qualname__) == (key.__module__, key.__qualname__)
+    )
+
+
+def expand(
+    symbols: typing.Collection[flow.Symbol],
+    variants: typing.Sequence[Variant],
+    client: 'payload.Sniff.Value.Client',
+) -> typing.Collection[flow.Symbol]:
+    """Expand the compiled evaluation symbols into parallel branches of the individual variants.
+
+    Only the functors of the tuned actors plus everything downstream of them get replicated (with
+    the tuned functors preset with the variant hyper-parameters) - the unaffected upstream part is
+    shared by all the variants. The metric outputs of all the variants are finally gathered by the
+    :class:`Collector` instruction.
+
+    Args:
+        symbols: Compiled evaluation symbols with a single metric output leaf.
+        variants: Hyper-parameter variants to expand.
+        client: Remote value client for delivering the collected metrics.
+
+    Returns:
+        Expanded symbol table.
+    """
+    arguments: dict[flow.Instruction, typing.Sequence[flow.Instruction]] = dict(symbols)
+    (leaf,) = set(arguments).difference(a for a in arguments.values() for a in a)
+    keys = {k for v in variants for k in v}
+
+    def params(instruction: flow.Instruction) -> typing.Iterator[typing.Union[type[flow.Actor], str]]:
+        """Get the tuning space keys matching the given instruction."""
+        if isinstance(instruction, flow.Functor):
+            yield from (k for k in keys if match(instruction.builder, k))
+
+    tainted: dict[flow.Instruction, bool] = {}
+
+    def taint(instruction: flow.Instruction) -> bool:
+        """Determine whether the instruction is (or depends on) a tuned one."""
+        if instruction not in tainted:
+            tainted[instruction] = any(params(instruction)) or any(taint(a) for a in arguments[instruction])
+        return tainted[instruction]
+
+    taint(leaf)
+    result = [flow.Symbol(i, a) for i, a in arguments.items() if not taint(i)]
+    LOGGER.debug('Sharing %d out of %d instructions among %d variants', len(result), len(arguments), len(variants))
+
+    def clone(instruction: flow.Instruction, variant: Variant, cache: dict) -> flow.Instruction:
+        """Replicate the tainted instruction (and its tainted upstream) for the given variant."""
+        if not taint(instruction):
+            return instruction
+        if instruction not in cache:
+            args = tuple(clone(a, variant, cache) for a in arguments[instruction])
+            matching = tuple(params(instruction))
+            if matching:
+                value = {}
+                for key in matching:
+                    value.update(variant.get(key, {}))
+                replica = instruction.preset_params()
+                args = (Params(value), *args)
+                result.append(flow.Symbol(args[0], ()))
+            else:
+                replica = copy.copy(instruction)
+            result.append(flow.Symbol(replica, args))
+            cache[instruction] = replica
+        return cache[instruction]
+
+    collector = Collector(client)
+    result.append(flow.Symbol(collector, tuple(clone(leaf, v, {}) for v in variants)))
+    return result
+
+
+def halve(trials: typing.Sequence[Trial], eta: int, maximize: bool) -> typing.Sequence[Trial]:
+    """Rank the trials and select the best ``1/eta`` of them.
+
+    Args:
+        trials: Trials to be ranked.
+        eta: Reduction factor.
+        maximize: Whether the metric is a score to be maximized.
+
+    Returns:
+        Surviving trials (best first).
+    """
+    ranked = rank(trials, maximize)
+    return ranked[: max(1, len(ranked) // eta)]
+
+
+def rank(trials: typing.Sequence[Trial], maximize: bool) -> typing.Sequence[Trial]:
+    """Sort the trials from the best to the worst (invalid - NaN - metrics being the last).
+
+    Args:
+        trials: Trials to be ranked.
+        maximize: Whether the metric is a score to be maximized.
+
+    Returns:
+        Ranked trials.
+    """
+    sign = -1 if maximize else 1
+    return sorted(trials, key=lambda t: (numpy.isnan(t.score), sign * t.score if not numpy.isnan(t.score) else 0))
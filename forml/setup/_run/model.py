@@ -24,7 +24,6 @@ import typing
 import click
 from click import core
 
-import forml
 from forml import runtime, setup
 from forml.io import asset, dsl
 
@@ -113,15 +112,18 @@ def group(
 @click.option('--upper', help='Dataset upper ordinal.')
 @click.pass_obj
 def tune(
-    model: Scope,
+    scope: Scope,
     project: str,
     release: typing.Optional[str],
     generation: typing.Optional[str],
     lower: typing.Optional[dsl.Native],
     upper: typing.Optional[dsl.Native],
 ) -> None:
-    """Tune new generation of the given (or default) project release."""
-    raise forml.MissingError(f'Tuning project {project}... not implemented')
+    """Run the hyper-parameter search of the given (or default) project release."""
+    trials = scope.launcher(project, release, generation).tune(lower, upper)
+    for rank, (params, score) in enumerate(trials, start=1):
+        variant = ', '.join(f'{getattr(k, "__name__", k)}{dict(v)}' for k, v in params.items())
+        click.echo(f'#{rank}: score={score:g} {variant}')
 
 
 @group.command()
@@ -18,12 +18,16 @@
 Strategy unit tests.
 """
 import abc
+import pathlib
 import typing
 
 import pytest
 
-from forml import application, runtime
+from forml import application
+from forml import project as prjmod
+from forml import runtime
 from forml.io import asset
+from forml.provider.registry.filesystem import posix
 
 
 class Strategy(abc.ABC):
@@ -87,6 +91,21 @@ class TestLatest(Strategy):
         release = project_release if request.param else None
         return application.Latest(project_name, release)
 
+    async def test_refresh(self, strategy: application.Latest, directory: asset.Directory, instance: asset.Instance):
+        """Test the asynchronous instance lookup used for refreshing."""
+        assert await strategy._apick(directory) == instance  # pylint: disable=protected-access
+
+    async def test_empty(self, project_name: asset.Project.Key, empty_package: prjmod.Package, tmp_path: pathlib.Path):
+        """Test both the synchronous and the asynchronous lookups failing without any models."""
+        registry = posix.Registry(tmp_path / 'registry')
+        registry.push(empty_package)
+        directory = asset.Directory(registry)
+        strategy = application.Latest(project_name)
+        with pytest.raises(asset.Level.Listing.Empty, match='No models available'):
+            strategy._pick(directory)  # pylint: disable=protected-access
+        with pytest.raises(asset.Level.Listing.Empty, match='No models available'):
+            await strategy._apick(directory)  # pylint: disable=protected-access
+
 
 class TestABTest(Strategy):
     """ABTEst strategy unit tests."""
@@ -27,6 +27,7 @@ import uuid
 from unittest import mock
 
 import cloudpickle
+import numpy
 import pytest
 import toml
 
@@ -36,12 +37,25 @@ from forml import project as prjmod
 from forml import setup
 from forml.io import asset, dsl, layout
 from forml.pipeline import payload, wrap
+from forml.provider.feed import monolite
 from forml.provider.registry.filesystem import posix
 
 from . import helloworld
 from .helloworld import application as helloworld_descriptor
 
 
+class Demo(dsl.Schema):
+    """Synthetic binary classification dataset schema.
+
+    Note the (alchemy-based) feeds cache the query results by the SQL text so no other test schema
+    should be named the same while holding different data.
+    """
+
+    Ordinal = dsl.Field(dsl.Integer())
+    Label = dsl.Field(dsl.Integer())
+    Feature = dsl.Field(dsl.Integer())
+
+
 def pytest_sessionstart(session: pytest.Session) -> None:  # pylint: disable=unused-argument
     """Pytest setup hook to randomize the ForML home directory."""
     setup.USRDIR = asset.mkdtemp()
@@ -118,6 +132,24 @@ def actor_type(request: pytest.FixtureRequest) -> type[flow.Actor]:
     return request.param
 
 
+@pytest.fixture(scope='session')
+def execute() -> typing.Callable[[typing.Collection[flow.Symbol]], list[typing.Any]]:
+    """Fixture providing a helper for sequential execution of the symbols returning the values of the leaves."""
+
+    def execute(symbols: typing.Collection[flow.Symbol]) -> list[typing.Any]:
+        args = dict(symbols)
+        values = {}
+
+        def evaluate(instruction: flow.Instruction) -> typing.Any:
+            if instruction not in values:
+                values[instruction] = instruction(*(evaluate(a) for a in args[instruction]))
+            return values[instruction]
+
+        return [evaluate(i) for i in set(args).difference(a for a in args.values() for a in a)]
+
+    return execute
+
+
 @pytest.fixture(scope='session')
 def hyperparams() -> typing.Mapping[str, int]:
     """Hyperparams fixture."""
@@ -453,3 +485,18 @@ def testset_request(descriptor: appmod.Descriptor, testset_entry: layout.Entry)
     as_outcome = layout.Outcome(testset_entry.schema, testset_entry.data.to_rows())
     as_payload = descriptor.respond(as_outcome, [layout.Encoding('*/*')], None)
     return layout.Request(as_payload.data, as_payload.encoding)
+
+
+@pytest.fixture(scope='session')
+def demo_source() -> prjmod.Source:
+    """Source component fixture of the synthetic demo dataset."""
+    return prjmod.Source.query(Demo.select(Demo.Feature), Demo.Label, ordinal=Demo.Ordinal) >> payload.ToPandas(
+        columns=['Feature']
+    )
+
+
+@pytest.fixture(scope='session')
+def demo_feed() -> monolite.Feed:
+    """Feed fixture providing the synthetic demo dataset."""
+    values = numpy.random.default_rng(0).integers(0, 100, 60)
+    return monolite.Feed(inline={Demo: [[i, int(v > 50), int(v)] for i, v in enumerate(values)]})
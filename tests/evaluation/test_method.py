@@ -18,11 +18,30 @@
 """
 Evaluation methods unit tests.
 """
+import collections
+import typing
+from unittest import mock
+
+import numpy
+import pandas
 import pytest
-from sklearn import model_selection
+from sklearn import metrics, model_selection
+
+from forml import evaluation, flow, project
+from forml.io import dsl
+from forml.pipeline import ensemble, payload, wrap
+from forml.provider.feed import monolite
+
+with wrap.importer():
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import StandardScaler
 
-from forml import evaluation, flow
-from forml.pipeline import payload
+
+@wrap.Operator.mapper
+@wrap.Actor.apply
+def double(features: pandas.DataFrame) -> pandas.DataFrame:
+    """Stateless mapper operator."""
+    return features * 2
 
 
 class TestCrossVal:
@@ -57,6 +76,42 @@ class TestCrossVal:
         with pytest.raises(ValueError, match='splits required'):
             evaluation.CrossVal(splitter=splitter_builder, nsplits=1)  # few splits
 
+    def test_hoist(self, crossvalidator: payload.CrossValidable):
+        """Test the stateless prefix hoisting."""
+
+        class Counter(flow.Visitor, collections.Counter):
+            """Visitor counting the worker nodes per actor."""
+
+            def visit_node(self, node: flow.Node) -> None:
+                if isinstance(node, flow.Worker):
+                    self[node.builder.actor.__name__] += 1
+
+        def count(pipeline: typing.Callable[[], flow.Composable], hoist: bool) -> collections.Counter:
+            """Compose the evaluation and count its workers."""
+            metric = evaluation.Function(metrics.mean_squared_error)
+            method = evaluation.CrossVal(crossvalidator=crossvalidator, hoist=hoist)
+            trunk = (pipeline() >> evaluation.TrainTestScore(metric, method)).expand()
+            counter = Counter()
+            trunk.train.accept(counter)
+            return counter
+
+        hoisted = count(lambda: double() >> double() >> LinearRegression(), True)
+        replicated = count(lambda: double() >> double() >> LinearRegression(), False)
+        assert hoisted['double'] == 2
+        assert replicated['double'] == 2 * 2 * crossvalidator.get_n_splits()
+        assert hoisted['LinearRegression'] == replicated['LinearRegression']
+
+        def stack() -> flow.Composable:
+            """Pipeline with the ensembler composing its preceding part for each of its folds."""
+            ensembler = ensemble.FullStack(LinearRegression(), crossvalidator=model_selection.KFold(2))
+            return double() >> StandardScaler() >> ensembler >> LinearRegression()
+
+        hoisted = count(stack, True)
+        replicated = count(stack, False)
+        assert hoisted['double'] == 1
+        assert hoisted['StandardScaler'] == replicated['StandardScaler']  # replicated also within the ensembler
+        assert hoisted['LinearRegression'] == replicated['LinearRegression']
+
 
 class TestHoldOut:
     """HoldOut method unit tests."""
@@ -87,3 +142,99 @@ class TestHoldOut:
             evaluation.HoldOut(test_size=0.2, splitter=splitter_builder)  # extra test_size/splitter builder
         with pytest.raises(TypeError, match='Invalid combination'):
             evaluation.HoldOut(crossvalidator=crossvalidator, splitter=splitter_builder)  # extra cval
+
+
+class TestWalkForward:
+    """WalkForward method unit tests."""
+
+    class Timeline(dsl.Schema):
+        """Timeline dataset schema."""
+
+        Ordinal = dsl.Field(dsl.Integer())
+        Label = dsl.Field(dsl.Integer())
+        Feature = dsl.Field(dsl.Integer())
+
+    class Counter(flow.Actor[pandas.DataFrame, pandas.Series, pandas.Series]):
+        """Stateful actor predicting the total number of the rows it has been trained on."""
+
+        def __init__(self):
+            self._count = 0
+
+        def train(self, features: pandas.DataFrame, labels: pandas.Series, /) -> None:
+            self._count += len(features)
+
+        def apply(self, features: pandas.DataFrame) -> pandas.Series:
+            return pandas.Series(self._count, index=features.index)
+
+    @pytest.mark.parametrize(
+        'ordinal, incremental, expected',
+        [
+            (None, False, [([0, 1, 2], [3, 4, 5]), ([0, 1, 2, 3, 4, 5], [6, 7, 8, 9])]),
+            (None, True, [([0, 1, 2], [3, 4, 5]), ([3, 4, 5], [6, 7, 8, 9])]),
+            ([5, 5, 1, 1, 3, 3, 3, 9, 9, 7], False, [([2, 3], [4, 5, 6]), ([2, 3, 4, 5, 6], [0, 1, 7, 8, 9])]),
+        ],
+    )
+    def test_splitter(
+        self,
+        ordinal: typing.Optional[typing.Sequence[int]],
+        incremental: bool,
+        expected: typing.Sequence[tuple[typing.Sequence[int], typing.Sequence[int]]],
+    ):
+        """Test the window splitting."""
+        splitter = evaluation.WalkForward.Splitter(2, incremental)
+        assert splitter.get_n_splits() == 2
+        splits = [(list(t), list(v)) for t, v in splitter.split(numpy.zeros(10), None, ordinal)]
+        assert splits == expected
+        with pytest.raises(ValueError, match='Insufficient number of distinct ordinal values'):
+            list(splitter.split(numpy.zeros(10), None, [1] * 9 + [2]))
+
+    class Count(flow.Operator):
+        """Operator applying the Counter actor optionally opted in for the warm start."""
+
+        def __init__(self, warm: bool):
+            self._builder: flow.Builder = TestWalkForward.Counter.builder()
+            if warm:
+                self._builder = self._builder.hint(warm=True)
+
+        def compose(self, scope: flow.Composable) -> flow.Trunk:
+            left = scope.expand()
+            apply = flow.Worker(self._builder, 1, 1)
+            apply.fork().train(left.train.publisher, left.label.publisher)
+            return left.extend(apply)
+
+    @pytest.mark.parametrize(
+        'method, opted, expected',
+        [
+            (evaluation.WalkForward(3, ordinal=Timeline.Ordinal), True, [20, 40, 60]),
+            (evaluation.WalkForward(3, ordinal='Ordinal', warm=True), True, [20, 60, 120]),
+            (evaluation.WalkForward(3, ordinal='Ordinal', warm=True), False, [20, 40, 60]),
+            (evaluation.WalkForward(3, ordinal=lambda f: f['Ordinal'], incremental=True), True, [20, 40, 60]),
+            (evaluation.WalkForward(3, ordinal=lambda f: f['Ordinal'], incremental=True), False, [20, 40, 60]),
+        ],
+    )
+    def test_warm(
+        self,
+        method: evaluation.WalkForward,
+        opted: bool,
+        expected: typing.Sequence[int],
+        execute: typing.Callable[[typing.Collection[flow.Symbol]], list[typing.Any]],
+    ):
+        """Test the warm-started training of the consecutive windows."""
+        scores = []
+        source = project.Source.query(
+            self.Timeline.select(self.Timeline.Ordinal, self.Timeline.Feature),
+            self.Timeline.Label,
+            ordinal=self.Timeline.Ordinal,
+        ) >> payload.ToPandas(columns=['Ordinal', 'Feature'])
+        feed = monolite.Feed(inline={self.Timeline: [[i % 40, i % 2, i] for i in range(80)]})
+        metric = evaluation.Function(lambda t, p: p.iloc[0], reducer=lambda *s: scores.extend(s) or 0)
+        with mock.patch('forml.evaluation._method.LOGGER') as logger:
+            composition = (
+                flow.Composition.builder(feed.load(source.extract), source.transform)
+                .via(self.Count(opted) >> evaluation.TrainTestScore(metric, method))
+                .build()
+            )
+        # pylint: disable=protected-access
+        assert logger.warning.called is (bool(method._chunked) and not opted)
+        execute(flow.compile(composition.train))
+        assert scores == expected
@@ -0,0 +1,133 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Evaluation metrics unit tests.
+"""
+import typing
+
+import numpy
+import pandas
+import pytest
+from sklearn import metrics
+
+from forml import evaluation
+
+
+class TestIncremental:
+    """Incremental metrics unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def outcomes() -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Binary outcomes fixture."""
+        rng = numpy.random.default_rng(0)
+        true = rng.integers(0, 2, 1001)
+        return true, numpy.clip(true * 0.3 + rng.random(len(true)) * 0.7, 0, 1)
+
+    @pytest.mark.parametrize(
+        'metric, reference',
+        [
+            (evaluation.ConfusionScore(chunk=10), lambda t, p: metrics.accuracy_score(t, p >= 0.5)),
+            (evaluation.ConfusionScore('precision', chunk=10), lambda t, p: metrics.precision_score(t, p >= 0.5)),
+            (evaluation.ConfusionScore('recall', 0.7), lambda t, p: metrics.recall_score(t, p >= 0.7)),
+            (evaluation.ConfusionScore('f1', chunk=333), lambda t, p: metrics.f1_score(t, p >= 0.5)),
+            (evaluation.SquaredError(chunk=7), metrics.mean_squared_error),
+            (evaluation.SquaredError(root=True), lambda t, p: metrics.mean_squared_error(t, p) ** 0.5),
+            (evaluation.LogLoss(chunk=100), metrics.log_loss),
+            (evaluation.RocAuc(bins=100_000, chunk=100), metrics.roc_auc_score),
+        ],
+    )
+    def test_score(
+        self,
+        metric: evaluation.Incremental,
+        reference: typing.Callable[[numpy.ndarray, numpy.ndarray], float],
+        outcomes: tuple[numpy.ndarray, numpy.ndarray],
+    ):
+        """Test the metric values are matching the reference implementation regardless of the partitioning."""
+        true, pred = outcomes
+        expected = reference(true, pred)
+        assert metric.finalize(metric.summarize(true, pred)) == pytest.approx(expected, abs=1e-5)
+        partitions = [
+            metric.summarize(pandas.Series(t), pandas.Series(p))
+            for t, p in zip(*(numpy.array_split(o, 3) for o in outcomes))
+        ]
+        assert metric.finalize(*partitions) == pytest.approx(expected, abs=1e-5)
+
+    def test_invalid(self):
+        """Test the invalid input handling."""
+        with pytest.raises(ValueError, match='Unknown score'):
+            evaluation.ConfusionScore('foo')
+        with pytest.raises(ValueError, match='Invalid chunk'):
+            evaluation.LogLoss(chunk=0)
+        with pytest.raises(ValueError, match='length mismatch'):
+            evaluation.LogLoss().summarize([1, 0], [0.5])
+        assert numpy.isnan(evaluation.LogLoss().finalize(evaluation.LogLoss().summarize([], [])))
+        assert numpy.isnan(evaluation.RocAuc().finalize(evaluation.RocAuc().summarize([1, 1], [0.2, 0.3])))
+
+
+class TestBootstrap:
+    """Bootstrap metric unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def outcomes() -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Regression outcomes fixture."""
+        rng = numpy.random.default_rng(0)
+        true = rng.random(200)
+        return true, true + rng.normal(0, 0.1, len(true))
+
+    def test_estimate(self, outcomes: tuple[numpy.ndarray, numpy.ndarray]):
+        """Test the bootstrap estimate."""
+        true, pred = outcomes
+        metric = evaluation.Bootstrap(metrics.mean_squared_error, resamples=200, seed=42)
+        replicates = metric.resample(true, pred)
+        estimate = metric.estimate(replicates)
+        assert isinstance(estimate, float)
+        assert estimate.lower < metrics.mean_squared_error(true, pred) < estimate.upper
+        assert estimate == pytest.approx(metrics.mean_squared_error(true, pred), rel=0.1)
+        vectorized = evaluation.Bootstrap(
+            lambda t, p: ((t - p) ** 2).mean(axis=1), resamples=200, vectorized=True, seed=42
+        )
+        vectorized.BATCH = 1000
+        assert vectorized.resample(true, pred) == pytest.approx(replicates)
+        pooled = evaluation.Bootstrap(metrics.mean_squared_error, resamples=200, processes=2, seed=42)
+        assert pooled.resample(pandas.Series(true), pandas.Series(pred)) == pytest.approx(replicates)
+
+    def test_partition(self, outcomes: tuple[numpy.ndarray, numpy.ndarray]):
+        """Test the independent resampling of the equally sized partitions."""
+        metric = evaluation.Bootstrap(metrics.mean_squared_error, resamples=100, seed=42)
+        assert metric.resample(*outcomes) == pytest.approx(metric.resample(*outcomes, partition=0))
+        assert metric.resample(*outcomes) != pytest.approx(metric.resample(*outcomes, partition=1))
+
+    def test_reduce(self, outcomes: tuple[numpy.ndarray, numpy.ndarray]):
+        """Test the partitions reduction."""
+        metric = evaluation.Bootstrap(lambda t, p: ((t - p) ** 2).mean(axis=1), vectorized=True, seed=42)
+        partitions = [metric.resample(t, p) for t, p in zip(*(numpy.array_split(o, 2) for o in outcomes))]
+        estimate = metric.estimate(*partitions)
+        assert estimate == pytest.approx(numpy.mean(partitions))
+        assert estimate.lower < estimate < estimate.upper
+        assert estimate.upper - estimate.lower < max(numpy.ptp(p) for p in partitions)
+
+    def test_invalid(self):
+        """Test the invalid input handling."""
+        with pytest.raises(ValueError, match='resamples'):
+            evaluation.Bootstrap(metrics.log_loss, resamples=1)
+        with pytest.raises(ValueError, match='Invalid confidence'):
+            evaluation.Bootstrap(metrics.log_loss, confidence=1)
+        with pytest.raises(ValueError, match='length mismatch'):
+            evaluation.Bootstrap(metrics.log_loss).resample([1, 0], [0.5])
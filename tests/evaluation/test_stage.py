@@ -31,6 +31,9 @@ class TestPerfTrackScore(testing.operator(evaluation.PerfTrackScore)):
     """Production evaluation stage operator unit test."""
 
     score = testing.Case(METRIC).train(YPRED, YTRUE).returns(0.5)
+    chunked = testing.Case(evaluation.SquaredError(), chunks=2).train(YPRED, YTRUE).returns(0.5)
+    short = testing.Case(evaluation.SquaredError(), chunks=6).train(YPRED, YTRUE).returns(0.5)
+    invalid_chunks = testing.Case(METRIC, chunks=0).raises(ValueError, 'Invalid number of chunks')
 
 
 class TestTrainTestScore(testing.operator(evaluation.TrainTestScore)):
@@ -39,3 +42,16 @@ class TestTrainTestScore(testing.operator(evaluation.TrainTestScore)):
     METHOD = evaluation.CrossVal(crossvalidator=model_selection.PredefinedSplit([0, 0, 1, 1]))
 
     score = testing.Case(METRIC, METHOD).train(YPRED, YTRUE).returns(0.5)
+    hoisted = (
+        testing.Case(
+            METRIC, evaluation.CrossVal(crossvalidator=model_selection.PredefinedSplit([0, 0, 1, 1]), hoist=True)
+        )
+        .train(YPRED, YTRUE)
+        .returns(0.5)
+    )
+    incremental = testing.Case(evaluation.SquaredError(chunk=1), METHOD).train(YPRED, YTRUE).returns(0.5)
+    bootstrap = (
+        testing.Case(evaluation.Bootstrap(lambda t, p: (t == t).mean(axis=1) / 2, vectorized=True), METHOD)
+        .train(YPRED, YTRUE)
+        .returns(0.5)
+    )
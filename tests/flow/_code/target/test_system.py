@@ -0,0 +1,53 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+ForML system instruction unit tests.
+"""
+import threading
+import uuid
+from unittest import mock
+
+from forml import flow
+from forml.io import asset
+
+
+class TestDumper:
+    """Dumper instruction unit tests."""
+
+    def test_execute(self):
+        """Test the states get dumped concurrently returning their ids in order."""
+        barrier = threading.Barrier(3, timeout=10)
+
+        def dump(state: bytes) -> uuid.UUID:
+            barrier.wait()  # blocks unless all the states are being dumped at the same time
+            return uuid.UUID(bytes=state * 16)
+
+        assets = mock.MagicMock(spec=asset.State)
+        assets.dump.side_effect = dump
+        states = (b'\x01', b'\x02', b'\x03')
+        assert flow.Dumper(assets).execute(*states) == tuple(uuid.UUID(bytes=s * 16) for s in states)
+
+
+class TestCommitter:
+    """Committer instruction unit tests."""
+
+    def test_execute(self):
+        """Test the states get committed."""
+        assets = mock.MagicMock(spec=asset.State)
+        states = (uuid.uuid4(), uuid.uuid4())
+        flow.Committer(assets).execute(states)
+        assets.commit.assert_called_once_with(states)
@@ -20,6 +20,7 @@ ForML runtime instruction unit tests.
 """
 import abc
 import typing
+from unittest import mock
 
 import cloudpickle
 import pytest
@@ -46,6 +47,17 @@ class Functor(metaclass=abc.ABCMeta):
         assert isinstance(clone, flow.Functor)
         assert functor(actor_state, *args) == output
 
+    def test_shared_state(self, functor: flow.Functor, actor_state: bytes, args: typing.Sequence):
+        """Test the shared (non-bytes) states get copied before training."""
+        actor = mock.MagicMock()
+        state = memoryview(actor_state)
+        functor.preset_state().action(actor, state, *args)
+        received = actor.set_state.call_args.args[0]
+        if flow.Train in functor.action:
+            assert isinstance(received, bytearray) and received == actor_state
+        else:
+            assert received is state
+
 
 class TestApply(Functor):
     """Mapper functor unit tests."""
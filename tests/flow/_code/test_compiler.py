@@ -56,3 +56,23 @@ def test_compile(
 ):
     """Compiler generate test."""
     flow.compile(segment, valid_instance.state((node1.gid, node2.gid, node3.gid)))
+
+
+def test_dump(
+    actor_builder: flow.Builder[flow.Actor[layout.RowMajor, layout.Array, layout.RowMajor]],
+    valid_instance: asset.Instance,
+):
+    """Test all the trained states get dumped by a single dumper followed by the committer."""
+    source = flow.Worker(actor_builder, 1, 1)
+    first = flow.Worker(actor_builder, 1, 1)
+    second = flow.Worker(actor_builder, 1, 1)
+    first.train(source[0], source[0])
+    second.train(source[0], source[0])
+    symbols = {
+        s.instruction: s.arguments
+        for s in flow.compile(flow.Segment(source), valid_instance.state((first.gid, second.gid)))
+    }
+    (dumper,) = (i for i in symbols if isinstance(i, flow.Dumper))
+    (committer,) = (i for i in symbols if isinstance(i, flow.Committer))
+    assert len(symbols[dumper]) == 2 and all(isinstance(a, flow.Functor) for a in symbols[dumper])
+    assert symbols[committer] == (dumper,)
@@ -0,0 +1,99 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML symbols fusion unit tests.
+"""
+import typing
+
+import pytest
+from sklearn import metrics, model_selection
+
+from forml import evaluation, flow, project
+from forml.flow._code import fusion
+from forml.flow._code.target import user
+from forml.pipeline import ensemble, wrap
+from forml.provider.feed import monolite
+
+with wrap.importer():
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.preprocessing import StandardScaler
+
+
+def compile_eval(
+    source: project.Source, feed: monolite.Feed, pipeline: flow.Composable, method: evaluation.Method
+) -> typing.Collection[flow.Symbol]:
+    """Helper for compiling the train-test evaluation symbols."""
+    composition = (
+        flow.Composition.builder(feed.load(source.extract), source.transform)
+        .via(pipeline >> evaluation.TrainTestScore(evaluation.Function(metrics.log_loss), method))
+        .build()
+    )
+    return flow.compile(composition.train)
+
+
+def regions(symbols: typing.Collection[flow.Symbol]) -> list[fusion.Fused]:
+    """Helper for extracting the fused instructions."""
+    return [s.instruction for s in symbols if isinstance(s.instruction, fusion.Fused)]
+
+
+@pytest.mark.parametrize(
+    'pipeline, coschedule, fused',
+    [
+        (StandardScaler() >> LogisticRegression(max_iter=50), False, 0),
+        (StandardScaler() >> LogisticRegression(max_iter=50), True, 1),
+        (
+            ensemble.FullStack(
+                LogisticRegression(max_iter=50), crossvalidator=model_selection.KFold(2), coschedule=True
+            )
+            >> LogisticRegression(max_iter=50),
+            False,
+            3,
+        ),
+        (
+            ensemble.FullStack(
+                LogisticRegression(max_iter=50), crossvalidator=model_selection.KFold(2), coschedule=True
+            )
+            >> LogisticRegression(max_iter=50),
+            True,
+            1,
+        ),
+    ],
+)
+def test_fuse(
+    demo_source: project.Source,
+    demo_feed: monolite.Feed,
+    execute: typing.Callable[[typing.Collection[flow.Symbol]], list[typing.Any]],
+    pipeline: flow.Composable,
+    coschedule: bool,
+    fused: int,
+):
+    """Test the fusion of the co-scheduled fold branches into a single region per hinted splitter."""
+    method = evaluation.CrossVal(crossvalidator=model_selection.KFold(3), coschedule=coschedule)
+    symbols = compile_eval(demo_source, demo_feed, pipeline, method)
+    result = flow.fuse(symbols)
+    assert len(regions(result)) == fused
+    for region in regions(result):  # the hinted splitter gets fused together with its branches
+        assert any(
+            isinstance(i, user.Functor) and i.builder.hints.get('coschedule')
+            for i in region._args  # pylint: disable=protected-access
+        )
+    if not fused:
+        assert result is symbols
+    else:
+        assert len(result) < len(symbols)
+    assert execute(result) == pytest.approx(execute(symbols))
@@ -26,6 +26,7 @@ import pytest
 from forml import flow
 from forml.flow._graph import port
 from forml.io import layout
+from forml.pipeline import payload
 
 
 class Node(metaclass=abc.ABCMeta):
@@ -115,6 +116,21 @@ class TestWorker(Node):
         assert node.derived
         assert not fork.derived
 
+    def test_warm(self, node: flow.Worker, simple: flow.Worker):
+        """Test the warm start linking."""
+        assert node.origin is None
+        node.warm(simple)
+        assert node.origin == simple.gid
+        assert node.fork().origin == simple.gid
+        with pytest.raises(flow.TopologyError, match='Warm start cycle'):
+            simple.warm(node)
+        with pytest.raises(flow.TopologyError, match='Warm start cycle'):
+            node.warm(node.fork())
+        with pytest.raises(flow.TopologyError, match='Stateless warm start'):
+            node.warm(flow.Worker(payload.Apply.builder(function=max), 1, 1))
+        with pytest.raises(flow.TopologyError, match='actor mismatch'):
+            node.warm(flow.Worker(payload.PandasCVFolds.builder(crossvalidator=None), 1, 2))
+
     def test_builder(
         self, node: flow.Worker, actor_builder: flow.Builder[flow.Actor[layout.RowMajor, layout.Array, layout.RowMajor]]
     ):
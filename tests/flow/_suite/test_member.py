@@ -19,6 +19,8 @@
 Flow segment unit tests.
 """
 
+import copy
+
 import pytest
 
 from forml import flow
@@ -73,3 +75,19 @@ class TestCompound(Composable):
         """Testing linking action."""
         expression = composable >> operator
         assert isinstance(expression, member.Compound)
+
+    def test_terms(self, composable: flow.Composable, operator: flow.Operator):
+        """Testing the expression flattening."""
+        assert (composable >> operator).terms == (operator,)
+        assert operator.terms == (operator,)
+
+    def test_split(self, operator: flow.Operator):
+        """Testing the expression splitting."""
+        first, second, third = operator, copy.copy(operator), copy.copy(operator)
+        expression = first >> (second >> third)
+        head, tail = expression.split(2)
+        assert head.terms == (first, second) and tail.terms == (third,)
+        assert expression.split(0)[1].terms == expression.terms
+        assert isinstance(expression.split(3)[1], flow.Origin)
+        with pytest.raises(ValueError, match='Invalid split'):
+            expression.split(4)
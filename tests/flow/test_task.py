@@ -123,3 +123,14 @@ class TestBuilder:
     def test_repr(self, actor_builder: flow.Builder[flow.Actor[layout.RowMajor, layout.Array, layout.RowMajor]]):
         """Test the builder repr string."""
         assert repr(actor_builder) == flow.name(actor_builder.actor, *actor_builder.args, **actor_builder.kwargs)
+
+    def test_hint(self, actor_builder: flow.Builder[flow.Actor[layout.RowMajor, layout.Array, layout.RowMajor]]):
+        """Test the builder hints."""
+        assert not actor_builder.hints
+        hinted = actor_builder.hint(coschedule=2)
+        assert hinted.hints == {'coschedule': 2}
+        assert hinted.hint(foo='bar').hints == {'coschedule': 2, 'foo': 'bar'}
+        assert hinted.actor == actor_builder.actor
+        assert hinted.update(b=3).hints == hinted.hints
+        assert hinted(b=3).get_params() == actor_builder(b=3).get_params()
+        assert cloudpickle.loads(cloudpickle.dumps(hinted)).hints == hinted.hints
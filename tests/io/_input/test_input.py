@@ -19,11 +19,14 @@
 Feed utils unit tests.
 """
 
+import pickle
+
+import pandas
 import pytest
 
 import forml
 from forml import io, setup
-from forml.io import dsl
+from forml.io import dsl, layout
 
 
 class TestImporter:
@@ -50,3 +53,36 @@ class TestImporter:
         assert pool.match(source_query) is instance
         with pytest.raises(forml.MissingError):
             pool.match(dsl.Table(source_query.schema))
+
+
+class TestReader:
+    """Feed reader unit tests."""
+
+    def test_cache(self):
+        """Augmentation LRU cache test."""
+        cache = io.Feed.Reader.Cache(2)
+        cache.put('a', (1,))
+        cache.put('b', (2,))
+        assert cache.get('a') == (1,)
+        cache.put('c', (3,))
+        assert len(cache) == 2
+        assert cache.get('b') is None
+        assert cache.get('a') == (1,) and cache.get('c') == (3,)
+        cache = pickle.loads(pickle.dumps(cache))
+        assert len(cache) == 0
+        cache.put('d', (4,))
+        assert cache.get('d') == (4,)
+
+    def test_cast(self):
+        """Entry casting test."""
+        expected = dsl.Schema.from_fields(dsl.Field(dsl.Integer(), name='a'), dsl.Field(dsl.String(), name='b'))
+        actual = dsl.Schema.from_fields(dsl.Field(dsl.String(), name='a'), dsl.Field(dsl.String(), name='b'))
+        data = layout.Frame(pandas.DataFrame({'a': ['1', '2'], 'b': ['x', 'y']}))
+        assert io.Feed.Reader._cast(expected, expected, data) is data  # pylint: disable=protected-access
+        result = io.Feed.Reader._cast(expected, actual, data).to_columns()  # pylint: disable=protected-access
+        assert list(result[0]) == [1, 2]
+        assert list(result[1]) == ['x', 'y']
+        with pytest.raises(dsl.CastError):
+            io.Feed.Reader._cast(  # pylint: disable=protected-access
+                expected, actual, layout.Dense.from_rows([['1', 'x'], ['foo', 'y']])
+            )
@@ -18,6 +18,10 @@
 """
 ForML asset directory unit tests.
 """
+import time
+import typing
+import uuid
+
 import pytest
 
 from forml.io import asset
@@ -53,3 +57,57 @@ class TestCache:
         assert cache.info.hits == 1
         cache.clear()
         assert cache.info.currsize == 0
+
+    def test_budget(
+        self,
+        registry: asset.Registry,
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        valid_generation: asset.Generation.Key,
+        generation_states: typing.Mapping[uuid.UUID, bytes],
+    ):
+        """Test the byte-size budget eviction."""
+        first, second = generation_states
+        budget = max(len(s) for s in generation_states.values())
+        cache = _directory.Cache(asset.Registry.load, size=None, budget=budget)
+        assert cache(registry, project_name, project_release, valid_generation, first) == generation_states[first]
+        assert cache.info.nbytes == len(generation_states[first])
+        cache(registry, project_name, project_release, valid_generation, second)
+        assert cache.info.currsize == 1
+        assert cache.info.evictions == 1
+        assert cache.info.nbytes == len(generation_states[second])
+        cache.configure(size=None, budget=0)
+        assert cache.info.currsize == 0
+        cache(registry, project_name, project_release, valid_generation, second)  # exceeding the budget
+        assert cache.info.currsize == 0
+
+    def test_ttl(
+        self,
+        cache: _directory.Cache,
+        registry: asset.Registry,
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        valid_generation: asset.Generation.Key,
+    ):
+        """Test the entry expiration."""
+        cache.configure(ttl=0.01)
+        assert cache.info.maxsize == 128  # unspecified limits are kept
+        cache(registry, project_name, project_release, valid_generation)
+        time.sleep(0.02)
+        cache(registry, project_name, project_release, valid_generation)
+        assert cache.info.expirations == 1
+        assert cache.info.misses == 2
+
+    def test_invalidate(
+        self,
+        cache: _directory.Cache,
+        registry: asset.Registry,
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        valid_generation: asset.Generation.Key,
+    ):
+        """Test the explicit invalidation."""
+        cache(registry, project_name, project_release, valid_generation)
+        assert cache.invalidate(registry, project_name, asset.Release.Key('0.0')) == 0
+        assert cache.invalidate(registry, project_name, project_release) == 1
+        assert cache.info.currsize == 0
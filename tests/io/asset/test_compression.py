@@ -0,0 +1,83 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML state compression unit tests.
+"""
+import io
+import os
+import typing
+
+import pytest
+
+import forml
+from forml.io.asset import _compression
+
+
+class TestCompression:
+    """State compression unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def state() -> bytes:
+        """State fixture spanning multiple chunks."""
+        return os.urandom(1024) * (_compression.CHUNK // 512 + 1)
+
+    @staticmethod
+    def encode(state: bytes, compression: _compression.Compression) -> bytes:
+        """Helper for encoding the state."""
+        with io.BytesIO() as sink:
+            _compression.encode(state, sink, compression)
+            return sink.getvalue()
+
+    @pytest.mark.parametrize('alias', ['none', 'zlib', 'lzma'])
+    def test_roundtrip(self, state: bytes, alias: str):
+        """Test the encode-decode roundtrip."""
+        data = self.encode(state, _compression.Compression.get(alias, 1))
+        assert data.startswith(_compression.MAGIC)
+        if alias != 'none':
+            assert len(data) < len(state)
+        assert _compression.decode(data) == state
+
+    def test_plain(self, state: bytes):
+        """Test the uncompressed states are stored as is."""
+        assert self.encode(state, None) == state
+        assert _compression.decode(state) is state
+
+    def test_checksum(self, state: bytes):
+        """Test corrupted states are detected."""
+        data = bytearray(self.encode(state, _compression.Compression.get('none')))
+        data[len(_compression.MAGIC) + 10] ^= 0xFF
+        with pytest.raises(forml.InvalidError, match='checksum'):
+            _compression.decode(data)
+
+    @pytest.mark.parametrize('alias', [None, 'zlib'])
+    def test_stream(self, state: bytes, alias: typing.Optional[str]):
+        """Test the states can be provided as file-like objects or iterables of chunks."""
+        compression = _compression.Compression.get(alias) if alias else None
+        expected = self.encode(state, compression)
+        with io.BytesIO(state) as stream:
+            assert self.encode(stream, compression) == expected
+        assert self.encode(iter([state[:1000], state[1000:]]), compression) == expected
+        assert _compression.buffered(iter([state[:1000], state[1000:]])) == state
+        assert _compression.buffered(state) is state
+
+    def test_get(self):
+        """Test the codec lookup."""
+        assert _compression.Compression.get('zlib', 5) == _compression.Zlib(5)
+        with pytest.raises(forml.MissingError, match='Unknown compression'):
+            _compression.Compression.get('foobar')
@@ -0,0 +1,78 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML state serialization format unit tests.
+"""
+import mmap
+import pathlib
+import pickle
+import struct
+
+import cloudpickle
+import numpy
+import pytest
+
+from forml.io import asset
+from forml.io.asset import _format
+
+
+class TestCodec:
+    """State codec unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def state() -> dict[str, numpy.ndarray]:
+        """Sample state with out-of-band buffers."""
+        return {'c': numpy.arange(10.0), 'f': numpy.ones((3, 5), order='F'), 'name': 'foo'}
+
+    @staticmethod
+    def assert_equal(expected: dict[str, numpy.ndarray], actual: dict[str, numpy.ndarray]) -> None:
+        """Compare the states."""
+        assert expected.keys() == actual.keys()
+        for key, value in expected.items():
+            assert numpy.array_equal(value, actual[key]) if isinstance(value, numpy.ndarray) else value == actual[key]
+
+    def test_plain(self):
+        """Test objects without out-of-band buffers are stored as plain pickles."""
+        data = asset.serialize({'foo': [1, 2, 3]})
+        assert pickle.loads(data) == {'foo': [1, 2, 3]}
+        assert asset.deserialize(cloudpickle.dumps('bar')) == 'bar'
+
+    def test_roundtrip(self, state: dict[str, numpy.ndarray]):
+        """Test the serialization roundtrip."""
+        data = asset.serialize(state)
+        assert data.startswith(_format.MAGIC)
+        (count,) = struct.unpack_from('<I', data, len(_format.MAGIC))
+        assert count == 3
+        for index in range(count):
+            offset, _ = struct.unpack_from('<QQ', data, len(_format.MAGIC) + 4 + index * 16)
+            assert offset % _format.ALIGNMENT == 0
+        result = asset.deserialize(data)
+        self.assert_equal(state, result)
+        assert result['c'].flags.writeable
+
+    def test_mapped(self, state: dict[str, numpy.ndarray], tmp_path: pathlib.Path):
+        """Test the zero-copy loading from a memory-mapped file."""
+        path = tmp_path / 'state.bin'
+        path.write_bytes(asset.serialize(state))
+        with path.open('rb') as statefile:
+            mapped = mmap.mmap(statefile.fileno(), 0, access=mmap.ACCESS_READ)
+        result = asset.deserialize(mapped)
+        self.assert_equal(state, result)
+        assert not result['c'].flags.writeable
+        assert numpy.shares_memory(result['c'], numpy.frombuffer(mapped, dtype=numpy.uint8))
@@ -18,6 +18,10 @@
 """
 ForML persistent unit tests.
 """
+import asyncio
+import typing
+import uuid
+
 from forml.io import asset
 
 
@@ -28,3 +32,25 @@ class TestRegistry:
         """Test release get."""
         release = asset.Directory(registry).get(project_name).get(project_release)
         assert release.key == project_release
+
+    async def test_async(
+        self,
+        registry: asset.Registry,
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        valid_generation: asset.Generation.Key,
+        generation_tag: asset.Tag,
+        generation_states: typing.Mapping[uuid.UUID, bytes],
+    ):
+        """Test the asynchronous registry adapter."""
+        aio = registry.aio
+        assert project_name in await aio.projects()
+        assert project_release in (asset.Release.Key(r) for r in await aio.releases(project_name))
+        assert valid_generation in (
+            asset.Generation.Key(g) for g in await aio.generations(project_name, project_release)
+        )
+        assert await aio.open(project_name, project_release, valid_generation) == generation_tag
+        states = await asyncio.gather(
+            *(aio.load(project_name, project_release, valid_generation, s) for s in generation_states)
+        )
+        assert states == list(generation_states.values())
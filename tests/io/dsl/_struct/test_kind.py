@@ -23,6 +23,7 @@ import datetime
 import decimal
 import typing
 
+import pandas
 import pytest
 
 from forml.io import dsl
@@ -89,6 +90,13 @@ class Any(metaclass=abc.ABCMeta):
         with pytest.raises(dsl.CastError):
             kind.cast(FailCast())
 
+    def test_cast_column(self, sample: kindmod.Native, kind: kindmod.Any):
+        """Test the vectorized column casting."""
+        values = pandas.Series([sample, str(sample)])
+        assert list(kind.cast_column(values)) == [kind.cast(v) for v in values]
+        with pytest.raises(dsl.CastError):
+            kind.cast_column(pandas.Series([sample, FailCast()]))
+
 
 class Primitive(Any, metaclass=abc.ABCMeta):
     """Primitive kind test base class."""
@@ -97,6 +105,13 @@ class Primitive(Any, metaclass=abc.ABCMeta):
         """Test the instances are singletons."""
         assert kind is kindmod.reflect(sample)
 
+    def test_cast_column_native(self, sample: kindmod.Native, kind: kindmod.Any):
+        """Test columns already of the given kind are returned as is."""
+        values = pandas.Series([sample, sample])
+        assert kind.cast_column(values) is values
+        values = pandas.Series([sample, None], dtype=object)
+        assert kind.cast_column(values) is values
+
 
 class Compound(Any, metaclass=abc.ABCMeta):
     """Compound kind test base class."""
@@ -105,6 +120,10 @@ class Compound(Any, metaclass=abc.ABCMeta):
         with pytest.raises(dsl.UnsupportedError):
             super().test_cast(sample, kind)
 
+    def test_cast_column(self, sample: kindmod.Native, kind: kindmod.Any):
+        with pytest.raises(dsl.UnsupportedError):
+            super().test_cast_column(sample, kind)
+
 
 class TestBoolean(Primitive):
     """Boolean type unit tests."""
@@ -133,6 +152,13 @@ class TestInteger(Primitive):
     def kind() -> kindmod.Any:
         return kindmod.Integer()
 
+    def test_cast_column_integral(self, kind: kindmod.Any):
+        """Test the column casting rejects non-integral values."""
+        assert list(kind.cast_column(pandas.Series(['1', '2.0']))) == [1, 2]
+        for values in (['1', '1.5'], [1.0, None], [1.0, float('inf')]):
+            with pytest.raises(dsl.CastError):
+                kind.cast_column(pandas.Series(values))
+
 
 class TestFloat(Primitive):
     """Float type unit tests."""
@@ -161,6 +187,11 @@ class TestString(Primitive):
     def kind() -> kindmod.Any:
         return kindmod.String()
 
+    def test_cast_column_extension(self, sample: kindmod.Native, kind: kindmod.Any):
+        """Test extension string columns are returned as is."""
+        values = pandas.Series([sample, None], dtype='string')
+        assert kind.cast_column(values) is values
+
 
 class TestDecimal(Primitive):
     """Decimal type unit tests."""
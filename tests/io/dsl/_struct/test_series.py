@@ -222,14 +222,25 @@ class TestComparison(Predicate):
             series.NotEqual,
             series.IsNull,
             series.NotNull,
+            series.IsIn,
         ),
     )
     def feature(request: pytest.FixtureRequest, student_table: dsl.Table) -> series.Comparison:
         """Comparison fixture."""
         if issubclass(request.param, series.Bivariate):
             return request.param(student_table.score, 1)
+        if request.param is series.IsIn:
+            return request.param(student_table.score, 1, 2)
         return request.param(student_table.surname)
 
+    def test_isin(self, student_table: dsl.Table):
+        """IsIn operator specific tests."""
+        assert series.IsIn(student_table.score, 1, 2).values == (series.Literal(1), series.Literal(2))
+        with pytest.raises(dsl.GrammarError, match='Empty list'):
+            series.IsIn(student_table.score)
+        with pytest.raises(dsl.GrammarError, match='Invalid operands'):
+            series.IsIn(student_table.score, 'foo')
+
     @pytest.mark.parametrize(
         'operation, operator',
         [
@@ -0,0 +1,94 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Fold reducers unit tests.
+"""
+import numpy
+import pandas
+import pytest
+
+from forml import flow
+from forml.pipeline import ensemble
+from forml.pipeline.ensemble import _stacking
+
+FOLDS = (
+    pandas.DataFrame({'a': [1.0, 4.0, 2.0], 'b': [0.1, 0.5, 0.9]}),
+    pandas.DataFrame({'a': [2.0, 1.0, 8.0], 'b': [0.2, 0.5, 0.8]}),
+    pandas.DataFrame({'a': [4.0, 2.0, 4.0], 'b': [0.3, 0.5, 0.7]}),
+)
+
+
+@pytest.mark.parametrize(
+    'reducer, expected',
+    [
+        (ensemble.MeanReducer.builder(), pandas.DataFrame({'a': [7 / 3, 7 / 3, 14 / 3], 'b': [0.2, 0.5, 0.8]})),
+        (
+            ensemble.MeanReducer.builder(weights=[1, 0, 1]),
+            pandas.DataFrame({'a': [2.5, 3.0, 3.0], 'b': [0.2, 0.5, 0.8]}),
+        ),
+        (ensemble.MedianReducer.builder(), pandas.DataFrame({'a': [2.0, 2.0, 4.0], 'b': [0.2, 0.5, 0.8]})),
+        (
+            ensemble.GeometricReducer.builder(),
+            pandas.DataFrame({'a': [2.0, 2.0, 4.0], 'b': numpy.cbrt([0.006, 0.125, 0.504])}),
+        ),
+    ],
+)
+def test_reduce(reducer: flow.Builder, expected: pandas.DataFrame):
+    """Test the reducers."""
+    pandas.testing.assert_frame_equal(reducer().apply(*FOLDS), expected)
+
+
+def test_series():
+    """Test reducing series and raw sequences."""
+    series = ensemble.MeanReducer().apply(pandas.Series([1.0, 3.0], name='x'), pandas.Series([3.0, 5.0], name='x'))
+    pandas.testing.assert_frame_equal(series, pandas.DataFrame({'x': [2.0, 4.0]}))
+    raw = ensemble.MeanReducer().apply([1.0, 3.0], [3.0, 5.0])
+    pandas.testing.assert_frame_equal(raw, pandas.DataFrame({0: [2.0, 4.0]}))
+    pandas.testing.assert_frame_equal(_stacking.pandas_mean(*FOLDS), ensemble.MeanReducer().apply(*FOLDS))
+
+
+def test_invalid():
+    """Test the folds shape validation."""
+    with pytest.raises(ValueError, match='same shape'):
+        ensemble.MeanReducer().apply(FOLDS[0], FOLDS[1].iloc[:2])
+
+
+def test_geometric():
+    """Test the geometric reducer input validation."""
+    with pytest.raises(ValueError, match='negative'):
+        ensemble.GeometricReducer().apply(FOLDS[0], -FOLDS[1])
+
+
+def test_rank():
+    """Test the rank reducer."""
+    with pytest.raises(ValueError, match='Invalid reference size'):
+        ensemble.RankReducer(size=1)
+    reducer = ensemble.RankReducer()
+    with pytest.raises(RuntimeError, match='not trained'):
+        reducer.apply(*FOLDS)
+    reducer.train(pandas.DataFrame({'a': [8.0, 2.0, 4.0, 1.0], 'b': [0.2, 0.4, 0.6, 0.8]}), None)
+    expected = pandas.DataFrame({'a': [3 / 8, 3 / 8, 5 / 8], 'b': [1 / 8, 1 / 2, 7 / 8]})
+    pandas.testing.assert_frame_equal(reducer.apply(*FOLDS), expected)
+    single = reducer.apply(*(f.iloc[1:2] for f in FOLDS))
+    pandas.testing.assert_frame_equal(single, expected.iloc[1:2])
+    restored = ensemble.RankReducer()
+    restored.set_state(reducer.get_state())
+    pandas.testing.assert_frame_equal(restored.apply(*FOLDS), expected)
+    reducer.train(FOLDS[0][['a']], None)
+    with pytest.raises(ValueError, match='columns mismatch'):
+        reducer.apply(*FOLDS)
@@ -18,14 +18,18 @@
 """
 Stacking ensembles unit tests.
 """
+import typing
+
 import pandas
+import pytest
 from sklearn import model_selection
 
-from forml import testing
+from forml import flow, io, project, testing
 from forml.pipeline import ensemble, payload, wrap
 
 with wrap.importer():
     from sklearn.dummy import DummyClassifier  # pylint: disable=ungrouped-imports
+    from sklearn.preprocessing import StandardScaler
 
 
 class TestFullStack(testing.operator(ensemble.FullStack)):
@@ -73,3 +77,52 @@ class TestFullStack(testing.operator(ensemble.FullStack)):
         .apply(FEATURES)
         .returns(APPLY_EXPECT, testing.pandas_equals)
     )
+    apply_rank = (
+        testing.Case(MODEL1, MODEL2, crossvalidator=CROSSVALIDATOR, reducer=ensemble.RankReducer.builder())
+        .train(FEATURES, LABELS)
+        .apply(FEATURES.iloc[:1])
+        .returns(APPLY_EXPECT.iloc[:1], testing.pandas_equals)
+    )
+    invalid_keep = testing.Case(MODEL1, MODEL2, crossvalidator=CROSSVALIDATOR, keep=[2]).raises(
+        ValueError, 'Invalid fold selection'
+    )
+    keep_refit = testing.Case(MODEL1, MODEL2, crossvalidator=CROSSVALIDATOR, keep=[0], refit=True).raises(
+        TypeError, 'Invalid combination'
+    )
+    apply_keep = (
+        testing.Case(MODEL1, MODEL2, crossvalidator=CROSSVALIDATOR, keep=[1])
+        .train(FEATURES, LABELS)
+        .apply(FEATURES)
+        .returns(pandas.DataFrame([[0.0, 0.0]] * 6, columns=[0, 0]), testing.pandas_equals)
+    )
+    apply_refit = (
+        testing.Case(MODEL1, MODEL2, crossvalidator=CROSSVALIDATOR, refit=True)
+        .train(FEATURES, LABELS)
+        .apply(FEATURES)
+        .returns(pandas.DataFrame([[0.0, 0.0]] * 6, columns=[0, 1]), testing.pandas_equals)
+    )
+
+
+@pytest.mark.parametrize('kwargs, persistent', [({}, 7), ({'keep': [0]}, 4), ({'refit': True}, 4)])
+def test_pruned(
+    kwargs: typing.Mapping[str, typing.Any],
+    persistent: int,
+    feed_instance: io.Feed,
+    project_components: project.Components,
+):
+    """Test the pruned serving topology persists only the kept models."""
+    pipeline = (
+        StandardScaler()
+        >> ensemble.FullStack(
+            DummyClassifier(), DummyClassifier(), crossvalidator=TestFullStack.CROSSVALIDATOR, **kwargs
+        )
+        >> DummyClassifier()
+    )
+    composition = (
+        flow.Composition.builder(
+            feed_instance.load(project_components.source.extract), project_components.source.transform
+        )
+        .via(pipeline)
+        .build()
+    )
+    assert len(composition.persistent) == persistent
@@ -0,0 +1,109 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML payload splitting unit tests.
+"""
+import pickle
+
+import numpy
+import pandas
+import pytest
+from sklearn import model_selection
+
+from forml.pipeline import payload
+
+
+@pytest.fixture(
+    scope='module', params=(model_selection.KFold(3), model_selection.KFold(3, shuffle=True, random_state=1))
+)
+def crossvalidator(request: pytest.FixtureRequest) -> payload.CrossValidable:
+    """Crossvalidator fixture."""
+    return request.param
+
+
+class TestPandasCVFolds:
+    """PandasCVFolds unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def features() -> pandas.DataFrame:
+        """Features fixture."""
+        return pandas.DataFrame({'a': numpy.arange(9.0), 'b': list('abcdefghi')}, index=numpy.arange(9) * 10)
+
+    def test_apply(self, crossvalidator: payload.CrossValidable, features: pandas.DataFrame):
+        """Test the lazy folding."""
+        splitter = payload.PandasCVFolds(crossvalidator)
+        with pytest.raises(RuntimeError, match='not trained'):
+            splitter.apply(features)
+        splitter.train(features, features['a'])
+        folds = splitter.apply(features)
+        assert len(folds) == 2 * crossvalidator.get_n_splits()
+        for fold, (train, test) in zip(range(0, len(folds), 2), crossvalidator.split(features)):
+            pandas.testing.assert_frame_equal(folds[fold], features.iloc[train].reset_index(drop=True))
+            pandas.testing.assert_frame_equal(folds[fold + 1], features.iloc[test].reset_index(drop=True))
+        assert len(pickle.loads(pickle.dumps(folds))) == len(folds)
+        eager = payload.PandasCVFolds.split(features, tuple(crossvalidator.split(features)))
+        for lazy, copy in zip(folds[:], eager):
+            pandas.testing.assert_frame_equal(lazy, copy)
+
+    def test_view(self, features: pandas.DataFrame):
+        """Test the contiguous folds are views only if requested."""
+        fold = payload.PandasCVFolds.take(features, [3, 4, 5])
+        assert not numpy.shares_memory(fold['a'].to_numpy(), features['a'].to_numpy())
+        fold = payload.PandasCVFolds.take(features, [3, 4, 5], view=True)
+        assert numpy.shares_memory(fold['a'].to_numpy(), features['a'].to_numpy())
+        assert list(fold.index) == [0, 1, 2]
+        splitter = payload.PandasCVFolds(model_selection.KFold(3), view=True)
+        splitter.train(features, features['a'])
+        assert numpy.shares_memory(splitter.apply(features)[1]['a'].to_numpy(), features['a'].to_numpy())
+        fold = payload.PandasCVFolds.take(features['a'], [5, 1])
+        assert list(fold) == [5.0, 1.0] and list(fold.index) == [0, 1]
+
+
+class TestNumpyCVFolds:
+    """NumpyCVFolds unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def features() -> numpy.ndarray:
+        """Features fixture."""
+        return numpy.arange(18.0).reshape(9, 2)
+
+    def test_apply(self, crossvalidator: payload.CrossValidable, features: numpy.ndarray):
+        """Test the numpy folding."""
+        splitter = payload.NumpyCVFolds(crossvalidator)
+        splitter.train(features, features[:, 0])
+        folds = splitter.apply(features)
+        for fold, (train, test) in zip(range(0, len(folds), 2), crossvalidator.split(features)):
+            numpy.testing.assert_array_equal(folds[fold], features[train])
+            numpy.testing.assert_array_equal(folds[fold + 1], features[test])
+
+    def test_view(self, features: numpy.ndarray):
+        """Test the contiguous folds are views only if requested."""
+        assert not numpy.shares_memory(payload.NumpyCVFolds.take(features, [3, 4, 5]), features)
+        assert numpy.shares_memory(payload.NumpyCVFolds.take(features, [3, 4, 5], view=True), features)
+        fold = payload.NumpyCVFolds.take(features, [5, 1], view=True)
+        assert not numpy.shares_memory(fold, features)
+        numpy.testing.assert_array_equal(fold, features[[5, 1]])
+        with pytest.raises(IndexError, match='out of bounds'):
+            payload.NumpyCVFolds.take(features, [5, 9])
+        with pytest.raises(IndexError, match='out of bounds'):
+            payload.NumpyCVFolds.take(features, [-1, 0])
+        assert payload.CVFoldable.contiguous([]) is None
+        assert payload.CVFoldable.contiguous([2, 4, 3]) is None
+        assert payload.CVFoldable.contiguous([2, 3, 4]) == slice(2, 5)
@@ -143,6 +143,7 @@ class TestClass(Type):
         assert instance.apply('foo') == 'bar'
         assert instance.apply('Blah') == 'baz'
         assert instance.apply('blah') == 'N/A'
+        assert instance.apply is instance.apply  # cached target
 
 
 class TestStateless(Type):
@@ -23,9 +23,11 @@ import sys
 import typing
 
 import cloudpickle
+import numpy
+import pandas
 import pytest
 from sklearn import base as skbase
-from sklearn import ensemble, preprocessing
+from sklearn import ensemble, linear_model, preprocessing
 
 from forml import flow
 from forml.pipeline import wrap
@@ -123,6 +125,41 @@ class TestAutoSklearnRegressor(Wrapper[type[skbase.RegressorMixin]]):
         return request.param
 
 
+class TestFast:
+    """Fast-path endpoints unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def features() -> pandas.DataFrame:
+        """Features fixture."""
+        return pandas.DataFrame(numpy.random.default_rng(0).random((50, 3)), columns=['a', 'b', 'c'])
+
+    @pytest.mark.parametrize(
+        'wrapper, estimator',
+        [
+            (wrap.AutoSklearnClassifier(fast=True), linear_model.LogisticRegression),
+            (wrap.AutoSklearnRegressor(fast=True), linear_model.LinearRegression),
+            (wrap.AutoSklearnTransformer(fast=True), preprocessing.StandardScaler),
+        ],
+    )
+    def test_apply(self, wrapper: _auto.Auto, estimator: type[skbase.BaseEstimator], features: pandas.DataFrame):
+        """Test the fast-path apply-mode is equivalent to the default one."""
+        labels = (features['a'] > 0.5).astype(int)
+        default = _auto.AUTO[[a.base for a in _auto.AUTO].index(wrapper.base)](estimator).Apply()
+        fast = wrapper(estimator).Apply()
+        default.train(features, labels)
+        fast.train(features, labels)
+        expected = default.apply(features)
+        assert numpy.allclose(fast.apply(features[['c', 'a', 'b']]), expected)
+        assert numpy.allclose(fast.apply(features.to_numpy()), expected)
+        assert numpy.allclose(fast.apply(features.to_numpy().tolist()), expected)
+        restored = wrapper(estimator).Apply()
+        restored.set_state(fast.get_state())
+        assert numpy.allclose(restored.apply(features[['b', 'c', 'a']]), expected)
+        with pytest.raises(KeyError):
+            fast.apply(features[['a', 'b']])
+
+
 def test_importer():
     """Autowrapping importer context manager unit test."""
     # pylint: disable=import-outside-toplevel,reimported
@@ -80,6 +80,8 @@ class TestSource:
             project.Source.query(student_table, apply=school_table)
         with pytest.raises(forml.InvalidError, match='Once without an Ordinal'):
             project.Source.query(student_table.select(student_table.school), student_table.score, once='exactly')
+        with pytest.raises(forml.InvalidError, match='Incremental without an Ordinal'):
+            project.Source.query(student_table.select(student_table.school), student_table.score, incremental=True)
 
     def test_query(self, source_query: dsl.Query, labels: typing.Optional[project.Source.Labels]):
         """Test the query setup."""
@@ -87,3 +89,21 @@ class TestSource:
         assert isinstance(query.extract.train, dsl.Query)
         assert query.extract.apply == query.extract.train == source_query
         assert query.extract.labels == labels
+
+    def test_incremental(self, source_query: dsl.Query, student_table: dsl.Table):
+        """Test the incremental extract setup."""
+        assert not project.Source.query(source_query, ordinal=student_table.updated).extract.ordinal.incremental
+        query = project.Source.query(source_query, ordinal=student_table.updated, incremental=True)
+        assert query.extract.ordinal.incremental
+
+
+class TestTuning:
+    """Tuning unit tests."""
+
+    def test_variants(self):
+        """Test the search space expansion."""
+        tuning = project.Tuning({'Foo': {'a': [1, 2], 'b': [3]}, 'Bar': {'c': [4, 5, 6]}})
+        variants = tuning.variants
+        assert len(variants) == 6
+        assert {'Foo': {'a': 2, 'b': 3}, 'Bar': {'c': 5}} in variants
+        assert project.Tuning({}).variants == ({},)
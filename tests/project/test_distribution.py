@@ -21,6 +21,8 @@ Project distribution tests.
 import os
 import pathlib
 import pickle
+import shutil
+import zipfile
 
 import pytest
 
@@ -69,6 +71,23 @@ class TestPackage:
         assert artifact.package == project_package.manifest.package
         assert artifact.components
 
+    def test_install_cached(self, project_package: project.Package, tmp_path: pathlib.Path):
+        """Test repeated installations are reused."""
+        package = project.Package.create(project_package.path, project_package.manifest, tmp_path / 'foo.4ml')
+        target = tmp_path / 'foo'
+        inode = package.install(target).path.stat().st_ino
+        assert project.Package(package.path).install(target).path.stat().st_ino == inode
+
+    def test_install_lazy(self, project_package: project.Package, tmp_path: pathlib.Path):
+        """Test lazy installation of non zip-safe packages."""
+        source = shutil.copytree(project_package.path, tmp_path / 'source')
+        (source / 'data.txt').write_text('foo')
+        package = project.Package.create(source, project_package.manifest, tmp_path / 'foo.4ml')
+        assert package.install(tmp_path / 'extracted').path.is_dir()
+        artifact = package.install(tmp_path / 'lazy', lazy=True)
+        assert zipfile.is_zipfile(artifact.path)
+        assert artifact.components
+
     def test_serilizable(self, project_package: project.Package):
         """Test package serializability."""
         assert pickle.loads(pickle.dumps(project_package)) == project_package
@@ -20,13 +20,16 @@ Common feed implementations tests.
 """
 
 import abc
+import datetime
 import pickle
+import unittest.mock
 
 import numpy
+import pandas
 import pytest
 
 from forml import io, project, runtime
-from forml.io import layout
+from forml.io import dsl, layout
 from forml.pipeline import payload
 
 
@@ -74,3 +77,58 @@ class Feed(abc.ABC):
     def test_serializable(self, feed: io.Feed):
         """Test feed serializability."""
         assert pickle.loads(pickle.dumps(feed)).__class__ == feed.__class__
+
+    def test_watermark(self, feed: io.Feed, project_components: project.Components):
+        """Test the feed watermark query."""
+        extract = project_components.source.extract
+        assert feed.watermark(extract) == datetime.datetime(2019, 4, 3)
+        assert feed.watermark(extract, datetime.datetime(2019, 4, 2)) == datetime.datetime(2019, 4, 3)
+        assert feed.watermark(extract, datetime.datetime(2019, 4, 4)) is None
+
+    def test_augment(self, feed: io.Feed, project_components: project.Components):
+        """Test the feed augmentation mode."""
+        statement = project_components.source.extract.apply
+        producer = feed.producer(feed.sources, feed.features, **feed._readerkw)  # pylint: disable=protected-access
+        entry = layout.Entry(
+            dsl.Schema.from_fields(dsl.Field(dsl.String(), name='surname')),
+            layout.Dense.from_rows([['harris'], ['nobody'], ['smith'], ['harris']]),
+        )
+        expected = [
+            ('harris', 'stanford', 3),
+            ('nobody', None, None),
+            ('smith', 'oxford', 1),
+            ('harris', 'stanford', 3),
+        ]
+        with unittest.mock.patch.object(producer, 'read', wraps=producer.read) as read:
+            for _ in range(2):  # second round served from the cache (including the missing key)
+                result = producer(statement, entry).to_rows()
+                assert [tuple(None if pandas.isna(v) else v for v in r) for r in result] == expected
+            read.assert_called_once()
+
+    @pytest.mark.parametrize(
+        'fields, known',
+        [
+            ((dsl.Field(dsl.String(), name='surname'),), [('harris',), ('smith',)]),
+            (
+                (dsl.Field(dsl.String(), name='surname'), dsl.Field(dsl.Integer(), name='score')),
+                [('harris', 3), ('smith', 1)],
+            ),
+        ],
+    )
+    def test_augment_batch(
+        self,
+        feed: io.Feed,
+        project_components: project.Components,
+        fields: tuple[dsl.Field],
+        known: list[tuple],
+    ):
+        """Test the feed augmentation of a large number of keys."""
+        statement = project_components.source.extract.apply
+        producer = feed.producer(feed.sources, feed.features, **feed._readerkw)  # pylint: disable=protected-access
+        keys = known + [(f'nobody{i}', i)[: len(fields)] for i in range(1200)]
+        entry = layout.Entry(dsl.Schema.from_fields(*fields), layout.Dense.from_rows([list(k) for k in keys]))
+        with unittest.mock.patch.object(producer, 'read', wraps=producer.read) as read:
+            result = producer(statement, entry).to_rows()
+        assert read.call_count == -(-len(keys) // producer.LOOKUP_SIZE)
+        assert [r[1] for r in result[: len(known)]] == ['stanford', 'oxford']
+        assert all(pandas.isna(r[1]) for r in result[len(known) :])  # noqa: E203
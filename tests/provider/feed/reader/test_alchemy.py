@@ -19,8 +19,11 @@ SQL alchemy parser tests.
 """
 import abc
 import datetime
+import os
 import types
 import typing
+import unittest.mock
+from concurrent import futures
 
 import numpy
 import pandas
@@ -99,6 +102,15 @@ def features(student_table: dsl.Table) -> typing.Mapping[dsl.Feature, sql.Column
     return types.MappingProxyType({student_table.level: sql.column('class')})
 
 
+@pytest.fixture(scope='function', params=['sqlite:///:memory:', 'duckdb:///:memory:'])
+def connection(request: pytest.FixtureRequest, student_data: pandas.DataFrame, school_data: pandas.DataFrame):
+    """Populated in-memory connection fixture."""
+    connection = sqlalchemy.create_engine(request.param).connect()
+    student_data.rename({'level': 'class'}, axis='columns').to_sql('student', connection, index=False)
+    school_data.to_sql('school', connection, index=False)
+    return connection
+
+
 class TestParser:
     """Alchemy parser unit tests."""
 
@@ -281,15 +293,6 @@ class TestParser:
 class TestReader:
     """Alchemy reader test."""
 
-    @staticmethod
-    @pytest.fixture(scope='function', params=['sqlite:///:memory:', 'duckdb:///:memory:'])
-    def connection(request: pytest.FixtureRequest, student_data: pandas.DataFrame, school_data: pandas.DataFrame):
-        """Populated in-memory connection fixture."""
-        connection = sqlalchemy.create_engine(request.param).connect()
-        student_data.rename({'level': 'class'}, axis='columns').to_sql('student', connection, index=False)
-        school_data.to_sql('school', connection, index=False)
-        return connection
-
     @staticmethod
     @pytest.fixture(scope='function')
     def reader(
@@ -317,3 +320,168 @@ class TestReader:
             .apply(lambda r: pandas.Series([r['surname'], r['name'], int(r['score'])]), axis='columns')
         ).values
         assert numpy.array_equal(result.to_rows(), expected)
+
+
+class TestPool:
+    """Pool unit tests."""
+
+    def test_get(self, tmp_path):
+        """Test the engine caching."""
+        url = f'sqlite:///{tmp_path / "pool.db"}'
+        engine = alchemy.Pool.get(url)
+        assert alchemy.Pool.get(url) is engine
+        assert alchemy.Pool.get(url, pool_size=2) is not engine
+        alchemy.Pool.reset()
+        assert alchemy.Pool.get(url) is not engine
+
+
+class TestPooledReader:
+    """Alchemy reader test using the pooled engine."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def dburl(tmp_path, student_data: pandas.DataFrame, school_data: pandas.DataFrame) -> str:
+        """File-based DB URL fixture."""
+        url = f'sqlite:///{tmp_path / "test.db"}'
+        connection = sqlalchemy.create_engine(url)
+        student_data.rename({'level': 'class'}, axis='columns').to_sql('student', connection, index=False)
+        school_data.to_sql('school', connection, index=False)
+        return url
+
+    @staticmethod
+    @pytest.fixture(scope='function', params=[None, 2])
+    def reader(
+        request: pytest.FixtureRequest,
+        dburl: str,
+        sources: typing.Mapping[dsl.Source, sql.Selectable],
+        features: typing.Mapping[dsl.Feature, sql.ColumnElement],
+    ) -> alchemy.Reader:
+        """Pooled reader fixture."""
+        return alchemy.Reader(sources, features, dburl, pool={'pool_size': 2}, chunksize=request.param)
+
+    def test_read(
+        self,
+        reader: alchemy.Reader,
+        dburl: str,
+        sources: typing.Mapping[dsl.Source, sql.Selectable],
+        features: typing.Mapping[dsl.Feature, sql.ColumnElement],
+        source_query: dsl.Query,
+    ):
+        """Test concurrent reads."""
+        expected = alchemy.Reader(sources, features, sqlalchemy.create_engine(dburl))(source_query).to_rows()
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            for result in executor.map(lambda _: reader(source_query).to_rows(), range(4)):
+                assert numpy.array_equal(result, expected)
+
+
+class TestPlans:
+    """Plans unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def dialect() -> engine.Dialect:
+        """Dialect fixture."""
+        return sqlalchemy.create_engine('sqlite://').dialect
+
+    def test_fingerprint(
+        self,
+        student_table: dsl.Table,
+        sources: typing.Mapping[dsl.Source, sql.Selectable],
+        features: typing.Mapping[dsl.Feature, sql.ColumnElement],
+        dialect: engine.Dialect,
+    ):
+        """Test the statement fingerprinting."""
+
+        def query() -> dsl.Query:
+            """Build a fresh instance of the same query."""
+            return student_table.select(student_table.surname, student_table.level).where(student_table.score > 1)
+
+        key = alchemy.Plans.fingerprint(query(), sources, features, dialect)
+        assert key == alchemy.Plans.fingerprint(query(), dict(sources), dict(features), dialect)
+        assert key != alchemy.Plans.fingerprint(query().limit(3), sources, features, dialect)
+        assert key != alchemy.Plans.fingerprint(query().where(student_table.score < 3), sources, features, dialect)
+        assert key != alchemy.Plans.fingerprint(query(), sources, {}, dialect)
+        bounded = query().where(student_table.level > 1)
+        assert alchemy.Plans.fingerprint(
+            query().where(student_table.level > 2), sources, features, dialect
+        ) != alchemy.Plans.fingerprint(bounded, sources, features, dialect)
+        literals = alchemy.Plans.literals(query().where(student_table.level > 2))
+        assert set(literals) == {(1, dsl.Integer()), (2, dsl.Integer())}
+        assert sorted(literals.values()) == ['literal_0', 'literal_1']
+        assert alchemy.Plans.literals(bounded) == {(1, dsl.Integer()): 'literal_0'}
+        assert alchemy.Plans.fingerprint(
+            student_table.select(student_table.surname).where(student_table.score > 2), sources, features, dialect
+        ) == alchemy.Plans.fingerprint(
+            student_table.select(student_table.surname).where(student_table.score > 3), sources, features, dialect
+        )
+        with unittest.mock.patch.object(alchemy.Plans, 'RUNTIME', 'forml-0:sqlalchemy-0'):
+            assert key != alchemy.Plans.fingerprint(query(), sources, features, dialect)
+
+    def test_read(
+        self,
+        tmp_path,
+        connection: engine.Connectable,
+        sources: typing.Mapping[dsl.Source, sql.Selectable],
+        features: typing.Mapping[dsl.Feature, sql.ColumnElement],
+        source_query: dsl.Query,
+    ):
+        """Test reading using the cached plans."""
+
+        class Reader(alchemy.Reader):
+            """Reader with plan caching."""
+
+            PLANS = alchemy.Plans(tmp_path)
+
+        expected = alchemy.Reader(sources, features, connection)(source_query).to_rows()
+        assert numpy.array_equal(Reader(sources, features, connection)(source_query).to_rows(), expected)
+        assert len(list(tmp_path.glob(f'*{alchemy.Plans.SUFFIX}'))) == 1
+        Reader.PLANS = alchemy.Plans(tmp_path)  # fresh instance to be loading the plan from disk
+        assert numpy.array_equal(Reader(sources, features, connection)(source_query).to_rows(), expected)
+
+    def test_bind(
+        self,
+        tmp_path,
+        connection: engine.Connectable,
+        student_table: dsl.Table,
+        sources: typing.Mapping[dsl.Source, sql.Selectable],
+        features: typing.Mapping[dsl.Feature, sql.ColumnElement],
+    ):
+        """Test the plans get reused for different literal values keeping the result types."""
+
+        class Reader(alchemy.Reader):
+            """Reader with plan caching."""
+
+            PLANS = alchemy.Plans(tmp_path)
+
+        for bound in datetime.datetime(2019, 4, 1), datetime.datetime(2019, 4, 2):
+            query = student_table.select(
+                student_table.surname, function.Cast(student_table.score, dsl.Boolean()).alias('passed')
+            ).where(student_table.updated >= bound)
+            expected = alchemy.Reader(sources, features, connection)(query).to_columns().frame
+            assert pandas.api.types.is_bool_dtype(expected.iloc[:, 1])  # processed by the result type
+            for reader in Reader(sources, features, connection), Reader(sources, features, connection):
+                result = reader(query).to_columns().frame
+                assert result.dtypes.tolist() == expected.dtypes.tolist()
+                assert result.values.tolist() == expected.values.tolist()
+        assert len(list(tmp_path.glob(f'*{alchemy.Plans.SUFFIX}'))) == 1
+        (path,) = tmp_path.glob(f'*{alchemy.Plans.SUFFIX}')
+        path.write_bytes(b'invalid')
+        Reader.PLANS = alchemy.Plans(tmp_path)
+        assert Reader(sources, features, connection)(query).to_columns().frame.equals(expected)
+
+    def test_bounds(self, tmp_path, student_table: dsl.Table, dialect: engine.Dialect):
+        """Test the lazy cache directory creation and the plans pruning."""
+        path = tmp_path / 'plans'
+        plans = alchemy.Plans(path, capacity=2, ttl=60)
+        assert not path.exists()
+        statement = student_table.select(student_table.surname)
+        for key in 'abc':
+            plans.get_or_parse(statement, key, lambda _: sql.select(sql.literal_column('surname')), dialect)
+        assert len(list(path.glob(f'*{alchemy.Plans.SUFFIX}'))) == 2
+        assert len(plans._plans) == 2  # pylint: disable=protected-access
+        assert not (path / f'a{alchemy.Plans.SUFFIX}').exists()
+        os.utime(path / f'b{alchemy.Plans.SUFFIX}', (0, 0))
+        alchemy.Plans(path, ttl=60).get_or_parse(
+            statement, 'd', lambda _: sql.select(sql.literal_column('surname')), dialect
+        )
+        assert sorted(p.stem for p in path.glob(f'*{alchemy.Plans.SUFFIX}')) == ['c', 'd']
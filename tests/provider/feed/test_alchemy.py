@@ -18,6 +18,8 @@
 Alchemy feed unit tests.
 """
 
+import pathlib
+
 import pandas
 import pytest
 import sqlalchemy
@@ -59,3 +61,18 @@ class TestFeed(Feed):
             person_table: 'person',
         }
         return alchemy.Feed(sources=sources, connection=dburl)
+
+
+class TestResults:
+    """Results cache unit tests."""
+
+    def test_bypass(self, tmp_path: pathlib.Path):
+        """Test the cache bypassing."""
+        results = alchemy.Results(tmp_path)
+        statement = sqlalchemy.select(sqlalchemy.literal(1))
+        assert results.get_or_exec(statement, lambda _: pandas.DataFrame({'a': [1]}))['a'].tolist() == [1]
+        assert results.exists(statement)
+        with results.bypass():
+            assert not results.exists(statement)
+            assert results.get_or_exec(statement, lambda _: pandas.DataFrame({'a': [2]}))['a'].tolist() == [2]
+        assert results.get_or_exec(statement, lambda _: pandas.DataFrame({'a': [3]}))['a'].tolist() == [1]
@@ -111,7 +111,7 @@ class Registry(metaclass=abc.ABCMeta):
     ):
         """Registry load unit test."""
         for sid, value in generation_states.items():
-            assert populated.read(project_name, project_release, valid_generation, sid) == value
+            assert bytes(populated.read(project_name, project_release, valid_generation, sid)) == value
 
     def test_open(
         self,
@@ -18,11 +18,20 @@
 """
 ForML posix registry unit tests.
 """
+import io
+import pathlib
+import pickle
 import typing
+import unittest.mock
+import uuid
 
+import numpy
 import pytest
 
+from forml import project as prj
 from forml.io import asset
+from forml.io.asset import _directory
+from forml.io.asset._directory.level import minor
 from forml.provider.registry.filesystem import posix
 
 from .. import Registry
@@ -35,3 +44,142 @@ class TestRegistry(Registry):
     @pytest.fixture(scope='session')
     def constructor(tmp_path_factory: pytest.TempPathFactory) -> typing.Callable[[], asset.Registry]:
         return lambda: posix.Registry(tmp_path_factory.mktemp('posix-registry'))
+
+
+class TestMappedRegistry(TestRegistry):
+    """Memory-mapped registry unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def constructor(tmp_path_factory: pytest.TempPathFactory) -> typing.Callable[[], asset.Registry]:
+        return lambda: posix.Registry(tmp_path_factory.mktemp('posix-registry'), memmap=True)
+
+    def test_mapped(
+        self,
+        populated: asset.Registry,
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        valid_generation: asset.Generation.Key,
+        generation_states: typing.Mapping[uuid.UUID, bytes],
+    ):
+        """Test the states are memory-mapped, serializable and sized by their length."""
+        cache = _directory.Cache(posix.Registry.read, size=None)
+        for sid, value in generation_states.items():
+            state = populated.read(project_name, project_release, valid_generation, sid)
+            assert isinstance(state, posix.Mapped)
+            assert pickle.loads(pickle.dumps(state))[:] == value
+            cache(populated, project_name, project_release, valid_generation, sid)
+        assert cache.info.nbytes == sum(len(v) for v in generation_states.values())
+
+    def test_readonly(self, tmp_path: pathlib.Path):
+        """Test the arrays deserialized from the mapped states are read-only."""
+        path = tmp_path / 'state'
+        path.write_bytes(asset.serialize(numpy.zeros(1024)))
+        array = asset.deserialize(posix.Mapped(path))
+        with pytest.raises(ValueError, match='read-only'):
+            array[0] = 1
+
+    def test_limit(
+        self,
+        populated: asset.Registry,
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        valid_generation: asset.Generation.Key,
+        generation_states: typing.Mapping[uuid.UUID, bytes],
+    ):
+        """Test the states are read into memory once the mapping limit is reached."""
+        sid, value = next(iter(generation_states.items()))
+        mapped = populated.read(project_name, project_release, valid_generation, sid)
+        with unittest.mock.patch.object(posix.Mapped, 'TRACKFD', True), unittest.mock.patch.object(
+            posix.Mapped, 'LIMIT', 0
+        ):
+            assert not posix.Mapped.available()
+            state = populated.read(project_name, project_release, valid_generation, sid)
+        assert isinstance(mapped, posix.Mapped) and not isinstance(state, posix.Mapped)
+        assert state == value
+
+
+class TestCompressedRegistry(TestRegistry):
+    """Compressed registry unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def constructor(tmp_path_factory: pytest.TempPathFactory) -> typing.Callable[[], asset.Registry]:
+        return lambda: posix.Registry(tmp_path_factory.mktemp('posix-registry'), compression='zlib')
+
+    def test_dump(
+        self,
+        empty: asset.Registry,
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        valid_generation: asset.Generation.Key,
+    ):
+        """Test the states get compressed (including the streamed ones)."""
+        sid, streamed = uuid.uuid4(), uuid.uuid4()
+        state = b'foobar' * 1000
+        empty.dump(project_name, project_release, sid, state)
+        with io.BytesIO(state) as stream:
+            empty.dump(project_name, project_release, streamed, stream)
+        empty.close(project_name, project_release, valid_generation, asset.Tag(states=[sid, streamed]))
+        assert len(empty.read(project_name, project_release, valid_generation, sid)) < len(state)
+        assert empty.load(project_name, project_release, valid_generation, sid) == state
+        assert empty.load(project_name, project_release, valid_generation, streamed) == state
+
+
+class TestDedupRegistry(TestRegistry):
+    """Content-addressed registry unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def constructor(tmp_path_factory: pytest.TempPathFactory) -> typing.Callable[[], asset.Registry]:
+        return lambda: posix.Registry(tmp_path_factory.mktemp('posix-registry'), dedup=True)
+
+    def test_dedup(
+        self,
+        empty: asset.Registry,
+        project_package: prj.Package,
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        generation_tag: asset.Tag,
+    ):
+        """Test identical states are stored just once."""
+        empty.push(project_package)
+        state = b'foobar'
+        sid = empty.identify(state)
+        assert sid == empty.identify(state) != empty.identify(b'baz')
+        generations = asset.Generation.Key(1), asset.Generation.Key(2)
+        for generation in generations:
+            empty.dump(project_name, project_release, empty.identify(state), state)
+            empty.close(project_name, project_release, generation, generation_tag.replace(states=[sid, sid]))
+        path = posix.Path(empty._path)  # pylint: disable=protected-access
+        first, second = (path.state(sid, project_name, project_release, g) for g in generations)
+        assert (
+            first.stat().st_ino == second.stat().st_ino == path.blob(sid, project_name, project_release).stat().st_ino
+        )
+        release = asset.Directory(empty).get(project_name).get(project_release)
+        minor.STATES.clear()
+        assert release.get(generations[0]).get(sid) == release.get(generations[1]).get(0) == state
+        assert minor.STATES.info.misses == 1 and minor.STATES.info.hits == 1  # shared across generations
+        assert release.dump(iter([b'foo', b'bar'])) == sid  # streamed states get buffered for the addressing
+
+
+class TestIndex:
+    """Listing index unit tests."""
+
+    def test_listing(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+        """Test the listing gets revalidated incrementally."""
+        monkeypatch.setattr(posix.Index, 'SETTLE', 0)
+        valid = unittest.mock.MagicMock(side_effect=lambda p: p.name != '.stage')
+        monkeypatch.setattr(posix.Path.Generation, 'valid', valid)
+        for name in '1', '2', '.stage':
+            (tmp_path / name).mkdir()
+        index = posix.Index()
+        assert sorted(index(tmp_path, posix.Path.Generation)) == [1, 2]
+        assert valid.call_count == 3
+        assert sorted(index(tmp_path, posix.Path.Generation)) == [1, 2]
+        assert valid.call_count == 4  # just the pending .stage
+        (tmp_path / '3').mkdir()
+        (tmp_path / '1').rmdir()
+        assert sorted(index(tmp_path, posix.Path.Generation)) == [2, 3]
+        assert valid.call_count == 6  # the pending .stage plus the new 3
+        assert not pickle.loads(pickle.dumps(index))._entries  # pylint: disable=protected-access
@@ -25,9 +25,12 @@ import string
 import subprocess
 import time
 import typing
+import unittest.mock
+import uuid
 
 import pytest
 import requests
+from mlflow import tracking
 from requests import exceptions
 
 from forml.io import asset
@@ -88,3 +91,29 @@ class TestRegistry(Registry):
             yield lambda: mlflow.Registry(uri, repoid=f'test{random.randrange(100000)}')
 
             os.killpg(os.getpgid(server.pid), signal.SIGTERM)
+
+    def test_prefetch(
+        self,
+        populated: asset.Registry,
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        valid_generation: asset.Generation.Key,
+        generation_states: typing.Mapping[uuid.UUID, bytes],
+    ):
+        """Test the generation artifacts are downloaded in bulk and reused."""
+        list(populated.generations(project_name, project_release))
+        with unittest.mock.patch.object(
+            mlflow.Client, 'download_artifact', autospec=True, side_effect=mlflow.Client.download_artifact
+        ) as download:
+            for _ in range(2):
+                populated.open(project_name, project_release, valid_generation)
+                for sid, value in generation_states.items():
+                    assert populated.read(project_name, project_release, valid_generation, sid) == value
+        assert download.call_count == 2  # the tag plus the bulk prefetch
+
+    def test_ttl(self, populated: asset.Registry, project_name: asset.Project.Key):
+        """Test the listing caching."""
+        assert list(populated.projects()) == [project_name]
+        with unittest.mock.patch.object(tracking.MlflowClient, 'search_experiments') as search:
+            assert list(populated.projects()) == [project_name]
+        search.assert_not_called()
@@ -0,0 +1,108 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML S3 registry unit tests.
+"""
+import pathlib
+import pickle
+import typing
+import unittest.mock
+import uuid
+
+import boto3
+import moto
+import pytest
+
+from forml.io import asset
+from forml.provider.registry import s3
+
+from . import Registry
+
+
+class TestRegistry(Registry):
+    """Registry unit tests."""
+
+    REGION = 'us-east-1'
+
+    @classmethod
+    @pytest.fixture(scope='session')
+    def constructor(
+        cls, tmp_path_factory: pytest.TempPathFactory
+    ) -> typing.Iterable[typing.Callable[[], asset.Registry]]:
+        def create() -> asset.Registry:
+            bucket = f'forml-{uuid.uuid4().hex}'
+            boto3.client('s3', region_name=cls.REGION).create_bucket(Bucket=bucket)
+            return s3.Registry(
+                bucket,
+                prefix='registry',
+                cache=tmp_path_factory.mktemp('s3-cache'),
+                chunk_size=5 << 20,
+                region_name=cls.REGION,
+            )
+
+        with moto.mock_aws():
+            yield create
+
+    def test_cache(
+        self,
+        populated: s3.Registry,
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        valid_generation: asset.Generation.Key,
+    ):
+        """Test the read-through caching."""
+        sid = uuid.uuid4()
+        state = b'x' * (11 << 20)  # multipart
+        populated.write(project_name, project_release, sid, state)
+        assert populated.read(project_name, project_release, valid_generation, sid) == state
+        populated._client.delete_object(  # pylint: disable=protected-access
+            Bucket=populated._bucket,  # pylint: disable=protected-access
+            Key=populated._key(project_name, project_release, s3.Registry.STATEDIR, f'{sid}.bin'),
+        )
+        assert populated.read(project_name, project_release, valid_generation, sid) == state
+        cached = populated._cache._path / 'default' / populated._bucket  # pylint: disable=protected-access
+        assert any(p.name == f'{sid}.bin' for p in cached.rglob('*'))
+        with unittest.mock.patch.object(pathlib.Path, 'read_bytes', side_effect=[FileNotFoundError, state]) as read:
+            assert populated.read(project_name, project_release, valid_generation, sid) == state  # evicted meanwhile
+        assert read.call_count == 2
+
+    def test_identity(self, tmp_path: pathlib.Path):
+        """Test the registry identity reflects the endpoint."""
+        first = s3.Registry('bucket', cache=tmp_path, endpoint_url='http://first:9000')
+        assert first == s3.Registry('bucket', cache=tmp_path, endpoint_url='http://first:9000')
+        assert hash(first) == hash(s3.Registry('bucket', cache=tmp_path, endpoint_url='http://first:9000'))
+        assert first != s3.Registry('bucket', cache=tmp_path, endpoint_url='http://second:9000')
+        assert first != s3.Registry('bucket', cache=tmp_path)
+
+
+class TestCache:
+    """Cache unit tests."""
+
+    def test_evict(self, tmp_path: pathlib.Path):
+        """Test the size-bounded eviction."""
+        cache = s3.Cache(tmp_path, 25)
+        for key in 'a', 'b', 'c':
+            cache.get(key, lambda p: p.write_bytes(b'.' * 10))
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['b', 'c']
+        assert cache.get('c', lambda p: pytest.fail('Not cached')).read_bytes() == b'.' * 10
+        cache = pickle.loads(pickle.dumps(cache))
+        (tmp_path / 'b').unlink()  # evicted by another process
+        assert cache.get('b', lambda p: p.write_bytes(b'.' * 5)).read_bytes() == b'.' * 5
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['b', 'c']
+        cache.get('d', lambda p: p.write_bytes(b'.' * 15))
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['b', 'd']
@@ -0,0 +1,88 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Runtime agent unit tests.
+"""
+import typing
+
+import pandas
+import pytest
+
+from forml import project, runtime
+from forml.io import dsl
+from forml.pipeline import payload, wrap
+from forml.provider.feed import lazy, monolite
+
+
+class Growing(dsl.Schema):
+    """Schema of a dataset growing between the training runs."""
+
+    Ordinal = dsl.Field(dsl.Integer())
+    Label = dsl.Field(dsl.Integer())
+    Feature = dsl.Field(dsl.Integer())
+
+
+class Rows(monolite.Inline):
+    """Inline origin partitioned by rows so that any appended data gets picked up."""
+
+    def partitions(self, columns: typing.Collection[dsl.Column], predicate: typing.Optional[dsl.Predicate]) -> range:
+        return range(len(self._content))
+
+    def load(self, partition: typing.Optional[int]) -> pandas.DataFrame:
+        return self._content.iloc[[partition]]
+
+
+@wrap.Actor.train
+def accumulate(state: typing.Optional[list[int]], features: pandas.DataFrame, _: pandas.Series) -> list[int]:
+    """Actor train function remembering all the ordinals it has been trained on so far."""
+    return (state or []) + features['Ordinal'].tolist()
+
+
+@wrap.Operator.mapper
+@accumulate.apply
+def accumulate(state: list[int], _: pandas.DataFrame) -> list[int]:
+    """Actor apply function returning the ordinals it has been trained on."""
+    return state
+
+
+class TestRunner:
+    """Runner unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def launcher() -> runtime.Virtual:
+        """Virtual launcher fixture with an incremental source."""
+        source = project.Source.query(
+            Growing.select(Growing.Ordinal, Growing.Feature), Growing.Label, ordinal=Growing.Ordinal, incremental=True
+        ) >> payload.ToPandas(columns=['Ordinal', 'Feature'])
+        return source.bind(accumulate()).launcher
+
+    def test_train_incremental(self, launcher: runtime.Virtual):
+        """Test the incremental training resumes from the previous watermark."""
+        rows = [[i, i % 2, i * 10] for i in range(7)]
+
+        def train(size: int) -> list[int]:
+            """Train on the first ``size`` rows returning all the ordinals trained on so far."""
+            return launcher('dask', [lazy.Feed(Rows(Growing, rows[:size]))]).train().features
+
+        # the (exactly-once) watermark row is deferred to the next run
+        assert train(4) == [0, 1, 2]
+        assert train(6) == [0, 1, 2, 3, 4]
+        with pytest.raises(payload.Sniff.Lost):  # no data beyond the watermark - training skipped
+            train(6)
+        assert train(7) == [0, 1, 2, 3, 4, 5]
@@ -0,0 +1,142 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Tuning utilities unit tests.
+"""
+import typing
+
+import numpy
+import pandas
+import pytest
+from sklearn import metrics
+
+import forml
+from forml import evaluation, flow, project
+from forml.pipeline import payload, wrap
+from forml.provider.feed import monolite
+from forml.runtime import _tuning
+
+with wrap.importer():
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.preprocessing import StandardScaler
+
+
+@pytest.fixture(scope='module')
+def pipeline() -> flow.Composable:
+    """Pipeline fixture."""
+    return StandardScaler() >> LogisticRegression(max_iter=50)
+
+
+@pytest.fixture(scope='module')
+def evaluator() -> project.Evaluation:
+    """Evaluation component fixture."""
+    return project.Evaluation(evaluation.Function(metrics.log_loss), evaluation.HoldOut(test_size=0.3, random_state=1))
+
+
+@pytest.fixture(scope='module')
+def tuning() -> project.Tuning:
+    """Tuning component fixture."""
+    return project.Tuning(
+        {LogisticRegression: {'C': [0.001, 1, 10]}, 'StandardScaler': {'with_mean': [True, False]}},
+        rungs=2,
+        eta=2,
+        seed=0,
+    )
+
+
+@pytest.fixture(scope='module')
+def symbols(
+    demo_source: project.Source, demo_feed: monolite.Feed, pipeline: flow.Composable, evaluator: project.Evaluation
+) -> typing.Collection[flow.Symbol]:
+    """Compiled train-test evaluation symbols fixture."""
+    composition = (
+        flow.Composition.builder(demo_feed.load(demo_source.extract), demo_source.transform)
+        .via(pipeline >> evaluation.TrainTestScore(evaluator.metric, evaluator.method))
+        .build()
+    )
+    return flow.compile(composition.train)
+
+
+def test_match(symbols: typing.Collection[flow.Symbol]):
+    """Test the tuning space key matching."""
+    builders = {
+        s.instruction.builder.actor: s.instruction.builder for s in symbols if isinstance(s.instruction, flow.Functor)
+    }
+    (builder,) = [b for b in builders.values() if _tuning.match(b, LogisticRegression)]
+    assert _tuning.match(builder, 'LogisticRegression')
+    assert not _tuning.match(builder, 'StandardScaler')
+    assert not _tuning.match(builder, StandardScaler)
+
+
+def test_expand(symbols: typing.Collection[flow.Symbol], tuning: project.Tuning):
+    """Test the symbol expansion sharing the untuned part."""
+    variants = tuning.variants
+    value, client, _ = payload.Sniff.Value.open()
+    try:
+        expanded = _tuning.expand(symbols, variants, client)
+    finally:
+        value.close()
+    instructions = {s.instruction for s in expanded}
+    assert len(instructions) == len(expanded)
+    original = {s.instruction for s in symbols}
+    shared = original & instructions
+    assert shared and shared != original
+    collectors = [s for s in expanded if isinstance(s.instruction, _tuning.Collector)]
+    assert len(collectors) == 1 and len(collectors[0].arguments) == len(variants)
+    params = [s.instruction() for s in expanded if isinstance(s.instruction, _tuning.Params)]
+    assert params and all(params) and len(params) % len(variants) == 0
+
+
+def test_sampler():
+    """Test the sampler actor."""
+    features = pandas.DataFrame({'a': range(10)})
+    labels = pandas.Series(range(10))
+    sampled, sublabels = _tuning.Sampler(0.3, seed=1).apply(features, labels)
+    assert len(sampled) == len(sublabels) == 3
+    assert list(sampled['a']) == list(sublabels)
+    sampled, sublabels = _tuning.Sampler(0.5).apply([1, 2, 3, 4], [1, 2, 3, 4])
+    assert len(sampled) == 2 and sampled == sublabels
+
+
+def test_rank():
+    """Test the trials ranking."""
+    trials = [_tuning.Trial({'a': 1}, 3.0), _tuning.Trial({'a': 2}, float('nan')), _tuning.Trial({'a': 3}, 1.0)]
+    assert [t.score for t in _tuning.rank(trials, maximize=False)][:2] == [1.0, 3.0]
+    assert [t.score for t in _tuning.rank(trials, maximize=True)][:2] == [3.0, 1.0]
+    assert numpy.isnan(_tuning.rank(trials, maximize=True)[-1].score)
+    assert _tuning.halve(trials, 2, maximize=False) == [trials[2]]
+    assert _tuning.halve(trials[:1], 3, maximize=False) == trials[:1]
+
+
+def test_tune(
+    demo_source: project.Source,
+    demo_feed: monolite.Feed,
+    pipeline: flow.Composable,
+    evaluator: project.Evaluation,
+    tuning: project.Tuning,
+):
+    """Test the end-to-end tuning."""
+    launcher = demo_source.bind(pipeline, evaluation=evaluator, tuning=tuning).launcher(
+        runner='dask', feeds=[demo_feed]
+    )
+    trials: typing.Sequence[_tuning.Trial] = launcher.tune()
+    assert len(trials) == len(tuning.variants) // tuning.eta
+    assert trials[0].score <= trials[-1].score
+    assert trials[0].params[LogisticRegression]['C'] == 10
+    with pytest.raises(forml.MissingError, match='not tunable'):
+        demo_source.bind(pipeline, evaluation=evaluator).launcher(runner='dask', feeds=[demo_feed]).tune()
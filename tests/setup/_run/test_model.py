@@ -0,0 +1,38 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML cli model group unit tests.
+"""
+import unittest.mock
+
+from click import testing
+
+from forml.setup._run import model
+
+
+def test_tune(cli_runner: testing.CliRunner):
+    """Model tune test."""
+    trials = [({'LogisticRegression': {'C': 1.0}}, 0.9), ({'LogisticRegression': {'C': 0.1}}, 0.8)]
+    with unittest.mock.patch.object(model.Scope, 'launcher') as launcher:
+        launcher.return_value.tune.return_value = trials
+        result = cli_runner.invoke(model.group, ['tune', 'foo'])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        "#1: score=0.9 LogisticRegression{'C': 1.0}",
+        "#2: score=0.8 LogisticRegression{'C': 0.1}",
+    ]